@@ -80,6 +80,11 @@ def main():
         action="store_true",
         help="Force archiving of transcripts even if they've been downloaded before"
     )
+    parser.add_argument(
+        "--pretty-archive",
+        action="store_true",
+        help="Write indented archive files for easier reading"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -135,6 +140,11 @@ def main():
         "--keywords-config",
         help="Path to custom keywords configuration file"
     )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit large extraction runs through the LLM provider's Batch API (slower, cheaper)"
+    )
     
     args = parser.parse_args()
     
@@ -183,7 +193,7 @@ def main():
             config.llm_model,
             keywords_config_path=args.keywords_config
         )
-        item_extractor = ItemExtractor(config.llm_provider, config.llm_model)
+        item_extractor = ItemExtractor(config.llm_provider, config.llm_model, use_batch_api=args.batch_api)
         data_transformer = DataTransformer(notion_client=notion_client, keywords_config_path=args.keywords_config)
         
         # Get or process transcripts
@@ -215,22 +225,14 @@ def main():
         if args.force_archive:
             transcript_processor.force_archive = True
 
+        if args.pretty_archive:
+            transcript_processor.pretty_archive = True
+
         # Skip already processed transcripts if requested
         if args.skip_processed:
             # Load the transcript index
-            from pathlib import Path
-            import json
-
-            index_file = Path(args.archive_dir) / "transcript_index.json"
-            transcript_index = {}
-
-            if index_file.exists():
-                try:
-                    with open(index_file, 'r') as f:
-                        transcript_index = json.load(f)
-                    logger.info(f"Loaded transcript index with {len(transcript_index)} entries")
-                except json.JSONDecodeError:
-                    logger.error(f"Could not parse transcript index")
+            transcript_index = transcript_processor.load_transcript_index()
+            logger.info(f"Loaded transcript index with {len(transcript_index)} entries")
 
             # Filter out already processed transcripts
             original_count = len(transcripts)
@@ -4,9 +4,61 @@ Notion API client for Limitless Lifelog.
 
 import os
 import time
-from typing import Dict, List, Any, Optional
+import sqlite3
+import hashlib
+import importlib.util
+import threading
+from pathlib import Path
+from collections import ChainMap, Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+import orjson
 from loguru import logger
 
+# Notion allows an average of three requests per second per integration
+_RATE_LIMIT_REQUESTS = 3
+_RATE_LIMIT_PERIOD = 1.0
+_MAX_RATE_LIMIT_RETRIES = 3
+
+# Property that receives transcript details, per database type
+_DESCRIPTION_FIELD_BY_DBTYPE = {
+    "todo": "Notes",
+    "lifelog": "Notes"
+}
+
+# Multi-select properties that hold tags
+_TAG_PROPERTIES = ("Tags", "Keywords", "Categories")
+
+# Transcript detail fields rendered in their own sections rather than as metadata
+_HANDLED_KEYS = frozenset((
+    "content", "context", "priority_indicators", "status_indicators",
+    "date_indicators", "created_at", "extraction_date", "extraction_method",
+    "keywords", "importance_level", "action_keywords"
+))
+
+# Number of entries sent to Notion concurrently
+_MAX_WORKERS = 3
+
+# Connection pool settings for the HTTP client shared by all requests
+_HTTP_MAX_CONNECTIONS = 20
+_HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+_HTTP_TIMEOUT = 30.0
+
+def _today() -> str:
+    """Return today's date in the ISO format Notion expects."""
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def _http2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to at most limit characters, marking the cut with an ellipsis."""
+    return text[:limit] + "..." if len(text) > limit else text
+
 class NotionClient:
     """
     Client for interacting with Notion API.
@@ -14,32 +66,83 @@ class NotionClient:
     Handles database operations for tasks, projects, todos, and lifelog entries.
     """
     
-    def __init__(self, api_key: str, database_ids: Dict[str, str]):
+    def __init__(self, api_key: str, database_ids: Dict[str, str], idempotency_db: Optional[str] = None):
         """
         Initialize Notion client.
         
         Args:
             api_key: Notion API key
             database_ids: Dictionary mapping database types to IDs
+            idempotency_db: Path to the SQLite cache of created pages
+                (defaults to the user config directory)
         """
         self.api_key = api_key
         self.database_ids = database_ids
+
+        # Timestamps of the most recent requests, shared by all outgoing calls
+        self._request_times = deque(maxlen=_RATE_LIMIT_REQUESTS)
+        self._rate_lock = threading.Lock()
+
+        # Guards result counters updated from the update_databases workers
+        self._results_lock = threading.Lock()
+
+        # Database schemas and their option indexes, fetched once per database
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._schema_indexes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._tag_index: Dict[str, List[str]] = {}
+
+        # Record of pages already created, so retried runs don't create duplicates
+        self._idem_lock = threading.Lock()
+        self._idem_db = self._open_idempotency_db(idempotency_db)
         
         # Import Notion client library lazily to avoid startup issues
         # if the environment doesn't have the package installed
+        self._http = None
         try:
+            import httpx
             from notion_client import Client
-            self.notion = Client(auth=api_key)
+
+            # Keep a persistent connection pool so each request reuses the
+            # TCP/TLS connection instead of performing a new handshake. With
+            # HTTP/2 the concurrent workers share one multiplexed connection.
+            self._http = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=_HTTP_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                http2=_http2_available()
+            )
+            self.notion = Client(
+                auth=api_key,
+                client=self._http,
+                timeout_ms=int(_HTTP_TIMEOUT * 1000)
+            )
         except (ImportError, Exception) as e:
             logger.error(f"Error initializing Notion client: {e}")
             self.notion = None
+
+    def close(self):
+        """Close the underlying HTTP connection pool and page cache."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        if self._idem_db is not None:
+            self._idem_db.close()
+            self._idem_db = None
+
+    def __del__(self):
+        # Guard against partially initialized instances
+        if getattr(self, "_http", None) is not None or getattr(self, "_idem_db", None) is not None:
+            self.close()
     
-    def update_databases(self, notion_data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, int]:
+    def update_databases(self, notion_data: Dict[str, List[Dict[str, Any]]], strict: bool = False) -> Dict[str, int]:
         """
         Update Notion databases with formatted data.
         
         Args:
             notion_data: Dictionary with database types and entries
+            strict: Skip entries that have no title content instead of
+                creating them with a placeholder title
             
         Returns:
             Dictionary with counts of created/updated items
@@ -48,13 +151,12 @@ class NotionClient:
             logger.error("Notion API client not properly initialized")
             return {"error": "Notion client not initialized"}
         
-        results = {
-            "created": 0,
-            "updated": 0,
-            "failed": 0
-        }
-        
-        # Process each database type
+        results = Counter(created=0, updated=0, failed=0, skipped=0)
+        synthetic_titles = Counter()
+
+        # Collect the work for every database type up front so a single
+        # worker pool stays busy across database boundaries
+        jobs = []
         for db_type, entries in notion_data.items():
             if not entries:
                 continue
@@ -65,198 +167,362 @@ class NotionClient:
                 continue
 
             logger.info(f"Processing {len(entries)} entries for {db_type} database")
+            description_field = _DESCRIPTION_FIELD_BY_DBTYPE.get(db_type, "Description")
 
             # First, fetch database schema to determine property mapping
             try:
-                db_schema = self.notion.databases.retrieve(database_id=db_id)
-                db_properties = db_schema.get("properties", {})
+                db_properties = self._get_schema(db_id)
+                schema_index = self._schema_indexes[db_id]
                 logger.debug(f"Database {db_type} has properties: {list(db_properties.keys())}")
             except Exception as e:
                 logger.error(f"Error retrieving database schema for {db_type}: {e}")
                 continue
 
-            for entry in entries:
+            jobs.extend((db_type, db_id, schema_index, description_field, entry) for entry in entries)
+
+        def process(job):
+            status, synthetic_title = self._create_entry(*job, strict=strict)
+            # The counters are shared by the workers, so update them atomically
+            with self._results_lock:
+                results[status] += 1
+                if synthetic_title:
+                    synthetic_titles[job[0]] += 1
+
+        # Requests still pass through the shared rate limiter; the pool only
+        # overlaps the network round trips of consecutive entries
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            list(executor.map(process, jobs))
+
+        for db_type, count in synthetic_titles.items():
+            action = "Skipped" if strict else "Used placeholder titles for"
+            logger.warning(f"{action} {count} {db_type} entries without title content")
+        
+        return dict(results)
+
+    def _create_entry(
+        self,
+        db_type: str,
+        db_id: str,
+        schema_index: Dict[str, Dict[str, Any]],
+        description_field: str,
+        entry: Dict[str, Any],
+        strict: bool = False
+    ) -> Tuple[str, bool]:
+        """
+        Create a single entry as a page in a Notion database.
+
+        Args:
+            db_type: Database type
+            db_id: ID of the Notion database
+            schema_index: Database schema index from _build_schema_index
+            description_field: Property that receives the transcript details
+            entry: Entry with properties and transcript details
+            strict: Skip the entry if it has no title content
+
+        Returns:
+            Tuple of the outcome ("created", "failed" or "skipped") and
+            whether a placeholder title had to be used
+        """
+        try:
+            # Enrich properties with transcript summary and context; writes go to
+            # the overlay so the entry's own properties are left untouched
+            properties = ChainMap({}, entry.get("properties", {}))
+
+            # Render transcript details once for both the page body and the comment
+            details = entry.get("transcript_details") or {}
+            rendered_details = ""
+            if details or "transcript_id" in entry:
+                rendered_details = self._render_details(details, entry.get("transcript_id", ""))
+
+            # Add transcript content to the description/notes field if available
+            if details:
+                # If there's an existing description, enhance it
+                if (description := properties.get(description_field)) is not None:
+                    existing_text = ""
+                    if (rich_text := description.get("rich_text")) and "content" in (text := rich_text[0]["text"]):
+                        existing_text = text["content"]
+
+                    # Prepare to add transcript content and metadata - make it more prominent
+                    transcript_section = f"\n\n# Transcript Details\n\n{rendered_details}"
+
+                    # Ensure the transcript details are prominently displayed by putting them at the beginning
+                    # if the existing text is very short
+                    if len(existing_text) < 100:
+                        enhanced_text = transcript_section + "\n\n" + existing_text
+                    else:
+                        enhanced_text = existing_text + transcript_section
+
+                    properties[description_field] = {"rich_text": [{"text": {"content": enhanced_text}}]}
+
+            # Sanitize dates and map properties to match the database schema
+            mapped_properties, quality_flags = self._prepare_properties(
+                properties,
+                schema_index,
+                db_type
+            )
+
+            # Entries without any title content would only produce placeholder pages
+            synthetic_title = quality_flags["synthetic_title"]
+            if synthetic_title and strict:
+                return "skipped", synthetic_title
+
+            # Skip entries that were already created by a previous run; entries without
+            # a source transcript (such as the run summary) are always created
+            entry_key = None
+            if transcript_id := entry.get("transcript_id"):
+                entry_key = self._idempotency_key(db_id, transcript_id, mapped_properties)
+                existing_page_id = self._get_created_page(entry_key)
+                if existing_page_id:
+                    logger.debug(f"Entry already exists as page {existing_page_id}, skipping")
+                    return "skipped", synthetic_title
+
+            # Create new page in database
+            response = self._create_page(db_id, mapped_properties)
+            if not response:
+                return "failed", synthetic_title
+
+            if entry_key:
+                self._record_created_page(entry_key, response["id"])
+
+            # Add detailed comment with transcript context
+            if "transcript_id" in entry:
+                # Enhanced reference comment with rich details
+                comment_text = f"# Transcript Information\n\n{rendered_details}"
+
                 try:
-                    # Enrich properties with transcript summary and context
-                    properties = entry.get("properties", {}).copy()
-
-                    # Add transcript content to the description/notes field if available
-                    if "transcript_details" in entry and entry["transcript_details"]:
-                        details = entry["transcript_details"]
-
-                        # Select the appropriate description field based on database type
-                        description_field = "Description"
-                        if db_type == "todo":
-                            description_field = "Notes"
-                        elif db_type == "lifelog":
-                            description_field = "Notes"
-
-                        # If there's an existing description, enhance it
-                        if description_field in properties:
-                            existing_text = ""
-                            if "rich_text" in properties[description_field]:
-                                if properties[description_field]["rich_text"] and "content" in properties[description_field]["rich_text"][0]["text"]:
-                                    existing_text = properties[description_field]["rich_text"][0]["text"]["content"]
-
-                            # Prepare to add transcript content and metadata - make it more prominent
-                            transcript_section = "\n\n# Transcript Details"
-
-                            # Always add transcript ID as a reference
-                            transcript_id = entry.get("transcript_id", "")
-                            if transcript_id:
-                                transcript_section += f"\n\n## Source\nTranscript ID: {transcript_id}"
-
-                            # Add creation date if available
-                            if "created_at" in details and details["created_at"]:
-                                transcript_section += f"\n\n**Recording Date**: {details['created_at']}"
-
-                            # Add transcript content - making it more prominent with longer excerpt
-                            if "content" in details and details["content"]:
-                                excerpt = details["content"][:1000] + "..." if len(details["content"]) > 1000 else details["content"]
-                                transcript_section += f"\n\n## Full Transcript\n{excerpt}"
-
-                            # Add context if available - moved higher up for importance
-                            if "context" in details and details["context"]:
-                                transcript_section += f"\n\n## Context\n{details['context']}"
-
-                            # Add extracted content for key information
-                            key_info_parts = []
-
-                            # Add keywords with better formatting
-                            if "keywords" in details and details["keywords"]:
-                                keywords_str = ", ".join([f"**{kw}**" for kw in details["keywords"][:15]])
-                                key_info_parts.append(f"**Keywords**: {keywords_str}")
-
-                            # Add importance level
-                            if "importance_level" in details and details["importance_level"]:
-                                importance = details["importance_level"].upper()
-                                key_info_parts.append(f"**Importance**: {importance}")
-
-                            # Add action keywords
-                            if "action_keywords" in details and details["action_keywords"]:
-                                action_kw_str = ", ".join([f"**{kw}**" for kw in details["action_keywords"][:10]])
-                                key_info_parts.append(f"**Action Keywords**: {action_kw_str}")
-
-                            # Add priority indicators if available
-                            if "priority_indicators" in details and details["priority_indicators"]:
-                                priority_keywords = [f"**{indicator['keyword']}** ({indicator['priority']})"
-                                                   for indicator in details["priority_indicators"]]
-                                key_info_parts.append(f"**Priority Indicators**: {', '.join(priority_keywords)}")
-
-                            # Add status indicators if available
-                            if "status_indicators" in details and details["status_indicators"]:
-                                status_keywords = [f"**{indicator['keyword']}** ({indicator['status']})"
-                                                 for indicator in details["status_indicators"]]
-                                key_info_parts.append(f"**Status Indicators**: {', '.join(status_keywords)}")
-
-                            # Add date indicators if available
-                            if "date_indicators" in details and details["date_indicators"]:
-                                date_info = [f"**{indicator['date']}**: {indicator['text']}"
-                                           for indicator in details["date_indicators"]]
-                                key_info_parts.append(f"**Date References**:\n- " + "\n- ".join(date_info))
-
-                            # Add extracted info section
-                            if key_info_parts:
-                                transcript_section += f"\n\n## Extracted Information\n" + "\n".join(key_info_parts)
-
-                            # Add other metadata if available
-                            metadata_items = []
-                            for key, value in details.items():
-                                if key not in ["content", "context", "priority_indicators", "status_indicators",
-                                              "date_indicators", "created_at", "extraction_date", "extraction_method",
-                                              "keywords", "importance_level", "action_keywords"]:
-                                    if value and isinstance(value, (str, int, float, bool)):
-                                        metadata_items.append(f"**{key.replace('_', ' ').title()}**: {value}")
-
-                            # Add metadata section if we have any metadata
-                            if metadata_items:
-                                transcript_section += f"\n\n## Additional Metadata\n" + "\n".join(metadata_items)
-
-                            # Ensure the transcript details are prominently displayed by putting them at the beginning
-                            # if the existing text is very short
-                            if len(existing_text) < 100:
-                                enhanced_text = transcript_section + "\n\n" + existing_text
-                            else:
-                                enhanced_text = existing_text + transcript_section
-
-                            properties[description_field] = {"rich_text": [{"text": {"content": enhanced_text}}]}
-
-                    # Sanitize date fields to ensure valid ISO format
-                    self._sanitize_date_properties(properties)
-
-                    # Map properties to match the database schema
-                    mapped_properties = self._map_properties_to_schema(
-                        properties,
-                        db_properties,
-                        db_type
-                    )
-
-                    # Create new page in database
-                    response = self.notion.pages.create(
-                        parent={"database_id": db_id},
-                        properties=mapped_properties
-                    )
-                    
-                    if response:
-                        results["created"] += 1
-
-                        # Add detailed comment with transcript context
-                        if "transcript_id" in entry:
-                            # Enhanced reference comment with rich details
-                            comment_text = f"# Transcript Information\n\n**ID**: {entry['transcript_id']}"
-
-                            # Add rich details if available
-                            if "transcript_details" in entry and entry["transcript_details"]:
-                                # Format transcript details into a rich comment
-                                details = entry["transcript_details"]
-
-                                # Add transcript date/time if available
-                                if "created_at" in details:
-                                    comment_text += f"\n**Recorded**: {details['created_at']}"
-
-                                # Add importance level
-                                if "importance_level" in details:
-                                    comment_text += f"\n**Importance**: {details['importance_level'].upper()}"
-
-                                # Add keywords section
-                                if "keywords" in details and details["keywords"]:
-                                    keywords_str = ", ".join([f"**{kw}**" for kw in details["keywords"][:10]])
-                                    comment_text += f"\n\n## Keywords\n{keywords_str}"
-
-                                # Add transcript content preview - with more content
-                                if "content" in details:
-                                    content_preview = details["content"][:1000] + "..." if len(details["content"]) > 1000 else details["content"]
-                                    comment_text += f"\n\n## Transcript Content\n{content_preview}"
-
-                                # Add context from transcript - more prominently displayed
-                                if "context" in details:
-                                    comment_text += f"\n\n## Context\n{details['context']}"
-
-                                # Add extracted action keywords
-                                if "action_keywords" in details and details["action_keywords"]:
-                                    action_keywords = ", ".join(details["action_keywords"])
-                                    comment_text += f"\n\n**Action Keywords**: {action_keywords}"
-
-                                # Add extracted timestamps
-                                if "timestamps" in details:
-                                    comment_text += f"\n\n**Timestamps**: {details['timestamps']}"
-
-                            try:
-                                # Add comment to the newly created page
-                                self._add_comment(response["id"], comment_text)
-                            except Exception as e:
-                                logger.warning(f"Failed to add comment to page {response['id']}: {e}")
-                                # Even if comment fails, the page was still created successfully
-                    
+                    # Add comment to the newly created page
+                    self._add_comment(response["id"], comment_text)
                 except Exception as e:
-                    logger.error(f"Error creating Notion entry: {e}")
-                    results["failed"] += 1
-                    
-                # Respect rate limits
-                time.sleep(0.3)
-        
-        return results
+                    logger.warning(f"Failed to add comment to page {response['id']}: {e}")
+                    # Even if comment fails, the page was still created successfully
+
+            return "created", synthetic_title
+
+        except Exception as e:
+            logger.error(f"Error creating Notion entry: {e}")
+            return "failed", False
+
+    def _open_idempotency_db(self, path: Optional[str]) -> Optional[sqlite3.Connection]:
+        """
+        Open the SQLite cache that records pages created in Notion.
+
+        Args:
+            path: Path to the database file, or None for the default location
+
+        Returns:
+            Open connection, or None if the cache could not be opened
+        """
+        try:
+            if path is None:
+                config_dir = Path.home() / ".config" / "limitless-lifelog"
+                config_dir.mkdir(parents=True, exist_ok=True)
+                path = str(config_dir / "notion_pages.db")
+
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS created (hash TEXT PRIMARY KEY, page_id TEXT, ts REAL)"
+            )
+            connection.commit()
+            return connection
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Error opening page cache {path or 'in the config directory'}: {e}")
+            return None
+
+    @staticmethod
+    def _idempotency_key(db_id: str, transcript_id: str, mapped_properties: Dict[str, Any]) -> str:
+        """
+        Build the cache key identifying an entry in a database.
+
+        The page properties are part of the key, so distinct items from one
+        transcript that happen to share a title are kept apart.
+
+        Args:
+            db_id: ID of the Notion database
+            transcript_id: ID of the source transcript
+            mapped_properties: Page properties mapped to the database schema
+
+        Returns:
+            Hex digest identifying the entry
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{db_id}|{transcript_id}|".encode())
+        digest.update(orjson.dumps(mapped_properties, default=str, option=orjson.OPT_SORT_KEYS))
+        return digest.hexdigest()
+
+    def _get_created_page(self, entry_key: str) -> Optional[str]:
+        """
+        Look up the page previously created for an entry.
+
+        Args:
+            entry_key: Key from _idempotency_key
+
+        Returns:
+            Notion page ID, or None if the entry has not been created
+        """
+        if self._idem_db is None:
+            return None
+
+        with self._idem_lock:
+            row = self._idem_db.execute(
+                "SELECT page_id FROM created WHERE hash = ?", (entry_key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _record_created_page(self, entry_key: str, page_id: str):
+        """
+        Remember that an entry has been created as a Notion page.
+
+        Args:
+            entry_key: Key from _idempotency_key
+            page_id: ID of the created Notion page
+        """
+        if self._idem_db is None:
+            return
+
+        try:
+            with self._idem_lock:
+                self._idem_db.execute(
+                    "INSERT OR REPLACE INTO created (hash, page_id, ts) VALUES (?, ?, ?)",
+                    (entry_key, page_id, time.time())
+                )
+                self._idem_db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to record created page {page_id}: {e}")
+
+    def _create_page(self, db_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a page in a Notion database within the rate limit.
+
+        Rate-limited requests are retried after the delay requested by the
+        Retry-After header; any other error is raised to the caller.
+
+        Args:
+            db_id: ID of the parent database
+            properties: Properties mapped to the database schema
+
+        Returns:
+            Created page object
+        """
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            self._throttle()
+            try:
+                return self.notion.pages.create(
+                    parent={"database_id": db_id},
+                    properties=properties
+                )
+            except Exception as e:
+                if attempt == _MAX_RATE_LIMIT_RETRIES or not self._is_rate_limited(e):
+                    raise
+
+                delay = self._get_retry_after(e)
+                logger.warning(f"Rate limited when creating page, retrying in {delay}s")
+                time.sleep(delay)
     
+    def _render_details(
+        self,
+        details: Dict[str, Any],
+        transcript_id: str,
+        *,
+        max_excerpt: int = 1000,
+        include_extra: bool = True
+    ) -> str:
+        """
+        Render transcript details as markdown sections.
+
+        The same rendering is used for the page description and the page
+        comment; callers only add their own heading.
+
+        Args:
+            details: Transcript details attached to the entry
+            transcript_id: ID of the source transcript
+            max_excerpt: Maximum number of transcript characters to include
+            include_extra: Whether to include unrecognized metadata fields
+
+        Returns:
+            Markdown text for the transcript details
+        """
+        # Split the details into fields with dedicated formatting and extra metadata
+        known = {}
+        metadata_items = []
+        for key, value in details.items():
+            if key in _HANDLED_KEYS:
+                known[key] = value
+            elif include_extra and value and isinstance(value, (str, int, float, bool)):
+                metadata_items.append(f"**{key.replace('_', ' ').title()}**: {value}")
+
+        parts = []
+
+        # Always add transcript ID as a reference
+        if transcript_id:
+            parts.append(f"## Source\nTranscript ID: {transcript_id}")
+
+        # Add creation date if available
+        created_at = known.get("created_at")
+        if created_at:
+            parts.append(f"**Recording Date**: {created_at}")
+
+        # Add transcript content - making it more prominent with longer excerpt
+        content = known.get("content")
+        if content:
+            parts.append(f"## Full Transcript\n{_truncate(content, max_excerpt)}")
+
+        # Add context if available - moved higher up for importance
+        context = known.get("context")
+        if context:
+            parts.append(f"## Context\n{context}")
+
+        # Add extracted content for key information
+        key_info_parts = []
+
+        # Add keywords with better formatting
+        keywords = known.get("keywords")
+        if keywords:
+            keywords_str = ", ".join([f"**{kw}**" for kw in keywords[:15]])
+            key_info_parts.append(f"**Keywords**: {keywords_str}")
+
+        # Add importance level
+        importance = known.get("importance_level")
+        if importance:
+            key_info_parts.append(f"**Importance**: {importance.upper()}")
+
+        # Add action keywords
+        action_keywords = known.get("action_keywords")
+        if action_keywords:
+            action_kw_str = ", ".join([f"**{kw}**" for kw in action_keywords[:10]])
+            key_info_parts.append(f"**Action Keywords**: {action_kw_str}")
+
+        # Add priority indicators if available
+        priority_indicators = known.get("priority_indicators")
+        if priority_indicators:
+            priority_keywords = [f"**{indicator['keyword']}** ({indicator['priority']})"
+                                 for indicator in priority_indicators]
+            key_info_parts.append(f"**Priority Indicators**: {', '.join(priority_keywords)}")
+
+        # Add status indicators if available
+        status_indicators = known.get("status_indicators")
+        if status_indicators:
+            status_keywords = [f"**{indicator['keyword']}** ({indicator['status']})"
+                               for indicator in status_indicators]
+            key_info_parts.append(f"**Status Indicators**: {', '.join(status_keywords)}")
+
+        # Add date indicators if available
+        date_indicators = known.get("date_indicators")
+        if date_indicators:
+            date_info = [f"**{indicator['date']}**: {indicator['text']}"
+                         for indicator in date_indicators]
+            key_info_parts.append(f"**Date References**:\n- " + "\n- ".join(date_info))
+
+        # Add extracted info section
+        if key_info_parts:
+            parts.append("## Extracted Information\n" + "\n".join(key_info_parts))
+
+        # Add metadata section if we have any metadata
+        if metadata_items:
+            parts.append("## Additional Metadata\n" + "\n".join(metadata_items))
+
+        return "\n\n".join(parts)
+
     def _add_comment(self, page_id: str, comment_text: str):
         """
         Add a comment to a Notion page.
@@ -270,32 +536,73 @@ class NotionClient:
             logger.debug(f"Comment text too long ({len(comment_text)} chars), truncating to 2000 chars")
             comment_text = comment_text[:1997] + "..."
 
-        # Add a small delay to prevent rate limiting (Notion API has rate limits)
-        import time
-        time.sleep(0.5)
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            self._throttle()
+            try:
+                self.notion.comments.create(
+                    parent={"page_id": page_id},
+                    rich_text=[{"text": {"content": comment_text}}]
+                )
+                logger.debug(f"Added comment to page {page_id}")
+                return
+            except Exception as e:
+                if not self._is_rate_limited(e):
+                    logger.error(f"Error adding comment to page {page_id}: {e}")
+                    return
+                if attempt == _MAX_RATE_LIMIT_RETRIES:
+                    logger.error(f"Failed to add comment even after retry: {e}")
+                    return
+
+                # If rate limited, back off exponentially before trying again
+                delay = 2 ** attempt
+                logger.warning(f"Rate limited when adding comment, retrying in {delay}s: {e}")
+                time.sleep(delay)
 
+    def _throttle(self):
+        """
+        Block until another request fits within the Notion rate limit.
+
+        Only sleeps when the last few requests were issued within the
+        rate limit period, so idle time is never wasted.
+        """
+        with self._rate_lock:
+            if len(self._request_times) == self._request_times.maxlen:
+                wait = self._request_times[0] + _RATE_LIMIT_PERIOD - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+            self._request_times.append(time.monotonic())
+
+    @staticmethod
+    def _get_retry_after(error: Exception) -> float:
+        """
+        Get the delay requested by a rate-limited response.
+
+        Args:
+            error: Exception raised by the Notion client
+
+        Returns:
+            Seconds to wait before retrying (defaults to 1)
+        """
+        headers = getattr(error, "headers", None) or {}
         try:
-            self.notion.comments.create(
-                parent={"page_id": page_id},
-                rich_text=[{"text": {"content": comment_text}}]
-            )
-            logger.debug(f"Added comment to page {page_id}")
-        except Exception as e:
-            # If rate limited, try again after a delay
-            if "429" in str(e) or "rate limit" in str(e).lower():
-                logger.warning(f"Rate limited when adding comment, retrying after delay: {e}")
-                time.sleep(2)
-                try:
-                    self.notion.comments.create(
-                        parent={"page_id": page_id},
-                        rich_text=[{"text": {"content": comment_text}}]
-                    )
-                    logger.debug(f"Added comment to page {page_id} after retry")
-                    return
-                except Exception as retry_e:
-                    logger.error(f"Failed to add comment even after retry: {retry_e}")
-            else:
-                logger.error(f"Error adding comment to page {page_id}: {e}")
+            return float(headers.get("Retry-After", 1))
+        except (TypeError, ValueError):
+            return 1.0
+
+    @staticmethod
+    def _is_rate_limited(error: Exception) -> bool:
+        """
+        Check whether an API error was caused by rate limiting.
+
+        Args:
+            error: Exception raised by the Notion client
+
+        Returns:
+            True if the request was rejected with HTTP 429
+        """
+        if getattr(error, "status", None) == 429:
+            return True
+        return "429" in str(error) or "rate limit" in str(error).lower()
     
     def get_database_items(self, db_type: str, query: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
@@ -322,6 +629,7 @@ class NotionClient:
             if query:
                 query_params.update(query)
                 
+            self._throttle()
             response = self.notion.databases.query(**query_params)
             return response.get("results", [])
             
@@ -345,6 +653,7 @@ class NotionClient:
             return False
             
         try:
+            self._throttle()
             self.notion.pages.update(
                 page_id=page_id,
                 properties=properties
@@ -355,43 +664,130 @@ class NotionClient:
             logger.error(f"Error updating Notion page {page_id}: {e}")
             return False
     
-    def _map_properties_to_schema(self, properties: Dict[str, Any], schema: Dict[str, Any], db_type: str) -> Dict[str, Any]:
+    def _get_schema(self, db_id: str) -> Dict[str, Any]:
+        """
+        Get the property schema of a database, fetching it only once.
+
+        Args:
+            db_id: ID of the Notion database
+
+        Returns:
+            Dictionary of property schemas keyed by property name
+        """
+        if db_id not in self._schemas:
+            self._throttle()
+            db_schema = self.notion.databases.retrieve(database_id=db_id)
+            properties = db_schema.get("properties", {})
+            self._schema_indexes[db_id] = self._build_schema_index(properties)
+
+            # Remember the options of the tag property for get_existing_tags
+            for prop_name, prop_schema in properties.items():
+                if prop_schema.get("type") == "multi_select" and prop_name in _TAG_PROPERTIES:
+                    options = prop_schema.get("multi_select", {}).get("options", [])
+                    self._tag_index[db_id] = [option["name"] for option in options]
+                    break
+
+            self._schemas[db_id] = properties
+
+        return self._schemas[db_id]
+
+    @staticmethod
+    def _build_schema_index(schema: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Precompute option lookups for each property in a database schema.
+
+        Args:
+            schema: Database schema properties
+
+        Returns:
+            Dictionary mapping property names to their type, option sets
+            and default options
+        """
+        index = {}
+        for prop_name, prop_schema in schema.items():
+            select_options = [option["name"] for option in prop_schema.get("select", {}).get("options", [])]
+            status_options = [option["name"] for option in prop_schema.get("status", {}).get("options", [])]
+            index[prop_name] = {
+                "type": prop_schema.get("type"),
+                "select_options": frozenset(select_options),
+                "default_select": select_options[0] if select_options else None,
+                "status_options": frozenset(status_options),
+                "default_status": status_options[0] if status_options else "Not Started"
+            }
+        return index
+
+    def _prepare_properties(
+        self,
+        properties: Dict[str, Any],
+        schema_index: Dict[str, Dict[str, Any]],
+        db_type: str
+    ) -> Tuple[Dict[str, Any], Dict[str, bool]]:
         """
-        Map properties to match the database schema.
+        Sanitize date values and map properties to match the database schema.
+
+        Both steps happen in a single pass over the properties. Null dates
+        are dropped, empty start dates default to today and empty end dates
+        are cleared, so Notion doesn't reject the page.
 
         Args:
-            properties: Properties to map
-            schema: Database schema
+            properties: Properties to prepare
+            schema_index: Database schema index from _build_schema_index
             db_type: Database type
 
         Returns:
-            Mapped properties
+            Tuple of mapped properties and quality flags; the
+            "synthetic_title" flag is set when a placeholder title was used
         """
         mapped_properties = {}
+        quality_flags = {"synthetic_title": False}
         property_name_map = self._get_property_name_map(db_type)
+        default_date = None
 
         # Iterate through each source property
         for prop_name, prop_value in properties.items():
+            # Sanitize date properties to ensure valid ISO format values
+            if isinstance(prop_value, dict) and "date" in prop_value:
+                date_value = prop_value["date"]
+
+                # Drop null date
+                if date_value is None:
+                    logger.debug(f"Removing null date value for {prop_name}")
+                    continue
+
+                if isinstance(date_value, dict):
+                    # Fix empty or invalid start date
+                    if "start" in date_value and (date_value["start"] is None or date_value["start"] == ""):
+                        logger.debug(f"Fixing empty start date for {prop_name}")
+                        if default_date is None:
+                            default_date = _today()
+                        date_value["start"] = default_date
+
+                    # Fix empty or invalid end date
+                    if "end" in date_value and (date_value["end"] is None or date_value["end"] == ""):
+                        logger.debug(f"Fixing empty end date for {prop_name}")
+                        date_value["end"] = None  # Remove end date instead of setting default
+
             # Check if the property needs to be renamed
             mapped_name = property_name_map.get(prop_name, prop_name)
 
             # Check if the mapped property exists in the schema
-            if mapped_name in schema:
-                schema_type = schema[mapped_name].get("type")
+            if mapped_name in schema_index:
+                prop_index = schema_index[mapped_name]
+                schema_type = prop_index["type"]
 
                 # Handle different property types and conversions
                 if schema_type == "select" and prop_value.get("select"):
                     # Check if the select option exists
-                    existing_options = [option["name"] for option in schema[mapped_name].get("select", {}).get("options", [])]
                     select_value = prop_value["select"].get("name")
 
-                    if select_value in existing_options:
+                    if select_value in prop_index["select_options"]:
                         mapped_properties[mapped_name] = prop_value
                     else:
                         # If not, use a default/first option if available
-                        if existing_options:
-                            mapped_properties[mapped_name] = {"select": {"name": existing_options[0]}}
-                            logger.debug(f"Using default select option '{existing_options[0]}' for property '{mapped_name}'")
+                        default_option = prop_index["default_select"]
+                        if default_option is not None:
+                            mapped_properties[mapped_name] = {"select": {"name": default_option}}
+                            logger.debug(f"Using default select option '{default_option}' for property '{mapped_name}'")
 
                 # Handle relation types
                 elif schema_type == "relation" and prop_value.get("select"):
@@ -412,9 +808,8 @@ class NotionClient:
 
                 # Handle status type
                 elif schema_type == "status" and "status" not in prop_value:
-                    # Check for valid status options
-                    status_options = [option["name"] for option in schema[mapped_name].get("status", {}).get("options", [])]
-                    default_status = status_options[0] if status_options else "Not Started"
+                    # Use the first valid status option
+                    default_status = prop_index["default_status"]
                     mapped_properties[mapped_name] = {"status": {"name": default_status}}
                     logger.debug(f"Using default status '{default_status}' for property '{mapped_name}'")
 
@@ -425,16 +820,16 @@ class NotionClient:
             # If we're dealing with the title property, try to find the actual title field
             elif prop_name == "Title" or prop_name == "Name" or prop_name == "Entry":
                 # Find the title-type property
-                for schema_prop_name, schema_prop in schema.items():
-                    if schema_prop.get("type") == "title":
+                for schema_prop_name, schema_prop in schema_index.items():
+                    if schema_prop["type"] == "title":
                         mapped_properties[schema_prop_name] = {"title": prop_value.get("title", [])}
                         logger.debug(f"Mapped title property '{prop_name}' to '{schema_prop_name}'")
                         break
 
         # Ensure there's a title property
         title_set = False
-        for prop_name, prop in schema.items():
-            if prop.get("type") == "title" and prop_name not in mapped_properties:
+        for prop_name, prop in schema_index.items():
+            if prop["type"] == "title" and prop_name not in mapped_properties:
                 # Find any property with title content
                 for orig_prop, value in properties.items():
                     if "title" in value or "text" in value:
@@ -446,53 +841,10 @@ class NotionClient:
                 # If no title content found, use a default
                 if not title_set:
                     mapped_properties[prop_name] = {"title": [{"text": {"content": f"New {db_type[:-1] if db_type.endswith('s') else db_type}"}}]}
+                    quality_flags["synthetic_title"] = True
                 break
 
-        return mapped_properties
-
-    def _sanitize_date_properties(self, properties: Dict[str, Any]) -> None:
-        """
-        Sanitize date properties to ensure valid ISO format values.
-
-        Removes null/empty date values that would cause Notion API validation errors.
-
-        Args:
-            properties: Properties dictionary to sanitize
-        """
-        from datetime import datetime
-
-        date_fields = ["Due Date", "Due", "Created Date", "Date", "Meeting Date",
-                      "Timeline", "Date Range", "Follow-up Date"]
-
-        default_date = datetime.now().strftime("%Y-%m-%d")
-
-        # Check and fix each property
-        for field_name in list(properties.keys()):
-            property_value = properties[field_name]
-
-            # Check if it's a date property
-            if field_name in date_fields or (isinstance(property_value, dict) and "date" in property_value):
-                # Handle date property
-                if isinstance(property_value, dict) and "date" in property_value:
-                    date_value = property_value["date"]
-
-                    # Remove null date
-                    if date_value is None:
-                        logger.debug(f"Removing null date value for {field_name}")
-                        del properties[field_name]
-                        continue
-
-                    # Fix empty or invalid start date
-                    if isinstance(date_value, dict) and "start" in date_value:
-                        if date_value["start"] is None or date_value["start"] == "":
-                            logger.debug(f"Fixing empty start date for {field_name}")
-                            date_value["start"] = default_date
-
-                    # Fix empty or invalid end date
-                    if isinstance(date_value, dict) and "end" in date_value:
-                        if date_value["end"] is None or date_value["end"] == "":
-                            logger.debug(f"Fixing empty end date for {field_name}")
-                            date_value["end"] = None  # Remove end date instead of setting default
+        return mapped_properties, quality_flags
 
     def _get_property_name_map(self, db_type: str) -> Dict[str, str]:
         """
@@ -559,6 +911,7 @@ class NotionClient:
             return False
 
         try:
+            self._throttle()
             self.notion.comments.create(
                 parent={"page_id": page_id},
                 rich_text=[{"text": {"content": content}}]
@@ -589,29 +942,15 @@ class NotionClient:
             return []
 
         try:
-            # First get the database schema to find the tags property
-            db_schema = self.notion.databases.retrieve(database_id=db_id)
-            properties = db_schema.get("properties", {})
-
-            # Find the multi-select property for tags
-            tag_property = None
-            for prop_name, prop_schema in properties.items():
-                if prop_schema.get("type") == "multi_select" and (
-                    prop_name == "Tags" or
-                    prop_name == "Keywords" or
-                    prop_name == "Categories"
-                ):
-                    tag_property = prop_name
-                    # Get all pre-defined options for this property
-                    options = prop_schema.get("multi_select", {}).get("options", [])
-                    return [option["name"] for option in options]
-
-            if not tag_property:
-                logger.debug(f"No multi-select tag property found in {db_type} database")
-                return []
-
+            # The tag index is built alongside the cached database schema
+            self._get_schema(db_id)
         except Exception as e:
             logger.error(f"Error retrieving existing tags from {db_type} database: {e}")
             return []
 
-        return []
\ No newline at end of file
+        tags = self._tag_index.get(db_id)
+        if tags is None:
+            logger.debug(f"No multi-select tag property found in {db_type} database")
+            return []
+
+        return list(tags)
\ No newline at end of file
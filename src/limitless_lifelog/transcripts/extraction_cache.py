@@ -0,0 +1,145 @@
+"""
+Content-addressable cache for LLM extraction results.
+"""
+
+import time
+import sqlite3
+import hashlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from loguru import logger
+
+# Stay well below SQLite's limit on bound parameters per statement
+_MAX_QUERY_PARAMS = 500
+
+
+class ExtractionCache:
+    """
+    Stores raw LLM extraction responses keyed by a hash of their inputs.
+
+    Backed by a single SQLite table so that a whole run's worth of
+    transcripts can be looked up with one query.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize extraction cache.
+
+        Args:
+            path: Path to the cache database (defaults to the user config directory)
+        """
+        try:
+            if path is None:
+                config_dir = Path.home() / ".config" / "limitless-lifelog"
+                config_dir.mkdir(parents=True, exist_ok=True)
+                path = str(config_dir / "processed.db")
+
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS processed (hash BLOB PRIMARY KEY, result_json TEXT, ts REAL)"
+            )
+            self._db.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Error opening extraction cache {path or 'in the config directory'}: {e}")
+            self._db = None
+
+    def close(self):
+        """Close the cache database."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __del__(self):
+        if getattr(self, "_db", None) is not None:
+            self.close()
+
+    @staticmethod
+    def make_key(*parts: str) -> bytes:
+        """
+        Build a cache key from the inputs that determine an extraction.
+
+        Each part is length-prefixed so that different splits of the same
+        text can never produce the same key.
+
+        Args:
+            parts: Strings such as provider, model, prompt version and content
+
+        Returns:
+            16-byte BLAKE2b digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            data = part.encode("utf-8")
+            digest.update(len(data).to_bytes(8, "big"))
+            digest.update(data)
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """
+        Look up a cached extraction.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached raw JSON response, or None on a miss
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, str]:
+        """
+        Look up several cached extractions at once.
+
+        Args:
+            keys: Cache keys from make_key
+
+        Returns:
+            Dictionary mapping the keys that were found to their raw JSON responses
+        """
+        if self._db is None:
+            return {}
+
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        try:
+            for i in range(0, len(keys), _MAX_QUERY_PARAMS):
+                chunk = keys[i:i + _MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._db.execute(
+                    f"SELECT hash, result_json FROM processed WHERE hash IN ({placeholders})", chunk
+                )
+                found.update(rows)
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading extraction cache: {e}")
+        return found
+
+    def set(self, key: bytes, value: str) -> None:
+        """
+        Store an extraction response.
+
+        Args:
+            key: Cache key from make_key
+            value: Raw JSON response returned by the LLM
+        """
+        self.set_many([(key, value)])
+
+    def set_many(self, items: List[Tuple[bytes, str]]) -> None:
+        """
+        Store several extraction responses in one transaction.
+
+        Args:
+            items: List of (cache key, raw JSON response) tuples
+        """
+        if self._db is None or not items:
+            return
+
+        now = time.time()
+        try:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO processed (hash, result_json, ts) VALUES (?, ?, ?)",
+                    [(key, value, now) for key, value in items]
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing extraction cache: {e}")
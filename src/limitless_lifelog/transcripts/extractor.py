@@ -3,12 +3,189 @@ Extract actionable items from transcripts.
 """
 
 import os
+import re
 import json
+import time
 import uuid
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import asyncio
+from datetime import date, datetime, timedelta
+from functools import cached_property, lru_cache
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from loguru import logger
 
+from .extraction_cache import ExtractionCache
+from ..utils.client_pool import get_openai_client, get_anthropic_client
+
+# Bump whenever _SYSTEM_PROMPT changes so cached extractions are invalidated
+PROMPT_VERSION = "v3"
+
+# Upper bound on in-flight LLM requests to stay within provider rate limits
+_MAX_CONCURRENCY = 10
+
+# Batch API settings: below _BATCH_MIN_ITEMS the polling latency isn't worth it
+_BATCH_MIN_ITEMS = 10
+_BATCH_MAX_TOKENS = 4096
+_BATCH_POLL_INITIAL = 5.0
+_BATCH_POLL_MAX = 60.0
+_OPENAI_BATCH_ENDPOINT = "/v1/chat/completions"
+
+_SYSTEM_PROMPT = """
+        You are an AI assistant that extracts actionable items from voice transcripts.
+        Analyze the following transcript and extract:
+        
+        1. Tasks: Any actions that need to be done, with title, description, priority, due date, and project.
+        2. Meetings: Any mentioned meetings, with title, date, time, participants, and agenda.
+        3. Projects: Any project references, with name, description, and timeline.
+        4. Research: Any research topics or information needs.
+        5. Messages: Any messages that need to be sent to specific people.
+        
+        Format your response as a JSON object with these categories.
+        For explicit dates that include a year, use ISO format (YYYY-MM-DD).
+        If a date is relative (e.g., "next Monday") or has no year (e.g., "March 3rd", "the 15th"),
+        do not resolve it; copy the phrase as-is. These dates are resolved after extraction.
+        If priority is not explicitly mentioned, infer it from the context as "high", "medium", or "low".
+        """
+
+# Item fields that may hold a date phrase to resolve after extraction
+_DATE_FIELDS = ("due_date", "date", "follow_up_date", "meeting_date")
+
+# Small counts the LLM may spell out in offsets such as "in two weeks"
+_NUMBER_WORDS = {
+    "a": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10
+}
+
+_RELATIVE_OFFSET = re.compile(rf"\bin\s+(\d+|{'|'.join(_NUMBER_WORDS)})\s+(day|week)s?\b")
+
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+_MONTHS = ("january", "february", "march", "april", "may", "june", "july",
+           "august", "september", "october", "november", "december")
+
+# Month names and their common abbreviations, mapped to month numbers
+_MONTH_NUMBERS = {
+    **{name: number for number, name in enumerate(_MONTHS, 1)},
+    **{name[:3]: number for number, name in enumerate(_MONTHS, 1)},
+    "sept": 9
+}
+_MONTH_NAME = rf"({'|'.join(sorted(_MONTH_NUMBERS, key=len, reverse=True))})\b\.?"
+
+# Day of the month, optionally with an ordinal suffix, e.g. "3" or "15th"
+_DAY = r"(\d{1,2})(?:st|nd|rd|th)?\b"
+
+# Month and day without a year, e.g. "nov 3", "March 3rd" or "3rd of March"
+_MONTH_DAY = re.compile(rf"\b{_MONTH_NAME}\s+{_DAY}")
+_DAY_MONTH = re.compile(rf"\b{_DAY}\s+(?:of\s+)?{_MONTH_NAME}")
+
+# Day of the month on its own, e.g. "the 15th"
+_DAY_ONLY = re.compile(r"\bthe\s+(\d{1,2})(?:st|nd|rd|th)\b")
+
+
+def _next_month_day(today: date, month: int, day: int) -> Optional[date]:
+    """
+    Find the first date on or after today that falls on a given month and day.
+
+    Args:
+        today: Reference day
+        month: Month number
+        day: Day of the month
+
+    Returns:
+        The date, or None if the month never has that day
+    """
+    for year in (today.year, today.year + 1):
+        try:
+            candidate = date(year, month, day)
+        except ValueError:
+            continue  # Feb 29 outside a leap year, or no such day at all
+        if candidate >= today:
+            return candidate
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _resolve_date(text: str, today_ordinal: int) -> Optional[str]:
+    """
+    Resolve a lowercased date phrase relative to a given day.
+    
+    Args:
+        text: Lowercased, stripped date text
+        today_ordinal: Proleptic Gregorian ordinal of the reference day
+        
+    Returns:
+        ISO format date string or None if parsing fails
+    """
+    today = date.fromordinal(today_ordinal)
+    
+    # Explicit ISO dates (optionally with a time part) pass through unchanged
+    try:
+        return datetime.strptime(text[:10], "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        pass
+    
+    # Common relative date mappings
+    if "today" in text:
+        return today.isoformat()
+    elif "day after tomorrow" in text:
+        return (today + timedelta(days=2)).isoformat()
+    elif "tomorrow" in text:
+        return (today + timedelta(days=1)).isoformat()
+    elif "next week" in text:
+        return (today + timedelta(days=7)).isoformat()
+    elif "next month" in text:
+        # Simple approximation
+        if today.month == 12:
+            next_month = date(today.year + 1, 1, 1)
+        else:
+            next_month = date(today.year, today.month + 1, 1)
+        return next_month.isoformat()
+    
+    # Offsets such as "in 3 days" or "in 2 weeks"
+    offset = _RELATIVE_OFFSET.search(text)
+    if offset:
+        count = offset.group(1)
+        count = int(count) if count.isdigit() else _NUMBER_WORDS[count]
+        days = count * (7 if offset.group(2) == "week" else 1)
+        return (today + timedelta(days=days)).isoformat()
+    
+    # Month and day without a year: the next time that day comes round
+    month_day = _MONTH_DAY.search(text)
+    day_month = None if month_day else _DAY_MONTH.search(text)
+    if month_day or day_month:
+        if month_day:
+            month, day = month_day.group(1), month_day.group(2)
+        else:
+            day, month = day_month.group(1), day_month.group(2)
+        resolved = _next_month_day(today, _MONTH_NUMBERS[month], int(day))
+        return resolved.isoformat() if resolved else None
+    
+    day_only = _DAY_ONLY.search(text)
+    if day_only:
+        day = int(day_only.group(1))
+        for months_ahead in range(12):
+            month_index = today.month - 1 + months_ahead
+            try:
+                candidate = date(today.year + month_index // 12, month_index % 12 + 1, day)
+            except ValueError:
+                continue  # Month too short for this day
+            if candidate >= today:
+                return candidate.isoformat()
+        return None
+    
+    # Weekday references
+    for i, day in enumerate(_WEEKDAYS):
+        if day in text:
+            if "last " + day in text:
+                days_back = (today.weekday() - i) % 7 or 7
+                return (today - timedelta(days=days_back)).isoformat()
+            days_ahead = i - today.weekday()
+            if days_ahead <= 0:  # Target day already happened this week
+                days_ahead += 7
+            return (today + timedelta(days=days_ahead)).isoformat()
+    
+    return None
+
+
 class ItemExtractor:
     """
     Extracts actionable items from transcript content.
@@ -17,45 +194,121 @@ class ItemExtractor:
     relevant information for Notion integration.
     """
     
-    def __init__(self, llm_provider: str = "openai", llm_model: str = "gpt-4"):
+    def __init__(self, llm_provider: str = "openai", llm_model: str = "gpt-4",
+                 max_concurrency: int = _MAX_CONCURRENCY, use_batch_api: bool = False,
+                 cache_path: Optional[str] = None):
         """
         Initialize item extractor.
         
         Args:
             llm_provider: Provider for LLM processing ("openai" or "anthropic")
             llm_model: Model to use for processing
+            max_concurrency: Maximum number of concurrent LLM requests
+            use_batch_api: Submit large runs through the provider's Batch API
+            cache_path: Path to the extraction cache database (defaults to the user config directory)
         """
         self.llm_provider = llm_provider
         self.llm_model = llm_model
+        self.max_concurrency = max_concurrency
+        self.use_batch_api = use_batch_api
+        self.cache = ExtractionCache(cache_path)
+        # Cache entries preloaded for the current extract_items run, and results to write back
+        self._prefetched: Optional[Dict[bytes, str]] = None
+        self._unsaved: List[Tuple[bytes, str]] = []
+        
+        # Clients are created on first use so that importing the SDKs doesn't slow startup
+        if llm_provider not in ("openai", "anthropic"):
+            logger.error(f"Unsupported LLM provider: {llm_provider}")
+    
+    @cached_property
+    def client(self) -> Any:
+        """
+        Synchronous LLM client for the configured provider, or None if unsupported.
+        """
+        if self.llm_provider == "openai":
+            return get_openai_client()
+        if self.llm_provider == "anthropic":
+            return get_anthropic_client()
+        return None
+    
+    def _new_async_client(self) -> Any:
+        """
+        Create an asynchronous LLM client for the configured provider.
         
-        # Initialize appropriate client based on provider
-        if llm_provider == "openai":
+        Async clients pool connections bound to the event loop they are used in,
+        so one is created for every extract_items_async run and closed after it.
+        
+        Returns:
+            Async provider client, or None if the provider is unsupported
+        """
+        if self.llm_provider == "openai":
             import openai
-            self.client = openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-        elif llm_provider == "anthropic":
+            return openai.AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        if self.llm_provider == "anthropic":
             import anthropic
-            self.client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-        else:
-            logger.error(f"Unsupported LLM provider: {llm_provider}")
-            self.client = None
+            return anthropic.AsyncAnthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+        return None
     
     def extract_items(self, transcripts: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """
         Extract actionable items from a list of transcripts.
         
+        LLM requests are issued concurrently. When called from inside a running
+        event loop, transcripts are processed sequentially instead. Large runs
+        go through the Batch API when use_batch_api is enabled.
+        
         Args:
             transcripts: List of transcript dictionaries
             
         Returns:
             Dictionary with categories of extracted items
         """
-        result = {
-            "tasks": [],
-            "meetings": [],
-            "projects": [],
-            "research": [],
-            "messages": []
-        }
+        pending = [t for t in transcripts if t.get("content", "")]
+        
+        # Look up every transcript with one cache query and write new results back in one batch
+        self._prefetched = self.cache.get_many(self._cache_key(t["content"]) for t in pending)
+        try:
+            return self._run_extraction(transcripts, pending)
+        finally:
+            self.cache.set_many(self._unsaved)
+            self._prefetched = None
+            self._unsaved = []
+    
+    def _run_extraction(self, transcripts: List[Dict[str, Any]], pending: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Dispatch extraction to the batch, concurrent or sequential path.
+        
+        Args:
+            transcripts: List of transcript dictionaries
+            pending: Transcripts that have content to extract from
+            
+        Returns:
+            Dictionary with categories of extracted items
+        """
+        if self.use_batch_api and self.client is not None and len(pending) >= _BATCH_MIN_ITEMS:
+            try:
+                return self.extract_items_batch(pending)
+            except Exception as e:
+                logger.error(f"Batch extraction failed, falling back to direct requests: {e}")
+        
+        return self._extract_direct(transcripts)
+    
+    def _extract_direct(self, transcripts: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Extract items with direct LLM requests, concurrently when no event loop is running.
+        
+        Args:
+            transcripts: List of transcript dictionaries
+            
+        Returns:
+            Dictionary with categories of extracted items
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.extract_items_async(transcripts))
+        
+        result = self._empty_result()
         
         for transcript in transcripts:
             content = transcript.get("content", "")
@@ -66,17 +319,295 @@ class ItemExtractor:
                 # Extract items using LLM
                 # Pass the full transcript object to ensure details are transferred
                 extracted = self._extract_with_llm(content, transcript.get("id", ""), transcript)
-                
-                # Merge results
-                for category in result.keys():
-                    if category in extracted:
-                        result[category].extend(extracted[category])
+                self._merge_extracted(result, extracted)
                         
             except Exception as e:
                 logger.error(f"Error extracting items from transcript {transcript.get('id')}: {e}")
         
         return result
     
+    async def extract_items_async(self, transcripts: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Extract actionable items from a list of transcripts concurrently.
+        
+        Args:
+            transcripts: List of transcript dictionaries
+            
+        Returns:
+            Dictionary with categories of extracted items
+        """
+        result = self._empty_result()
+        client = self._new_async_client()
+        if client is None:
+            return result
+        
+        try:
+            return await self._extract_all_async(client, transcripts, result)
+        finally:
+            await client.close()
+    
+    async def _extract_all_async(self, client: Any, transcripts: List[Dict[str, Any]], result: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run the concurrent extraction requests of one extract_items_async call.
+        
+        Args:
+            client: Async provider client for this run
+            transcripts: List of transcript dictionaries
+            result: Empty result container to fill
+            
+        Returns:
+            Dictionary with categories of extracted items
+        """
+        pending = [t for t in transcripts if t.get("content", "")]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        # Identical content is only sent to the LLM once
+        cache_keys = [self._cache_key(t["content"]) for t in pending]
+        first_seen = {}
+        for key, transcript in zip(cache_keys, pending):
+            first_seen.setdefault(key, transcript)
+        
+        async def bounded(key: bytes, transcript: Dict[str, Any]) -> Tuple[Optional[str], bool]:
+            async with semaphore:
+                return await self._fetch_extraction_async(client, key, transcript["content"])
+        
+        outcomes = await asyncio.gather(*(bounded(k, t) for k, t in first_seen.items()), return_exceptions=True)
+        outcome_by_key = dict(zip(first_seen, outcomes))
+        
+        # Merge in input order so output matches the sequential path. Duplicates are
+        # parsed from the first copy's response, so they get their own transcript and
+        # item IDs without another request.
+        stored = set()
+        for key, transcript in zip(cache_keys, pending):
+            transcript_id = transcript.get("id", "")
+            outcome = outcome_by_key[key]
+            if isinstance(outcome, Exception):
+                logger.error(f"Error extracting items from transcript {transcript_id}: {outcome}")
+                continue
+            extraction_json, fresh = outcome
+            if extraction_json is None:
+                continue  # Request failed; already logged
+            try:
+                extracted = self._parse_extraction(extraction_json, transcript_id, transcript)
+            except Exception as e:
+                logger.error(f"Error extracting items from transcript {transcript_id}: {e}")
+                continue
+            if fresh and key not in stored:
+                self._store_extraction(key, extraction_json)
+                stored.add(key)
+            self._merge_extracted(result, extracted)
+        
+        return result
+    
+    def extract_items_batch(self, transcripts: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Extract actionable items through the provider's Batch API.
+        
+        All transcripts are submitted as a single batch, which is polled until
+        it finishes and then demultiplexed back into item categories.
+        
+        Args:
+            transcripts: List of transcript dictionaries
+            
+        Returns:
+            Dictionary with categories of extracted items
+        """
+        result = self._empty_result()
+        pending = [t for t in transcripts if t.get("content", "")]
+        if not pending or self.client is None:
+            return result
+        
+        if self.llm_provider not in ("openai", "anthropic"):
+            logger.error(f"Unsupported LLM provider: {self.llm_provider}")
+            return result
+        
+        cache_keys = [self._cache_key(t["content"]) for t in pending]
+        responses = self._cached_extractions(cache_keys)
+        
+        # Submit each distinct piece of content that hasn't been extracted before, once.
+        # Custom IDs must be unique and short, so key by position rather than transcript ID.
+        to_submit = {}
+        for key, transcript in zip(cache_keys, pending):
+            if key not in responses:
+                to_submit.setdefault(key, transcript)
+        key_by_custom_id = {f"transcript-{i}": key for i, key in enumerate(to_submit)}
+        
+        fresh = {}
+        if to_submit:
+            by_custom_id = {custom_id: to_submit[key] for custom_id, key in key_by_custom_id.items()}
+            if self.llm_provider == "openai":
+                submitted = self._run_openai_batch(by_custom_id)
+            else:
+                submitted = self._run_anthropic_batch(by_custom_id)
+            fresh = {key_by_custom_id[custom_id]: text for custom_id, text in submitted.items()}
+            responses.update(fresh)
+        
+        missing = []
+        for key, transcript in zip(cache_keys, pending):
+            extraction_json = responses.get(key)
+            if extraction_json is None:
+                missing.append(transcript)
+                continue
+            try:
+                extracted = self._parse_extraction(extraction_json, transcript.get("id", ""), transcript)
+                self._merge_extracted(result, extracted)
+                if fresh.pop(key, None) is not None:
+                    self._store_extraction(key, extraction_json)
+            except Exception as e:
+                logger.error(f"Error extracting items from transcript {transcript.get('id')}: {e}")
+        
+        # Requests that failed inside the batch are retried directly; their items follow the batch's
+        if missing:
+            logger.warning(f"No batch result for {len(missing)} transcripts, retrying with direct requests")
+            self._merge_extracted(result, self._extract_direct(missing))
+        
+        return result
+    
+    def _run_openai_batch(self, by_custom_id: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Submit an OpenAI batch job and collect the response text per request.
+        
+        Args:
+            by_custom_id: Transcripts keyed by batch custom ID
+            
+        Returns:
+            Dictionary mapping custom IDs to raw extraction JSON
+        """
+        lines = []
+        for custom_id, transcript in by_custom_id.items():
+            system_prompt, user_prompt = self._build_prompts(transcript["content"])
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": _OPENAI_BATCH_ENDPOINT,
+                "body": {
+                    "model": self.llm_model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    "response_format": {"type": "json_object"}
+                }
+            }))
+        
+        batch_file = self.client.files.create(
+            file=("extraction_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=_OPENAI_BATCH_ENDPOINT,
+            completion_window="24h"
+        )
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(lines)} requests")
+        
+        batch = self._poll_batch(
+            lambda: self.client.batches.retrieve(batch.id),
+            lambda b: b.status in ("completed", "failed", "expired", "cancelled")
+        )
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+        
+        responses = {}
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.error(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                continue
+            responses[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"].strip()
+        return responses
+    
+    def _run_anthropic_batch(self, by_custom_id: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Submit an Anthropic message batch and collect the response text per request.
+        
+        Args:
+            by_custom_id: Transcripts keyed by batch custom ID
+            
+        Returns:
+            Dictionary mapping custom IDs to raw extraction JSON
+        """
+        requests = []
+        for custom_id, transcript in by_custom_id.items():
+            system_prompt, user_prompt = self._build_prompts(transcript["content"])
+            requests.append({
+                "custom_id": custom_id,
+                "params": {
+                    "model": self.llm_model,
+                    "max_tokens": _BATCH_MAX_TOKENS,
+                    "system": self._anthropic_system(system_prompt),
+                    "messages": [{"role": "user", "content": user_prompt}]
+                }
+            })
+        
+        batch = self.client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted Anthropic batch {batch.id} with {len(requests)} requests")
+        
+        batch = self._poll_batch(
+            lambda: self.client.messages.batches.retrieve(batch.id),
+            lambda b: b.processing_status == "ended"
+        )
+        
+        responses = {}
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                logger.error(f"Batch request {entry.custom_id} did not succeed: {entry.result.type}")
+                continue
+            responses[entry.custom_id] = entry.result.message.content[0].text.strip()
+        return responses
+    
+    @staticmethod
+    def _poll_batch(retrieve, is_done):
+        """
+        Poll a batch job with exponential backoff until it finishes.
+        
+        Args:
+            retrieve: Callable returning the current batch object
+            is_done: Predicate telling whether the batch has finished
+            
+        Returns:
+            The finished batch object
+        """
+        delay = _BATCH_POLL_INITIAL
+        batch = retrieve()
+        while not is_done(batch):
+            time.sleep(delay)
+            delay = min(delay * 2, _BATCH_POLL_MAX)
+            batch = retrieve()
+        return batch
+    
+    @staticmethod
+    def _empty_result() -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Create an empty result container with all item categories.
+        
+        Returns:
+            Dictionary mapping each category to an empty list
+        """
+        return {
+            "tasks": [],
+            "meetings": [],
+            "projects": [],
+            "research": [],
+            "messages": []
+        }
+    
+    @staticmethod
+    def _merge_extracted(result: Dict[str, List[Dict[str, Any]]], extracted: Dict[str, Any]) -> None:
+        """
+        Merge one transcript's extraction into the combined result.
+        
+        Args:
+            result: Combined result to extend in place
+            extracted: Items extracted from a single transcript
+        """
+        for category in result.keys():
+            if category in extracted:
+                result[category].extend(extracted[category])
+    
     def _extract_with_llm(self, content: str, transcript_id: str, transcript: Dict[str, Any] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
         Use LLM to extract structured information from transcript content.
@@ -89,28 +620,15 @@ class ItemExtractor:
         Returns:
             Dictionary with categories of extracted items
         """
-        system_prompt = """
-        You are an AI assistant that extracts actionable items from voice transcripts.
-        Analyze the following transcript and extract:
-        
-        1. Tasks: Any actions that need to be done, with title, description, priority, due date, and project.
-        2. Meetings: Any mentioned meetings, with title, date, time, participants, and agenda.
-        3. Projects: Any project references, with name, description, and timeline.
-        4. Research: Any research topics or information needs.
-        5. Messages: Any messages that need to be sent to specific people.
-        
-        Format your response as a JSON object with these categories.
-        For dates, use ISO format (YYYY-MM-DD) and extract them if mentioned.
-        If a date is relative (e.g., "next Monday"), convert it appropriately based on today's date.
-        If priority is not explicitly mentioned, infer it from the context as "high", "medium", or "low".
-        
-        Today's date is: {today}
-        """
-        
-        user_prompt = f"Transcript content: {content}"
+        cache_key = self._cache_key(content)
+        cached = self._cached_extractions([cache_key]).get(cache_key)
+        if cached is not None:
+            try:
+                return self._parse_extraction(cached, transcript_id, transcript)
+            except ValueError:
+                logger.warning(f"Ignoring unreadable cached extraction for transcript {transcript_id}")
         
-        today = datetime.now().strftime("%Y-%m-%d")
-        system_prompt = system_prompt.format(today=today)
+        system_prompt, user_prompt = self._build_prompts(content)
         
         try:
             if self.llm_provider == "openai":
@@ -127,7 +645,7 @@ class ItemExtractor:
             elif self.llm_provider == "anthropic":
                 response = self.client.messages.create(
                     model=self.llm_model,
-                    system=system_prompt,
+                    system=self._anthropic_system(system_prompt),
                     messages=[
                         {"role": "user", "content": user_prompt}
                     ]
@@ -138,26 +656,177 @@ class ItemExtractor:
                 logger.error(f"Unsupported LLM provider: {self.llm_provider}")
                 return {}
             
-            # Parse the JSON
-            extracted_data = json.loads(extraction_json)
-            
-            # Add transcript ID and item IDs to each item
-            for category, items in extracted_data.items():
-                for item in items:
-                    item["transcript_id"] = transcript_id
-                    item["item_id"] = str(uuid.uuid4())
-
-                    # Add transcript_details to each item if available in the transcript
-                    # This ensures the details are passed through to Notion
-                    if transcript and "transcript_details" in transcript:
-                        item["transcript_details"] = transcript.get("transcript_details", {})
-            
+            extracted_data = self._parse_extraction(extraction_json, transcript_id, transcript)
+            self._store_extraction(cache_key, extraction_json)
             return extracted_data
                 
         except Exception as e:
             logger.error(f"Error in LLM extraction: {e}")
             return {}
     
+    async def _fetch_extraction_async(self, client: Any, cache_key: bytes, content: str) -> Tuple[Optional[str], bool]:
+        """
+        Get the raw extraction for transcript content, from the cache or the async provider client.
+        
+        Args:
+            client: Async provider client for the current run
+            cache_key: Cache key from _cache_key for the content
+            content: Transcript text content
+            
+        Returns:
+            Tuple of (extraction JSON or None if the request failed, whether it was freshly requested)
+        """
+        cached = self._cached_extractions([cache_key]).get(cache_key)
+        if cached is not None:
+            try:
+                json.loads(cached)
+                return cached, False
+            except ValueError:
+                logger.warning("Ignoring unreadable cached extraction")
+        
+        system_prompt, user_prompt = self._build_prompts(content)
+        
+        try:
+            if self.llm_provider == "openai":
+                response = await client.chat.completions.create(
+                    model=self.llm_model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    response_format={"type": "json_object"}
+                )
+                return response.choices[0].message.content.strip(), True
+                    
+            elif self.llm_provider == "anthropic":
+                response = await client.messages.create(
+                    model=self.llm_model,
+                    system=self._anthropic_system(system_prompt),
+                    messages=[
+                        {"role": "user", "content": user_prompt}
+                    ]
+                )
+                return response.content[0].text.strip(), True
+                
+            else:
+                logger.error(f"Unsupported LLM provider: {self.llm_provider}")
+                return None, False
+                
+        except Exception as e:
+            logger.error(f"Error in LLM extraction: {e}")
+            return None, False
+    
+    def _cached_extractions(self, keys: Iterable[bytes]) -> Dict[bytes, str]:
+        """
+        Look up cached extractions, using the entries preloaded for this run if any.
+        
+        Args:
+            keys: Cache keys from _cache_key
+            
+        Returns:
+            Dictionary mapping the keys that were found to their raw JSON responses
+        """
+        if self._prefetched is not None:
+            return {key: self._prefetched[key] for key in keys if key in self._prefetched}
+        return self.cache.get_many(keys)
+    
+    def _store_extraction(self, key: bytes, extraction_json: str) -> None:
+        """
+        Record an extraction, deferring the write while an extract_items run is active.
+        
+        Args:
+            key: Cache key from _cache_key
+            extraction_json: Raw JSON response returned by the LLM
+        """
+        if self._prefetched is not None:
+            # Later transcripts in the same run with identical content reuse this response
+            self._prefetched[key] = extraction_json
+            self._unsaved.append((key, extraction_json))
+        else:
+            self.cache.set(key, extraction_json)
+    
+    def _cache_key(self, content: str) -> bytes:
+        """
+        Build the extraction cache key for transcript content.
+        
+        Args:
+            content: Transcript text content
+            
+        Returns:
+            Cache key for the extraction
+        """
+        return ExtractionCache.make_key(self.llm_provider, self.llm_model, PROMPT_VERSION, content)
+    
+    @staticmethod
+    def _build_prompts(content: str) -> Tuple[str, str]:
+        """
+        Build the system and user prompts for an extraction request.
+        
+        Args:
+            content: Transcript text content
+            
+        Returns:
+            Tuple of (system prompt, user prompt)
+        """
+        return _SYSTEM_PROMPT, f"Transcript content: {content}"
+    
+    @staticmethod
+    def _anthropic_system(system_prompt: str) -> List[Dict[str, Any]]:
+        """
+        Wrap the system prompt as a cacheable Anthropic system block.
+        
+        The prompt is identical for every request, so marking it with
+        cache_control lets repeated calls reuse the cached prefix. OpenAI
+        caches identical prefixes automatically.
+        
+        Args:
+            system_prompt: Static system prompt
+            
+        Returns:
+            System content blocks for the Messages API
+        """
+        return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+    
+    def _parse_extraction(self, extraction_json: str, transcript_id: str, transcript: Dict[str, Any] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Parse the LLM response, resolve relative dates and annotate each item with its source.
+        
+        Args:
+            extraction_json: JSON text returned by the LLM
+            transcript_id: ID of the transcript for reference
+            transcript: Full transcript object including transcript_details
+            
+        Returns:
+            Dictionary with categories of extracted items
+        """
+        extracted_data = json.loads(extraction_json)
+        
+        # Add transcript ID and item IDs to each item
+        for category, items in extracted_data.items():
+            for item in items:
+                item["transcript_id"] = transcript_id
+                item["item_id"] = str(uuid.uuid4())
+
+                # The LLM leaves relative dates verbatim; resolve them deterministically.
+                # Phrases that can't be resolved are dropped, since Notion rejects
+                # anything but ISO dates and the transformer fills in defaults.
+                for field in _DATE_FIELDS:
+                    value = item.get(field)
+                    if isinstance(value, str) and value:
+                        resolved = self._estimate_date(value)
+                        if resolved:
+                            item[field] = resolved
+                        else:
+                            logger.debug(f"Dropping unresolved {field} {value!r} from transcript {transcript_id}")
+                            del item[field]
+
+                # Add transcript_details to each item if available in the transcript
+                # This ensures the details are passed through to Notion
+                if transcript and "transcript_details" in transcript:
+                    item["transcript_details"] = transcript.get("transcript_details", {})
+        
+        return extracted_data
+    
     def _estimate_date(self, date_text: str) -> Optional[str]:
         """
         Convert relative date references to ISO format.
@@ -168,30 +837,5 @@ class ItemExtractor:
         Returns:
             ISO format date string or None if parsing fails
         """
-        today = datetime.now()
-        
-        # Common relative date mappings
-        if "today" in date_text.lower():
-            return today.strftime("%Y-%m-%d")
-        elif "tomorrow" in date_text.lower():
-            return (today + timedelta(days=1)).strftime("%Y-%m-%d")
-        elif "next week" in date_text.lower():
-            return (today + timedelta(days=7)).strftime("%Y-%m-%d")
-        elif "next month" in date_text.lower():
-            # Simple approximation
-            if today.month == 12:
-                next_month = datetime(today.year + 1, 1, 1)
-            else:
-                next_month = datetime(today.year, today.month + 1, 1)
-            return next_month.strftime("%Y-%m-%d")
-        
-        # Weekday references
-        weekdays = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-        for i, day in enumerate(weekdays):
-            if day in date_text.lower():
-                days_ahead = i - today.weekday()
-                if days_ahead <= 0:  # Target day already happened this week
-                    days_ahead += 7
-                return (today + timedelta(days=days_ahead)).strftime("%Y-%m-%d")
-        
-        return None
\ No newline at end of file
+        # Keyed on today's ordinal so cached answers expire at midnight
+        return _resolve_date(date_text.strip().lower(), date.today().toordinal())
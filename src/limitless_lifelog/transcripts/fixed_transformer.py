@@ -310,10 +310,11 @@ class DataTransformer:
             project_type = None
             if transcript_details and "action_keywords" in transcript_details:
                 project_keywords = keywords_config.get_project_category_keywords()
+                action_keywords = {k.lower() for k in transcript_details.get("action_keywords", [])}
                 
                 for proj_type, keywords in project_keywords.items():
                     for keyword in keywords:
-                        if keyword in [k.lower() for k in transcript_details.get("action_keywords", [])]:
+                        if keyword in action_keywords:
                             project_type = proj_type
                             break
                     if project_type:
@@ -475,10 +476,11 @@ class DataTransformer:
 
             # Try to infer project from keywords using configuration
             project_keywords = keywords_config.get_project_category_keywords()
+            action_keywords = {k.lower() for k in transcript_details.get("action_keywords", [])}
 
             for proj, keywords in project_keywords.items():
                 for keyword in keywords:
-                    if keyword in [k.lower() for k in transcript_details.get("action_keywords", [])]:
+                    if keyword in action_keywords:
                         project = proj
                         break
                 if project:
@@ -626,10 +628,11 @@ class DataTransformer:
 
             # Try to infer project from keywords using configuration
             project_keywords = keywords_config.get_project_category_keywords()
+            action_keywords = {k.lower() for k in transcript_details.get("action_keywords", [])}
 
             for proj, keywords in project_keywords.items():
                 for keyword in keywords:
-                    if keyword in [k.lower() for k in transcript_details.get("action_keywords", [])]:
+                    if keyword in action_keywords:
                         project = proj
                         break
                 if project:
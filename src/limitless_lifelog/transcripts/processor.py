@@ -3,12 +3,39 @@ Transcript processing module for Limitless Lifelog.
 """
 
 import os
-import json
 import glob
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import BinaryIO, List, Dict, Any, Iterator, Optional, Tuple
+import orjson
 from loguru import logger
 
+from ..utils.client_pool import get_openai_client, get_anthropic_client
+from ..utils.keywords_config import KeywordsConfig
+from ..utils.keyword_scanner import KeywordScanner
+
+try:
+    import ijson
+except ImportError:  # Optional: pip install -e ".[streaming]"
+    ijson = None
+
+# Errors raised for malformed transcript files
+_JSON_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+
+# Special keywords that need context extraction
+_SPECIAL_KEYWORDS = ("TB", "TeeBee")
+
+# Thread pool sizes for writing archive files and loading transcript files
+_MAX_ARCHIVE_WORKERS = 8
+_MAX_LOAD_WORKERS = 32
+
+# Append-only archive index (one {"id", "path"} record per line) and its JSON predecessor
+_INDEX_FILENAME = "transcript_index.jsonl"
+_LEGACY_INDEX_FILENAME = "transcript_index.json"
+
+
 class TranscriptProcessor:
     """
     Handles transcript processing, filtering, and summarization.
@@ -29,6 +56,41 @@ class TranscriptProcessor:
         self.llm_model = llm_model
         self.archive_dir = "./transcripts_archive"  # Default archive directory
         self.keywords_config_path = keywords_config_path
+        self.pretty_archive = False  # Indent archive files for human reading
+
+        # Keywords are static for the processor's lifetime, so load and index them once.
+        # Each keyword is stored alongside its lowercased form for the scan lookups.
+        keywords_config = KeywordsConfig(keywords_config_path)
+        self._action_keywords = self._with_lower(keywords_config.get_action_keywords())
+        self._date_keywords = self._with_lower(keywords_config.get_date_keywords())
+        self._priority_keywords = {
+            priority: self._with_lower(keywords)
+            for priority, keywords in keywords_config.get_priority_keywords().items()
+        }
+        self._status_keywords = {
+            status: self._with_lower(keywords)
+            for status, keywords in keywords_config.get_status_keywords().items()
+        }
+
+        all_keywords = list(self._action_keywords) + list(self._date_keywords)
+        for keywords in self._priority_keywords.values():
+            all_keywords.extend(keywords)
+        for keywords in self._status_keywords.values():
+            all_keywords.extend(keywords)
+        self._keyword_scanner = KeywordScanner([keyword_lower for _, keyword_lower in all_keywords])
+
+    @staticmethod
+    def _with_lower(keywords: List[str]) -> Tuple[Tuple[str, str], ...]:
+        """
+        Pair each keyword with its lowercased form.
+
+        Args:
+            keywords: Keywords as configured
+
+        Returns:
+            Tuple of (keyword, lowercased keyword) pairs
+        """
+        return tuple((keyword, keyword.lower()) for keyword in keywords)
 
     def set_archive_dir(self, directory: str):
         """
@@ -39,17 +101,20 @@ class TranscriptProcessor:
         """
         self.archive_dir = directory
         logger.debug(f"Set archive directory to: {directory}")
-        
-        # Initialize appropriate client based on provider
+
+    @cached_property
+    def client(self) -> Any:
+        """
+        LLM client for the configured provider, created on first use.
+
+        Returns None for unsupported providers.
+        """
         if self.llm_provider == "openai":
-            import openai
-            self.client = openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-        elif self.llm_provider == "anthropic":
-            import anthropic
-            self.client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-        else:
-            logger.error(f"Unsupported LLM provider: {self.llm_provider}")
-            self.client = None
+            return get_openai_client()
+        if self.llm_provider == "anthropic":
+            return get_anthropic_client()
+        logger.error(f"Unsupported LLM provider: {self.llm_provider}")
+        return None
     
     def filter_transcripts(self, transcripts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -63,22 +128,12 @@ class TranscriptProcessor:
         """
         filtered_transcripts = []
 
-        # Load configurable keywords from config
-        from ..utils.keywords_config import KeywordsConfig
+        action_keywords = self._action_keywords
+        priority_keywords = self._priority_keywords
+        status_keywords = self._status_keywords
+        date_keywords = self._date_keywords
+        special_keywords = _SPECIAL_KEYWORDS
 
-        # Initialize keywords configuration with custom path if provided
-        keywords_config = KeywordsConfig(self.keywords_config_path)
-
-        # Get keywords from configuration
-        action_keywords = keywords_config.get_action_keywords()
-        priority_keywords = keywords_config.get_priority_keywords()
-        status_keywords = keywords_config.get_status_keywords()
-        date_keywords = keywords_config.get_date_keywords()
-
-        # Special keywords that need context extraction
-        special_keywords = ["TB", "TeeBee"]
-
-        from datetime import datetime
         current_date = datetime.now().strftime("%Y-%m-%d")
 
         for transcript in transcripts:
@@ -99,6 +154,14 @@ class TranscriptProcessor:
             has_action_keywords = False
             tb_context = None
 
+            # Locate every keyword in a single scan; lookups below are dict hits.
+            # Context windows are clamped only at the start: slicing already clamps the end.
+            content_lower = content.lower()
+            keyword_positions = self._keyword_scanner.scan(content_lower)
+
+            # Mirrors transcript_details["keywords"] for constant-time membership checks
+            seen_keywords = set()
+
             # Add structured details to transcript with much more contextual information
             transcript_details = {
                 "content": content,
@@ -118,14 +181,12 @@ class TranscriptProcessor:
 
             # Check for priority indicators in content
             for priority, keywords in priority_keywords.items():
-                for keyword in keywords:
-                    if keyword.lower() in content.lower():
+                for keyword, keyword_lower in keywords:
+                    idx = keyword_positions.get(keyword_lower)
+                    if idx is not None:
                         # Find the keyword in context
-                        keyword_lower = keyword.lower()
-                        content_lower = content.lower()
-                        idx = content_lower.find(keyword_lower)
-                        start = max(0, idx - 15)
-                        end = min(len(content), idx + len(keyword) + 15)
+                        start = idx - 15 if idx > 15 else 0
+                        end = idx + len(keyword) + 15
                         keyword_context = content[start:end]
 
                         transcript_details["priority_indicators"].append({
@@ -139,19 +200,18 @@ class TranscriptProcessor:
                             transcript_details["importance_level"] = "high"
 
                         # Add to general keywords list
-                        if keyword not in transcript_details["keywords"]:
+                        if keyword not in seen_keywords:
+                            seen_keywords.add(keyword)
                             transcript_details["keywords"].append(keyword)
 
             # Check for status indicators in content
             for status, keywords in status_keywords.items():
-                for keyword in keywords:
-                    if keyword.lower() in content.lower():
+                for keyword, keyword_lower in keywords:
+                    idx = keyword_positions.get(keyword_lower)
+                    if idx is not None:
                         # Find the keyword in context
-                        keyword_lower = keyword.lower()
-                        content_lower = content.lower()
-                        idx = content_lower.find(keyword_lower)
-                        start = max(0, idx - 15)
-                        end = min(len(content), idx + len(keyword) + 15)
+                        start = idx - 15 if idx > 15 else 0
+                        end = idx + len(keyword) + 15
                         keyword_context = content[start:end]
 
                         transcript_details["status_indicators"].append({
@@ -161,19 +221,16 @@ class TranscriptProcessor:
                         })
 
                         # Add to general keywords list
-                        if keyword not in transcript_details["keywords"]:
+                        if keyword not in seen_keywords:
+                            seen_keywords.add(keyword)
                             transcript_details["keywords"].append(keyword)
 
-            # Date keywords already loaded from configuration
-
-            for date_keyword in date_keywords:
-                if date_keyword.lower() in content.lower():
+            for date_keyword, date_keyword_lower in date_keywords:
+                idx = keyword_positions.get(date_keyword_lower)
+                if idx is not None:
                     # Find the keyword in context
-                    keyword_lower = date_keyword.lower()
-                    content_lower = content.lower()
-                    idx = content_lower.find(keyword_lower)
-                    start = max(0, idx - 15)
-                    end = min(len(content), idx + len(date_keyword) + 15)
+                    start = idx - 15 if idx > 15 else 0
+                    end = idx + len(date_keyword) + 15
                     date_context = content[start:end]
 
                     transcript_details["date_indicators"].append({
@@ -183,17 +240,17 @@ class TranscriptProcessor:
                     })
 
                     # Add to general keywords list
-                    if date_keyword not in transcript_details["keywords"]:
+                    if date_keyword not in seen_keywords:
+                        seen_keywords.add(date_keyword)
                         transcript_details["keywords"].append(date_keyword)
 
             # Special action keywords collection will store all found keywords for analysis
             found_action_keywords = []
 
-            for keyword in action_keywords:
-                keyword_lower = keyword.lower()
-                content_lower = content.lower()
+            for keyword, keyword_lower in action_keywords:
+                idx = keyword_positions.get(keyword_lower)
 
-                if keyword_lower in content_lower:
+                if idx is not None:
                     has_action_keywords = True
                     logger.debug(f"Found action keyword '{keyword}' in transcript {transcript_id}")
 
@@ -201,15 +258,15 @@ class TranscriptProcessor:
                     found_action_keywords.append(keyword)
 
                     # Add to general keywords list
-                    if keyword not in transcript_details["keywords"]:
+                    if keyword not in seen_keywords:
+                        seen_keywords.add(keyword)
                         transcript_details["keywords"].append(keyword)
 
                     # Special handling for TB/TeeBee markers
                     if keyword in special_keywords:
                         # Extract context (100 chars before and after)
-                        idx = content_lower.find(keyword_lower)
-                        start = max(0, idx - 150)
-                        end = min(len(content), idx + len(keyword) + 150)
+                        start = idx - 150 if idx > 150 else 0
+                        end = idx + len(keyword) + 150
 
                         # Store context with the TB marker highlighted
                         context_before = content[start:idx]
@@ -236,9 +293,8 @@ class TranscriptProcessor:
 
                     # Extract context around any action keyword (not just special ones)
                     # This provides better context for all actionable items
-                    idx = content_lower.find(keyword_lower)
-                    start = max(0, idx - 100)
-                    end = min(len(content), idx + len(keyword) + 100)
+                    start = idx - 100 if idx > 100 else 0
+                    end = idx + len(keyword) + 100
                     keyword_context = content[start:end]
 
                     # Only add if not already set by TB/TeeBee marker
@@ -286,28 +342,29 @@ class TranscriptProcessor:
         Args:
             transcripts: List of transcript dictionaries
         """
-        import os
-        import json
-        from datetime import datetime
-        from pathlib import Path
-
         # Create an archive directory if it doesn't exist
         archive_dir = Path(self.archive_dir)
         archive_dir.mkdir(exist_ok=True)
 
-        # Process each transcript
+        # Read the clock once for the whole batch
+        now = datetime.now()
+        timestamp = now.strftime("%H%M%S")
+        archived_at = now.isoformat()
+        date_dir = None
+
+        # Collect the files to write, then write them concurrently
+        work = []
         for transcript in transcripts:
             # Only archive transcripts with extracted markers
             if "extracted_markers" in transcript and transcript["extracted_markers"]:
                 transcript_id = transcript.get("id", "unknown")
 
                 # Create a dated directory structure
-                today = datetime.now().strftime("%Y-%m-%d")
-                date_dir = archive_dir / today
-                date_dir.mkdir(exist_ok=True)
+                if date_dir is None:
+                    date_dir = archive_dir / now.strftime("%Y-%m-%d")
+                    date_dir.mkdir(exist_ok=True)
 
                 # Create filename with timestamp
-                timestamp = datetime.now().strftime("%H%M%S")
                 filename = f"{timestamp}_{transcript_id}_TB.json"
 
                 # Prepare archive data
@@ -315,18 +372,16 @@ class TranscriptProcessor:
                     "transcript_id": transcript_id,
                     "content": transcript.get("content", ""),
                     "extracted_markers": transcript.get("extracted_markers", []),
-                    "archived_at": datetime.now().isoformat(),
+                    "archived_at": archived_at,
                     "metadata": {k: v for k, v in transcript.items() if k not in ["content", "extracted_markers"]}
                 }
+                work.append((transcript_id, date_dir / filename, archive_data))
 
-                # Write to file
-                file_path = date_dir / filename
-                try:
-                    with open(file_path, 'w') as f:
-                        json.dump(archive_data, f, indent=2)
-                    logger.info(f"Archived transcript with TB markers to {file_path}")
-                except Exception as e:
-                    logger.error(f"Failed to archive transcript {transcript_id}: {e}")
+        for transcript_id, file_path, error in self._write_archive_files(work):
+            if error is None:
+                logger.info(f"Archived transcript with TB markers to {file_path}")
+            else:
+                logger.error(f"Failed to archive transcript {transcript_id}: {error}")
 
     def archive_all_transcripts(self, transcripts: List[Dict[str, Any]]) -> Dict[str, str]:
         """
@@ -341,11 +396,6 @@ class TranscriptProcessor:
         Returns:
             Dictionary mapping transcript IDs to their archive paths
         """
-        import os
-        import json
-        from datetime import datetime
-        from pathlib import Path
-
         # Create archive directories
         archive_dir = Path(self.archive_dir)
         archive_dir.mkdir(exist_ok=True)
@@ -354,21 +404,17 @@ class TranscriptProcessor:
         transcripts_dir = archive_dir / "transcripts"
         transcripts_dir.mkdir(exist_ok=True)
 
-        # Create an index file to track what's been downloaded
-        index_file = archive_dir / "transcript_index.json"
-
-        # Load existing index if it exists
-        transcript_index = {}
-        if index_file.exists():
-            try:
-                with open(index_file, 'r') as f:
-                    transcript_index = json.load(f)
-            except json.JSONDecodeError:
-                logger.error(f"Could not parse transcript index, recreating")
-                transcript_index = {}
+        # Load the index that tracks what's been downloaded
+        transcript_index = self.load_transcript_index()
 
         # Track which files we processed in this run
         processed_files = {}
+        work = []
+
+        # Read the clock once for the whole batch
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d-%H%M%S")
+        archived_at = now.isoformat()
 
         # Process each transcript
         for transcript in transcripts:
@@ -381,7 +427,6 @@ class TranscriptProcessor:
                 continue
 
             # Create filename based on ID and date
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
             filename = f"{timestamp}_{transcript_id}.json"
             file_path = transcripts_dir / filename
 
@@ -393,31 +438,125 @@ class TranscriptProcessor:
                 "transcript_id": transcript_id,
                 "content": transcript.get("content", ""),
                 "transcript_details": transcript_details,
-                "archived_at": datetime.now().isoformat(),
+                "archived_at": archived_at,
                 "metadata": {k: v for k, v in transcript.items()
                           if k not in ["content", "transcript_details"]}
             }
+            work.append((transcript_id, file_path, archive_data))
 
-            # Write to file
-            try:
-                with open(file_path, 'w') as f:
-                    json.dump(archive_data, f, indent=2)
+        new_records = []
+        for transcript_id, file_path, error in self._write_archive_files(work):
+            if error is None:
                 logger.info(f"Archived transcript {transcript_id} to {file_path}")
-
-                # Update index
-                transcript_index[transcript_id] = str(file_path)
                 processed_files[transcript_id] = str(file_path)
+                new_records.append(orjson.dumps({"id": transcript_id, "path": str(file_path)}) + b"\n")
+            else:
+                logger.error(f"Failed to archive transcript {transcript_id}: {error}")
+
+        # Append only the new entries to the index
+        if new_records:
+            try:
+                with open(archive_dir / _INDEX_FILENAME, "ab") as f:
+                    f.writelines(new_records)
             except Exception as e:
-                logger.error(f"Failed to archive transcript {transcript_id}: {e}")
+                logger.error(f"Failed to save transcript index: {e}")
+
+        return processed_files
+
+    def load_transcript_index(self) -> Dict[str, str]:
+        """
+        Load the archive index of already archived transcripts.
+
+        An index in the older single-JSON format is migrated on first load, and
+        the log is compacted once superseded records outnumber live ones.
+
+        Returns:
+            Dictionary mapping transcript IDs to their archive paths
+        """
+        archive_dir = Path(self.archive_dir)
+        index_file = archive_dir / _INDEX_FILENAME
+        transcript_index = {}
 
-        # Save updated index
+        if index_file.exists():
+            record_count = 0
+            try:
+                with open(index_file, "rb") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            record = orjson.loads(line)
+                            transcript_index[record["id"]] = record["path"]
+                            record_count += 1
+                        except (orjson.JSONDecodeError, KeyError, TypeError):
+                            logger.warning(f"Skipping unreadable entry in transcript index {index_file}")
+            except OSError as e:
+                logger.error(f"Could not read transcript index: {e}")
+                return {}
+
+            if record_count > 2 * len(transcript_index):
+                self._rewrite_transcript_index(index_file, transcript_index)
+            return transcript_index
+
+        legacy_file = archive_dir / _LEGACY_INDEX_FILENAME
+        if legacy_file.exists():
+            try:
+                transcript_index = orjson.loads(legacy_file.read_bytes())
+            except orjson.JSONDecodeError:
+                logger.error(f"Could not parse transcript index, recreating")
+                return {}
+            if transcript_index:
+                self._rewrite_transcript_index(index_file, transcript_index)
+
+        return transcript_index
+
+    @staticmethod
+    def _rewrite_transcript_index(index_file: Path, transcript_index: Dict[str, str]) -> None:
+        """
+        Replace the index file with one record per transcript.
+
+        Args:
+            index_file: Path of the JSONL index
+            transcript_index: Dictionary mapping transcript IDs to archive paths
+        """
+        tmp_file = index_file.with_suffix(".jsonl.tmp")
         try:
-            with open(index_file, 'w') as f:
-                json.dump(transcript_index, f, indent=2)
+            with open(tmp_file, "wb") as f:
+                f.writelines(
+                    orjson.dumps({"id": transcript_id, "path": path}) + b"\n"
+                    for transcript_id, path in transcript_index.items()
+                )
+            os.replace(tmp_file, index_file)
         except Exception as e:
-            logger.error(f"Failed to save transcript index: {e}")
+            logger.error(f"Failed to compact transcript index: {e}")
 
-        return processed_files
+    def _write_archive_files(self, work: List[Tuple[str, Path, Dict[str, Any]]]) -> List[Tuple[str, Path, Optional[Exception]]]:
+        """
+        Write archive files concurrently.
+
+        Files are written as compact JSON unless pretty_archive is set.
+
+        Args:
+            work: List of (transcript ID, file path, archive data) tuples
+
+        Returns:
+            List of (transcript ID, file path, error or None) tuples in input order
+        """
+        option = orjson.OPT_INDENT_2 if self.pretty_archive else None
+
+        def write_one(entry: Tuple[str, Path, Dict[str, Any]]) -> Tuple[str, Path, Optional[Exception]]:
+            transcript_id, file_path, archive_data = entry
+            try:
+                file_path.write_bytes(orjson.dumps(archive_data, option=option))
+                return transcript_id, file_path, None
+            except Exception as e:
+                return transcript_id, file_path, e
+
+        if len(work) <= 1:
+            return [write_one(entry) for entry in work]
+
+        with ThreadPoolExecutor(max_workers=_MAX_ARCHIVE_WORKERS) as executor:
+            return list(executor.map(write_one, work))
     
     def _check_relevance(self, transcript: Dict[str, Any]) -> bool:
         """
@@ -494,11 +633,16 @@ class TranscriptProcessor:
             
         transcripts = []
         
-        # Handle directory
+        # Handle directory; file reads release the GIL, so load files concurrently
         if Path(path).is_dir():
-            for json_file in glob.glob(os.path.join(path, "*.json")):
-                file_transcripts = self._load_transcript_file(json_file)
-                transcripts.extend(file_transcripts)
+            json_files = sorted(glob.glob(os.path.join(path, "*.json")))
+            if len(json_files) > 1:
+                with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(json_files))) as executor:
+                    for file_transcripts in executor.map(self._load_transcript_file, json_files):
+                        transcripts.extend(file_transcripts)
+            else:
+                for json_file in json_files:
+                    transcripts.extend(self._load_transcript_file(json_file))
                 
         # Handle single file
         elif Path(path).is_file():
@@ -518,21 +662,71 @@ class TranscriptProcessor:
             List of transcript dictionaries
         """
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                
-            # Handle different file formats
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict) and "transcripts" in data:
-                return data["transcripts"]
-            elif isinstance(data, dict):
-                # Single transcript in file
-                return [data]
-            else:
-                logger.warning(f"Unexpected format in {file_path}")
-                return []
-                
-        except (json.JSONDecodeError, IOError) as e:
+            return list(self.iter_transcript_file(file_path))
+        except _JSON_ERRORS + (IOError,) as e:
             logger.error(f"Error loading transcript file {file_path}: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def iter_transcript_file(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the transcripts in a JSON file.
+
+        Lists of transcripts, including a top-level "transcripts" list, are
+        streamed with ijson when it is installed so large exports don't have to
+        be held in memory at once.
+
+        Args:
+            file_path: Path to JSON file
+
+        Yields:
+            Transcript dictionaries
+
+        Raises:
+            ValueError: If the file is not valid JSON
+            IOError: If the file cannot be read
+        """
+        with open(file_path, 'rb') as f:
+            yield from self._iter_transcript_stream(f, file_path)
+
+    @staticmethod
+    def _iter_transcript_stream(stream: BinaryIO, source: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the transcripts in an open binary JSON stream.
+
+        Args:
+            stream: Seekable binary stream positioned at the start of the JSON
+            source: Name of the stream's origin, used in log messages
+
+        Yields:
+            Transcript dictionaries
+
+        Raises:
+            ValueError: If the stream is not valid JSON
+        """
+        if ijson is not None:
+            first_char = stream.read(64).lstrip()[:1]
+            stream.seek(0)
+            if first_char == b'[':
+                yield from ijson.items(stream, 'item', use_float=True)
+                return
+            if first_char == b'{':
+                streamed = False
+                for transcript in ijson.items(stream, 'transcripts.item', use_float=True):
+                    streamed = True
+                    yield transcript
+                if streamed:
+                    return
+                stream.seek(0)
+
+        data = orjson.loads(stream.read())
+
+        # Handle different file formats
+        if isinstance(data, list):
+            yield from data
+        elif isinstance(data, dict) and "transcripts" in data:
+            yield from data["transcripts"]
+        elif isinstance(data, dict):
+            # Single transcript in file
+            yield data
+        else:
+            logger.warning(f"Unexpected format in {source}")
@@ -2,9 +2,168 @@
 Transform extracted items into Notion-compatible format.
 """
 
-from typing import Dict, List, Any
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, FrozenSet, Iterable, List, Any, Optional, Tuple
 from loguru import logger
 
+from ..utils.keywords_config import KeywordsConfig
+from ..utils.keyword_scanner import KeywordScanner
+
+# Item types whose descriptor tags are looked up during tag generation
+_DESCRIPTOR_TAG_TYPES = ("task", "project", "meeting", "research", "todo")
+
+# Notion databases whose existing tags are loaded at startup
+_NOTION_DATABASE_TYPES = ("tasks", "projects", "todo", "lifelog")
+
+# Maximum number of tags attached to a Notion entry
+_MAX_TAGS = 10
+
+# Fallback tags for items that end up with fewer than five tags
+_DEFAULT_TAGS = {
+    "task": ("Task", "Action", "Voice", "Transcript"),
+    "project": ("Project", "Initiative", "Planning", "Voice", "Transcript"),
+    "meeting": ("Meeting", "Discussion", "Event", "Voice", "Transcript"),
+    "research": ("Research", "Analysis", "Investigation", "Voice", "Transcript"),
+}
+
+# Display names for the priority values the extractor commonly emits; anything else is capitalized
+_PRIORITY_NAMES = {
+    raw: raw.capitalize()
+    for value in ("high", "medium", "low", "urgent", "none")
+    for raw in (value, value.capitalize(), value.upper())
+}
+
+# Priority options of the Todo database
+_TODO_PRIORITIES = {"high": "High", "medium": "Medium", "low": "Low"}
+
+# Task statuses that tick the todo checkbox
+_DONE_STATES = frozenset(("done", "completed", "finished"))
+
+# Message statuses that tick the todo checkbox
+_SENT_STATES = frozenset(("sent", "completed", "done"))
+
+# Message urgency values mapped to todo priorities; anything else is Medium
+_URGENCY_TO_PRIORITY = {
+    "high": "High",
+    "urgent": "High",
+    "important": "High",
+    "low": "Low",
+    "whenever": "Low",
+}
+
+# Item fields holding dates that are normalised before transforming
+_DATE_FIELDS = frozenset(("due_date", "created_date", "timeline", "date", "follow_up_date", "meeting_date"))
+
+# Stand-in for missing transcript details; shared by every entry, so never mutate it
+_EMPTY_DICT: Dict[str, Any] = {}
+
+# Phrases that show a task description already states its purpose
+_PURPOSE_RE = re.compile(r'purpose|goal|aim|objective|intention')
+
+# Phrases that introduce a blocker in a task description
+_BLOCKED_RE = re.compile(r'blocked by|depends on|waiting for|dependent on|blocked until')
+
+# Splits transcript content into words for tag suggestions
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Zero-padded YYYY-MM-DD dates, which _parse_ymd reads without strptime
+_YMD_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def _title(content: str) -> Dict[str, Any]:
+    """Build a Notion title property value."""
+    return {"title": [{"text": {"content": content}}]}
+
+
+def _rich_text(content: str) -> Dict[str, Any]:
+    """Build a Notion rich text property value."""
+    return {"rich_text": [{"text": {"content": content}}]}
+
+
+def _select(name: str) -> Dict[str, Any]:
+    """Build a Notion select property value."""
+    return {"select": {"name": name}}
+
+
+def _status(name: str) -> Dict[str, Any]:
+    """Build a Notion status property value."""
+    return {"status": {"name": name}}
+
+
+def _date(start: str) -> Dict[str, Any]:
+    """Build a Notion date property value with a start date."""
+    return {"date": {"start": start}}
+
+
+def _multi_select(names: Iterable[str]) -> Dict[str, Any]:
+    """Build a Notion multi-select property value."""
+    return {"multi_select": [{"name": name} for name in names]}
+
+
+def _section(header: str, body: Any) -> str:
+    """Format a markdown description section, or return an empty string when there is no body."""
+    return f"## {header}\n{body}" if body else ""
+
+
+def _priority(item: Dict[str, Any]) -> str:
+    """Get the display priority of an item, defaulting to Medium."""
+    raw = item.get("priority", "medium")
+    name = _PRIORITY_NAMES.get(raw)
+    return name if name is not None else raw.capitalize()
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to limit characters, appending an ellipsis when anything was cut."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def _parse_ymd(text: str) -> date:
+    """
+    Parse a YYYY-MM-DD string, accepting the same inputs as strptime.
+
+    Zero-padded dates are parsed by slicing, avoiding the cost of strptime;
+    anything else, such as 2024-5-7, is left to strptime.
+
+    Raises:
+        ValueError: If the text is not a valid date
+    """
+    if _YMD_RE.fullmatch(text):
+        return date(int(text[0:4]), int(text[5:7]), int(text[8:10]))
+    return datetime.strptime(text, "%Y-%m-%d").date()
+
+
+@lru_cache(maxsize=256)
+def _analyze_content(content: str) -> Tuple[str, FrozenSet[str], Tuple[Tuple[str, int], ...]]:
+    """
+    Lowercase and tokenize transcript content for tag generation.
+
+    Every item extracted from a transcript carries the same content, so the
+    result is cached per content string.
+
+    Args:
+        content: Transcript content
+
+    Returns:
+        Tuple of (lowercased content, set of words, 20 most common words with counts)
+    """
+    content_lower = content.lower()
+    words = _WORD_RE.findall(content_lower)
+    return content_lower, frozenset(words), tuple(Counter(words).most_common(20))
+
+
+def _with_source(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the source transcript ID to an entry in a visible field."""
+    transcript_id = entry.get("transcript_id")
+    if transcript_id and "Source" not in entry["properties"]:
+        entry["properties"]["Source"] = _rich_text(f"Transcript ID: {transcript_id}")
+    return entry
+
+
 class DataTransformer:
     """
     Transforms extracted items into formats compatible with Notion databases.
@@ -20,10 +179,8 @@ class DataTransformer:
             notion_client: Optional Notion client for retrieving existing tags
             keywords_config_path: Path to custom keywords configuration file
         """
-        from datetime import datetime, timedelta
-        self.current_date = datetime.now().strftime("%Y-%m-%d")
-        # Default projected completion is 7 days from now
-        self.default_due_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+        # Sets current_date and default_due_date (projected completion 7 days from now)
+        self._refresh_default_dates()
 
         # Default empty values
         self.empty_value_handling = "default_date"  # options: "default_date", "remove", "null"
@@ -37,41 +194,80 @@ class DataTransformer:
 
         # Store keywords config path
         self.keywords_config_path = keywords_config_path
+
+        # Load keywords config once and keep the lookups used for every item
+        self._keywords_config = KeywordsConfig(keywords_config_path)
+        self._excluded_words = self._keywords_config.get_excluded_words_set()
+        self._project_keyword_sets = {
+            project: frozenset(keyword.lower() for keyword in keywords)
+            for project, keywords in self._keywords_config.get_project_category_keywords().items()
+        }
+        self._descriptor_tags_by_type = {
+            item_type: tuple(self._keywords_config.get_descriptor_tags(item_type))
+            for item_type in _DESCRIPTOR_TAG_TYPES
+        }
         
         # Store Notion client
         self.notion_client = notion_client
         
         # Initialize existing tags from Notion
         self.existing_tags = {}
+
+        # Merged existing tags per database type, built on first use
+        self._existing_tags_cache: Dict[str, List[str]] = {}
+
+        # Per database type: (tag, lowercased tag) pairs and a scanner for the multi-word tags
+        self._existing_tag_matchers: Dict[str, Tuple[Tuple[Tuple[str, str], ...], KeywordScanner]] = {}
         
         # Load existing tags from Notion if client is available
         if self.notion_client:
             self._load_existing_tags()
     
+    def _refresh_default_dates(self) -> None:
+        """
+        Read the clock once and derive the default dates used by the transforms.
+
+        Called at the start of every batch, so a long-lived transformer does not
+        keep using yesterday's dates after midnight.
+        """
+        self._today = datetime.now()
+        self._today_str = self._today.strftime("%Y-%m-%d")
+        self._week_str = (self._today + timedelta(days=7)).strftime("%Y-%m-%d")
+        self._quarter_str = (self._today + timedelta(days=90)).strftime("%Y-%m-%d")
+        self.current_date = self._today_str
+        self.default_due_date = self._week_str
+
     def _load_existing_tags(self) -> None:
         """
         Load existing tags from Notion databases and update the keywords.json file.
         """
         if not self.notion_client:
             return
+
+        # New tags invalidate any merged lists built so far
+        self._existing_tags_cache.clear()
+        self._existing_tag_matchers.clear()
             
-        # Load tags for each database type
-        database_types = ["tasks", "projects", "todo", "lifelog"]
-        
-        for db_type in database_types:
+        # Fetch tags for every database type concurrently
+        with ThreadPoolExecutor(max_workers=len(_NOTION_DATABASE_TYPES)) as executor:
+            futures = {
+                db_type: executor.submit(self.notion_client.get_existing_tags, db_type)
+                for db_type in _NOTION_DATABASE_TYPES
+            }
+
+        new_tags = set()
+        for db_type, future in futures.items():
             try:
-                tags = self.notion_client.get_existing_tags(db_type)
+                tags = future.result()
                 if tags:
                     self.existing_tags[db_type] = tags
-                    
-                    # Update keywords.json with new tags
-                    from ..utils.keywords_config import KeywordsConfig
-                    keywords_config = KeywordsConfig(self.keywords_config_path)
-                    keywords_config.update_existing_notion_tags(tags)
-                    
+                    new_tags.update(tags)
             except Exception as e:
-                from loguru import logger
                 logger.error(f"Error loading existing tags for {db_type}: {e}")
+
+        # Update keywords.json with the new tags in a single write
+        if new_tags:
+            self._keywords_config.update_existing_notion_tags(sorted(new_tags))
                 
     def _get_existing_tags(self, db_type: str = None) -> List[str]:
         """
@@ -83,10 +279,12 @@ class DataTransformer:
         Returns:
             List of existing tags
         """
-        # Get tags from keywords config first
-        from ..utils.keywords_config import KeywordsConfig
-        keywords_config = KeywordsConfig(self.keywords_config_path)
-        all_tags = keywords_config.get_existing_notion_tags()
+        cached = self._existing_tags_cache.get(db_type)
+        if cached is not None:
+            return cached
+
+        # Get tags from keywords config first (copied so the cached config is not modified)
+        all_tags = list(self._keywords_config.get_existing_notion_tags())
         
         # Add tags from memory if available
         if db_type and db_type in self.existing_tags:
@@ -95,8 +293,29 @@ class DataTransformer:
             for tags in self.existing_tags.values():
                 all_tags.extend(tags)
                 
-        # Remove duplicates and return
-        return sorted(list(set(all_tags)))
+        # Remove duplicates and cache
+        merged = sorted(set(all_tags))
+        self._existing_tags_cache[db_type] = merged
+        return merged
+
+    def _get_existing_tag_matcher(self, db_type: str) -> Tuple[Tuple[Tuple[str, str], ...], KeywordScanner]:
+        """
+        Get the existing tags for a database type prepared for matching against content.
+
+        Args:
+            db_type: Database type to get tags for
+
+        Returns:
+            Tuple of (tag, lowercased tag) pairs in tag order, and a scanner that finds
+            every multi-word tag in lowercased content in a single pass
+        """
+        matcher = self._existing_tag_matchers.get(db_type)
+        if matcher is None:
+            pairs = tuple((tag, tag.lower()) for tag in self._get_existing_tags(db_type))
+            # Single-word tags are matched against content tokens instead
+            scanner = KeywordScanner([lower for _, lower in pairs if not _WORD_RE.fullmatch(lower)])
+            matcher = self._existing_tag_matchers[db_type] = (pairs, scanner)
+        return matcher
             
     def transform(self, extracted_items: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -108,6 +327,9 @@ class DataTransformer:
         Returns:
             Dictionary with Notion-formatted entries grouped by database
         """
+        # Take the current time once for every item in this batch
+        self._refresh_default_dates()
+
         notion_data = {
             "tasks": [],
             "projects": [],
@@ -115,66 +337,58 @@ class DataTransformer:
             "lifelog": []
         }
 
-        # Process tasks
-        for task in extracted_items.get("tasks", []):
-            # Enrich task with transcript details
-            enriched_task = self._enrich_transcript_details(task)
-
-            notion_task = self._transform_task(enriched_task)
-            notion_data["tasks"].append(notion_task)
-
-            # Create a todo item for each task as well
-            notion_todo = self._transform_todo(enriched_task)
-            notion_data["todo"].append(notion_todo)
-
-        # Process meetings
-        for meeting in extracted_items.get("meetings", []):
-            # Enrich meeting with transcript details
-            enriched_meeting = self._enrich_transcript_details(meeting)
-
-            notion_task = self._transform_meeting_to_task(enriched_meeting)
-            notion_data["tasks"].append(notion_task)
-
-        # Process projects
-        for project in extracted_items.get("projects", []):
-            # Enrich project with transcript details
-            enriched_project = self._enrich_transcript_details(project)
-
-            notion_project = self._transform_project(enriched_project)
-            notion_data["projects"].append(notion_project)
-
-        # Process research items
-        for research in extracted_items.get("research", []):
-            # Enrich research with transcript details
-            enriched_research = self._enrich_transcript_details(research)
-
-            notion_task = self._transform_research_to_task(enriched_research)
-            notion_data["tasks"].append(notion_task)
-
-        # Process messages
-        for message in extracted_items.get("messages", []):
-            # Enrich message with transcript details
-            enriched_message = self._enrich_transcript_details(message)
+        # Each extracted category maps to one or more (transform, destination database) pairs;
+        # every task also becomes a todo item
+        plan = (
+            ("tasks", ((self._transform_task, "tasks"), (self._transform_todo, "todo"))),
+            ("meetings", ((self._transform_meeting_to_task, "tasks"),)),
+            ("projects", ((self._transform_project, "projects"),)),
+            ("research", ((self._transform_research_to_task, "tasks"),)),
+            ("messages", ((self._transform_message_to_todo, "todo"),)),
+        )
+
+        for category, transforms in plan:
+            items = extracted_items.get(category)
+            if not items:
+                continue
+
+            # Resolve the destination lists once per category rather than per item
+            outputs = [(transform_item, notion_data[db_type].append) for transform_item, db_type in transforms]
+            enrich = self._enrich_transcript_details
+            for item in items:
+                # Enrich each item with transcript details once, whatever it is transformed into
+                enriched_item = enrich(item)
+                for transform_item, append in outputs:
+                    append(transform_item(enriched_item))
 
-            notion_todo = self._transform_message_to_todo(enriched_message)
-            notion_data["todo"].append(notion_todo)
+        # Nothing was extracted, so there is nothing to log either
+        if not any(notion_data.values()):
+            return notion_data
 
         # Create lifelog entries
         lifelog_entry = self._create_lifelog_entry(extracted_items)
         if lifelog_entry:
             notion_data["lifelog"].append(lifelog_entry)
 
-        # Add source transcript information to all entries
-        for db_type, entries in notion_data.items():
-            for entry in entries:
-                if "transcript_id" in entry and "properties" in entry:
-                    # Add source transcript ID to all entries in a visible field
-                    transcript_id = entry["transcript_id"]
-                    if "Source" not in entry["properties"] and transcript_id:
-                        entry["properties"]["Source"] = {"rich_text": [{"text": {"content": f"Transcript ID: {transcript_id}"}}]}
-
         return notion_data
     
+    def transform_meetings_batch(self, meetings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Transform a batch of meetings into Notion Tasks entries.
+
+        Args:
+            meetings: List of extracted meeting items
+
+        Returns:
+            List of Notion-formatted tasks, in the same order as the meetings
+        """
+        # Take the current time once for the whole batch
+        self._refresh_default_dates()
+
+        enrich = self._enrich_transcript_details
+        transform_meeting = self._transform_meeting_to_task
+        return [transform_meeting(enrich(meeting)) for meeting in meetings]
+
     def _generate_enhanced_tags(self, item: Dict[str, Any], item_type: str, transcript_details: Dict[str, Any]) -> List[str]:
         """
         Generate enhanced tags for an item based on its content, type, and existing tags.
@@ -189,6 +403,16 @@ class DataTransformer:
         """
         # Start with any explicit tags
         tags = []
+        seen = set()  # Lowercased tags already in the list
+
+        def add(tag: str) -> bool:
+            key = tag.lower()
+            if key in seen:
+                return False
+            seen.add(key)
+            tags.append(tag)
+            return True
+
         if "tags" in item:
             if isinstance(item["tags"], list):
                 tags.extend(item["tags"])
@@ -201,88 +425,82 @@ class DataTransformer:
                 tags.extend(item["categories"])
             elif isinstance(item["categories"], str):
                 tags.extend([cat.strip() for cat in item["categories"].split(",")])
+        seen.update(tag.lower() for tag in tags)
                 
-        # Load keywords config
-        from ..utils.keywords_config import KeywordsConfig
-        keywords_config = KeywordsConfig(self.keywords_config_path)
-        
         # Get excluded words
-        excluded_words = keywords_config.get_excluded_words()
-        
+        excluded_words = self._excluded_words
+
+        # Bind the transcript fields used below once
+        details = transcript_details or _EMPTY_DICT
+        keywords = details.get("keywords")
+        content = details.get("content")
+
         # Add keywords from transcript details
-        if transcript_details and "keywords" in transcript_details:
-            for keyword in transcript_details["keywords"]:
+        if keywords:
+            for keyword in keywords:
                 if keyword.lower() not in excluded_words and len(keyword) > 2:
-                    clean_keyword = keyword[:20].capitalize()
-                    if clean_keyword not in tags:
-                        tags.append(clean_keyword)
+                    add(keyword[:20].capitalize())
+
+        # Later stages only append, so stop as soon as the cap is reached
+        if len(tags) >= _MAX_TAGS:
+            return tags[:_MAX_TAGS]
+
+        # Lowercase and tokenize the transcript content (shared by items from the same transcript)
+        content_lower, content_tokens, common_words = "", frozenset(), ()
+        if content:
+            content_lower, content_tokens, common_words = _analyze_content(content)
                         
         # Extract additional tags from content if needed
-        if len(tags) < 5 and transcript_details and "content" in transcript_details:
-            import re
-            from collections import Counter
-            
-            # Extract all words from content
-            content = transcript_details["content"].lower()
-            words = re.findall(r'\b\w+\b', content)
-            
-            # Count frequency of each word
-            word_counts = Counter(words)
-            
+        if len(tags) < 5 and common_words:
             # Add most common words that aren't in excluded list
-            for word, count in word_counts.most_common(20):
-                if len(word) > 3 and word not in excluded_words and word not in [t.lower() for t in tags]:
-                    tags.append(word.capitalize())
+            for word, count in common_words:
+                if len(word) > 3 and word not in excluded_words and word not in seen:
+                    add(word.capitalize())
                     if len(tags) >= 5:
                         break
-                        
+
+        if len(tags) >= _MAX_TAGS:
+            return tags[:_MAX_TAGS]
+
         # Check for any matching existing tags from Notion
-        existing_tags = self._get_existing_tags(f"{item_type}s")  # Convert to plural for database type
-        for tag in existing_tags:
-            if transcript_details and "content" in transcript_details and tag.lower() in transcript_details["content"].lower():
-                if tag not in tags:
-                    tags.append(tag)
-                    
+        if content_lower:
+            existing_tags, multi_word_scanner = self._get_existing_tag_matcher(f"{item_type}s")  # Plural database type
+            # Multi-word tags cannot be a single token, so find them as substrings in one pass
+            multi_word_hits = multi_word_scanner.scan(content_lower)
+            for tag, tag_lower in existing_tags:
+                if tag_lower in content_tokens or tag_lower in multi_word_hits:
+                    add(tag)
+
+        if len(tags) >= _MAX_TAGS:
+            return tags[:_MAX_TAGS]
+
         # Add descriptor tags based on item type
-        descriptor_tags = keywords_config.get_descriptor_tags(item_type)
+        descriptor_tags = self._descriptor_tags_by_type.get(item_type, ())
         for tag in descriptor_tags:
-            if tag not in tags:
-                tags.append(tag)
-                if len(tags) >= 5:
-                    break
+            if add(tag) and len(tags) >= 5:
+                break
                     
         # Add default category tags if still below 5 tags
         if len(tags) < 5:
-            default_tags = []
-            if item_type == "task":
-                default_tags = ["Task", "Action", "Voice", "Transcript"]
-            elif item_type == "project":
-                default_tags = ["Project", "Initiative", "Planning", "Voice", "Transcript"]
-            elif item_type == "meeting":
-                default_tags = ["Meeting", "Discussion", "Event", "Voice", "Transcript"]
-            elif item_type == "research":
-                default_tags = ["Research", "Analysis", "Investigation", "Voice", "Transcript"]
-            else:
-                default_tags = ["Voice", "Transcript", item_type.capitalize()]
+            default_tags = _DEFAULT_TAGS.get(item_type)
+            if default_tags is None:
+                default_tags = ("Voice", "Transcript", item_type.capitalize())
                 
             for tag in default_tags:
-                if tag not in tags:
-                    tags.append(tag)
-                    if len(tags) >= 5:
-                        break
+                if add(tag) and len(tags) >= 5:
+                    break
                         
         # Add item-specific tags
         if item_type == "task" or item_type == "todo":
             # Add project name as a tag if available
-            if item.get("project", "") and item["project"] not in tags:
-                tags.append(item["project"])
+            if item.get("project", ""):
+                add(item["project"])
                 
             # Add due date indicator tag
             if item.get("due_date", ""):
-                from datetime import datetime
                 try:
                     due_date = datetime.strptime(item["due_date"], "%Y-%m-%d")
-                    today = datetime.now()
+                    today = self._today
                     days_remaining = (due_date - today).days
                     
                     if days_remaining < 0:
@@ -294,43 +512,46 @@ class DataTransformer:
                     else:
                         date_tag = "Future Due Date"
                         
-                    if date_tag not in tags:
-                        tags.append(date_tag)
-                except:
+                    add(date_tag)
+                except (TypeError, ValueError):
                     pass  # Skip if date parsing fails
                     
         elif item_type == "project":
             # Add URL tag if available
-            if "url" in item and item["url"]:
-                url_tag = "Has URL"
-                if url_tag not in tags:
-                    tags.append(url_tag)
+            if item.get("url"):
+                add("Has URL")
             
             # Add project type tag if available
             project_type = None
-            if transcript_details and "action_keywords" in transcript_details:
-                project_keywords = keywords_config.get_project_category_keywords()
-                
-                for proj_type, keywords in project_keywords.items():
-                    for keyword in keywords:
-                        if keyword in [k.lower() for k in transcript_details.get("action_keywords", [])]:
-                            project_type = proj_type
-                            break
-                    if project_type:
-                        break
+            if "action_keywords" in details:
+                project_type = self._infer_project(transcript_details)
                         
-            if project_type and project_type not in tags:
-                tags.append(project_type)
+            if project_type:
+                add(project_type)
                 
         # Add priority as a tag for all item types
-        priority = item.get("priority", "medium").capitalize()
-        priority_tag = f"Priority: {priority}"
-        if priority_tag not in tags:
-            tags.append(priority_tag)
+        priority = _priority(item)
+        add(f"Priority: {priority}")
             
         # Limit to 10 tags
-        return tags[:10]
+        return tags[:_MAX_TAGS]
     
+    def _infer_project(self, transcript_details: Dict[str, Any]) -> Optional[str]:
+        """
+        Infer a project category from the action keywords of a transcript.
+
+        Args:
+            transcript_details: Transcript details dictionary
+
+        Returns:
+            First configured project category sharing a keyword with the transcript, or None
+        """
+        action_keywords = {k.lower() for k in transcript_details.get("action_keywords", [])}
+        for project, keywords in self._project_keyword_sets.items():
+            if action_keywords & keywords:
+                return project
+        return None
+
     def _transform_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
         Transform a task item to Notion Tasks database format.
@@ -345,12 +566,7 @@ class DataTransformer:
         raw_title = task.get("title", "Untitled Task")
 
         # Add date prefix to title if enabled
-        if self.add_date_prefix:
-            from datetime import datetime
-            date_str = task.get("created_date", self.current_date)
-            title = f"{date_str} | {raw_title}"
-        else:
-            title = raw_title
+        title = self._prefix_title(raw_title, task)
 
         # Enhance description with transcript context and purpose section
         description_parts = []
@@ -361,7 +577,7 @@ class DataTransformer:
             purpose_parts.append(task["description"])
 
         # Add purpose statement if not in description
-        if not any(keyword in " ".join(purpose_parts).lower() for keyword in ["purpose", "goal", "aim", "objective", "intention"]):
+        if not _PURPOSE_RE.search(" ".join(purpose_parts).lower()):
             purpose_parts.append(f"This task is intended to track and complete the work described in this entry.")
 
         # Add to description with heading
@@ -399,21 +615,25 @@ class DataTransformer:
             description_parts.append("## Task Details\n" + "\n".join(details_parts))
 
         # Add transcript details section
-        transcript_details = task.get("transcript_details", {})
+        transcript_details = task.get("transcript_details", _EMPTY_DICT)
         if transcript_details:
+            content = transcript_details.get("content")
+            keywords = transcript_details.get("keywords")
+            importance = transcript_details.get("importance_level")
+
             # Add original content excerpt with more context
-            if "content" in transcript_details:
-                excerpt = transcript_details["content"][:500] + "..." if len(transcript_details["content"]) > 500 else transcript_details["content"]
+            if content is not None:
+                excerpt = _truncate(content, 500)
                 description_parts.append(f"## Original Transcript\n{excerpt}")
 
             # Add keywords found with better formatting
-            if "keywords" in transcript_details and transcript_details["keywords"]:
-                keywords_str = ", ".join([f"**{kw}**" for kw in transcript_details["keywords"][:15]])
+            if keywords:
+                keywords_str = ", ".join([f"**{kw}**" for kw in keywords[:15]])
                 description_parts.append(f"## Key Topics & Themes\n{keywords_str}")
 
             # Add importance level with reasoning
-            if "importance_level" in transcript_details:
-                importance = transcript_details["importance_level"].upper()
+            if importance is not None:
+                importance = importance.upper()
                 description_parts.append(f"## Priority Assessment\nThis task has been assessed as **{importance} PRIORITY** based on the transcript content and context.")
 
         # Add original transcript ID reference
@@ -431,37 +651,23 @@ class DataTransformer:
         status = task.get("status", "Not Started")
 
         # Determine priority - use provided or default to "Medium"
-        priority = task.get("priority", "Medium").capitalize()
+        priority = _priority(task)
 
         # Default assignee (can be overridden if explicit assignment exists)
         assignee = task.get("assignee", self.default_assignee)
 
         # Extract blocked by information
         blocked_by = []
-        if "blocked_by" in task and task["blocked_by"]:
-            if isinstance(task["blocked_by"], list):
-                blocked_by = task["blocked_by"]
-            else:
-                blocked_by = [task["blocked_by"]]
-        elif "dependencies" in task and task["dependencies"]:
-            if isinstance(task["dependencies"], list):
-                blocked_by = task["dependencies"]
-            else:
-                blocked_by = [task["dependencies"]]
+        if blockers := task.get("blocked_by") or task.get("dependencies"):
+            blocked_by = blockers if isinstance(blockers, list) else [blockers]
 
         # Check for blocked info in description or context
-        if not blocked_by:
-            blocked_keywords = ["blocked by", "depends on", "waiting for", "dependent on", "blocked until"]
-            for keyword in blocked_keywords:
-                if task.get("description", "") and keyword in task["description"].lower():
-                    # Extract simple blocked by info from description
-                    start_idx = task["description"].lower().find(keyword)
-                    if start_idx != -1:
-                        # Extract the next 30 chars after the keyword as potential blocker info
-                        end_idx = min(start_idx + len(keyword) + 30, len(task["description"]))
-                        blocked_info = task["description"][start_idx:end_idx].strip()
-                        blocked_by.append(blocked_info)
-                        break
+        if not blocked_by and task.get("description", ""):
+            match = _BLOCKED_RE.search(task["description"].lower())
+            if match:
+                # Extract the next 30 chars after the keyword as potential blocker info
+                blocked_info = task["description"][match.start():match.end() + 30].strip()
+                blocked_by.append(blocked_info)
 
         # Generate enhanced tags for the task
         tags = self._generate_enhanced_tags(task, "task", transcript_details)
@@ -469,60 +675,43 @@ class DataTransformer:
         # Define project if not already defined
         project = task.get("project", "")
         if not project and "action_keywords" in transcript_details:
-            # Load configurable keywords
-            from ..utils.keywords_config import KeywordsConfig
-            keywords_config = KeywordsConfig()
-
-            # Try to infer project from keywords using configuration
-            project_keywords = keywords_config.get_project_category_keywords()
-
-            for proj, keywords in project_keywords.items():
-                for keyword in keywords:
-                    if keyword in [k.lower() for k in transcript_details.get("action_keywords", [])]:
-                        project = proj
-                        break
-                if project:
-                    break
-
-            # If still no project, default to "General Tasks"
-            if not project:
-                project = "General Tasks"
+            # Infer project from keywords using configuration, defaulting to "General Tasks"
+            project = self._infer_project(transcript_details) or "General Tasks"
 
         notion_task = {
             "item_id": task.get("item_id"),
             "transcript_id": task.get("transcript_id"),
-            "transcript_details": task.get("transcript_details", {}),  # Store full transcript details for comments
+            "transcript_details": task.get("transcript_details", _EMPTY_DICT),  # Store full transcript details for comments
             "properties": {
-                "Title": {"title": [{"text": {"content": title}}]},
-                "Description": {"rich_text": [{"text": {"content": description}}]},
-                "Status": {"status": {"name": status}},
-                "Priority": {"select": {"name": priority}},
-                "Created Date": {"date": {"start": created_date}},
-                "Due Date": {"date": {"start": due_date}},
+                "Title": _title(title),
+                "Description": _rich_text(description),
+                "Status": _status(status),
+                "Priority": _select(priority),
+                "Created Date": _date(created_date),
+                "Due Date": _date(due_date),
                 "Assignee": {"people": []},  # Changed to people type to match Notion schema
-                "Project": {"select": {"name": project}}
+                "Project": _select(project)
             }
         }
 
         # Add estimated completion time if present
-        if "estimated_time" in task and task["estimated_time"]:
-            notion_task["properties"]["Estimated Time"] = {"rich_text": [{"text": {"content": task["estimated_time"]}}]}
+        if estimated_time := task.get("estimated_time"):
+            notion_task["properties"]["Estimated Time"] = _rich_text(estimated_time)
 
         # Add tags as multi-select
         if tags:
-            # Limit to top 10 tags to avoid overwhelming the UI
-            tags = tags[:10]
-            notion_task["properties"]["Tags"] = {"multi_select": [{"name": tag} for tag in tags]}
+            # Limit to top 10 tags to avoid overwhelming the UI, without copying the list
+            notion_task["properties"]["Tags"] = _multi_select(islice(tags, _MAX_TAGS))
 
         # Add comments for updates if present
-        if "updates" in task and task["updates"]:
-            updates_text = "\n".join([f"- {update}" for update in task["updates"]])
-            notion_task["properties"]["Updates"] = {"rich_text": [{"text": {"content": updates_text}}]}
+        if updates := task.get("updates"):
+            updates_text = "\n".join([f"- {update}" for update in updates])
+            notion_task["properties"]["Updates"] = _rich_text(updates_text)
 
         # Add blocked by information if present
         if blocked_by:
             blocked_text = ", ".join(blocked_by)
-            notion_task["properties"]["Blocked By"] = {"rich_text": [{"text": {"content": blocked_text}}]}
+            notion_task["properties"]["Blocked By"] = _rich_text(blocked_text)
 
         # Add completion percentage if present
         completion = task.get("completion_percentage", task.get("percent_complete", task.get("progress", 0)))
@@ -532,10 +721,10 @@ class DataTransformer:
                 if isinstance(completion, str):
                     completion = int(completion.replace("%", ""))
                 notion_task["properties"]["Completion"] = {"number": completion}
-            except:
+            except ValueError:
                 pass  # Skip if we can't parse a valid number
 
-        return notion_task
+        return _with_source(notion_task)
     
     def _transform_todo(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -551,12 +740,7 @@ class DataTransformer:
         raw_title = task.get("title", "Untitled Todo")
 
         # Add date prefix to title if enabled
-        if self.add_date_prefix:
-            from datetime import datetime
-            date_str = task.get("created_date", self.current_date)
-            title = f"{date_str} | {raw_title}"
-        else:
-            title = raw_title
+        title = self._prefix_title(raw_title, task)
 
         # Build notes from description and context
         notes_parts = []
@@ -572,21 +756,25 @@ class DataTransformer:
             notes_parts.append(f"Context: {task['extracted_context']}")
 
         # Add transcript details section
-        transcript_details = task.get("transcript_details", {})
+        transcript_details = task.get("transcript_details", _EMPTY_DICT)
         if transcript_details:
+            content = transcript_details.get("content")
+            keywords = transcript_details.get("keywords")
+            importance = transcript_details.get("importance_level")
+
             # Add original content excerpt
-            if "content" in transcript_details:
-                excerpt = transcript_details["content"][:300] + "..." if len(transcript_details["content"]) > 300 else transcript_details["content"]
+            if content is not None:
+                excerpt = _truncate(content, 300)
                 notes_parts.append(f"Transcript Content:\n{excerpt}")
 
             # Add keywords found
-            if "keywords" in transcript_details and transcript_details["keywords"]:
-                keywords_str = ", ".join(transcript_details["keywords"])
+            if keywords:
+                keywords_str = ", ".join(keywords)
                 notes_parts.append(f"Keywords: {keywords_str}")
 
             # Add importance level
-            if "importance_level" in transcript_details:
-                notes_parts.append(f"Importance Level: {transcript_details['importance_level']}")
+            if importance is not None:
+                notes_parts.append(f"Importance Level: {importance}")
 
         # Add original transcript reference
         if task.get("transcript_id", ""):
@@ -596,13 +784,10 @@ class DataTransformer:
         notes = "\n\n".join(notes_parts)
 
         # Determine status - use provided or default to "Not Started"
-        status = False  # Checkbox for todo completion status
-        if task.get("status", "").lower() in ["done", "completed", "finished"]:
-            status = True
+        status = task.get("status", "").lower() in _DONE_STATES  # Checkbox for todo completion status
 
         # Determine priority - use provided or default to "Medium"
-        priority_map = {"high": "High", "medium": "Medium", "low": "Low"}
-        priority = priority_map.get(task.get("priority", "medium").lower(), "Medium")
+        priority = _TODO_PRIORITIES.get(task.get("priority", "medium").lower(), "Medium")
 
         # Extract or set date fields
         created_date = task.get("created_date", self.current_date)
@@ -620,36 +805,20 @@ class DataTransformer:
         # Define project if not already defined
         project = task.get("project", "")
         if not project and transcript_details and "action_keywords" in transcript_details:
-            # Load configurable keywords
-            from ..utils.keywords_config import KeywordsConfig
-            keywords_config = KeywordsConfig()
-
-            # Try to infer project from keywords using configuration
-            project_keywords = keywords_config.get_project_category_keywords()
-
-            for proj, keywords in project_keywords.items():
-                for keyword in keywords:
-                    if keyword in [k.lower() for k in transcript_details.get("action_keywords", [])]:
-                        project = proj
-                        break
-                if project:
-                    break
-
-            # If still no project, default to "General Tasks"
-            if not project:
-                project = "General Tasks"
+            # Infer project from keywords using configuration, defaulting to "General Tasks"
+            project = self._infer_project(transcript_details) or "General Tasks"
 
         notion_todo = {
             "item_id": task.get("item_id"),
             "transcript_id": task.get("transcript_id"),
-            "transcript_details": task.get("transcript_details", {}),  # Store full transcript details for comments
+            "transcript_details": task.get("transcript_details", _EMPTY_DICT),  # Store full transcript details for comments
             "properties": {
-                "Title": {"title": [{"text": {"content": title}}]},
+                "Title": _title(title),
                 "Status": {"checkbox": status},
-                "Priority": {"select": {"name": priority}},
-                "Created Date": {"date": {"start": created_date}},
-                "Due": {"date": {"start": due_date}},
-                "Notes": {"rich_text": [{"text": {"content": notes}}]},
+                "Priority": _select(priority),
+                "Created Date": _date(created_date),
+                "Due": _date(due_date),
+                "Notes": _rich_text(notes),
                 "Assignee": {"people": []},  # Changed to people type to match Notion schema
                 "Progress": {"number": completion}
             }
@@ -657,24 +826,23 @@ class DataTransformer:
 
         # Add project if defined
         if project:
-            notion_todo["properties"]["Project"] = {"select": {"name": project}}
+            notion_todo["properties"]["Project"] = _select(project)
 
         # Add tags/keywords if present
         if tags:
-            # Limit to top 10 tags to avoid overwhelming the UI
-            tags = tags[:10]
-            notion_todo["properties"]["Tags"] = {"multi_select": [{"name": tag} for tag in tags]}
+            # Limit to top 10 tags to avoid overwhelming the UI, without copying the list
+            notion_todo["properties"]["Tags"] = _multi_select(islice(tags, _MAX_TAGS))
 
         # Add estimated completion time if present
-        if "estimated_time" in task and task["estimated_time"]:
-            notion_todo["properties"]["Estimated Time"] = {"rich_text": [{"text": {"content": task["estimated_time"]}}]}
+        if estimated_time := task.get("estimated_time"):
+            notion_todo["properties"]["Estimated Time"] = _rich_text(estimated_time)
 
         # Add updates if present
-        if "updates" in task and task["updates"]:
-            updates_text = "\n".join([f"- {update}" for update in task["updates"]])
-            notion_todo["properties"]["Updates"] = {"rich_text": [{"text": {"content": updates_text}}]}
+        if updates := task.get("updates"):
+            updates_text = "\n".join([f"- {update}" for update in updates])
+            notion_todo["properties"]["Updates"] = _rich_text(updates_text)
 
-        return notion_todo
+        return _with_source(notion_todo)
     
     def _transform_meeting_to_task(self, meeting: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -690,12 +858,7 @@ class DataTransformer:
         raw_title = f"Meeting: {meeting.get('title', 'Untitled Meeting')}"
 
         # Add date prefix to title if enabled
-        if self.add_date_prefix:
-            from datetime import datetime
-            date_str = meeting.get("created_date", self.current_date)
-            title = f"{date_str} | {raw_title}"
-        else:
-            title = raw_title
+        title = self._prefix_title(raw_title, meeting)
 
         # Build enhanced description with meeting details
         description_parts = []
@@ -705,20 +868,20 @@ class DataTransformer:
             description_parts.append(meeting["description"])
 
         # Add agenda
-        if "agenda" in meeting and meeting["agenda"]:
-            description_parts.append(f"Agenda: {meeting['agenda']}")
+        if agenda := meeting.get("agenda"):
+            description_parts.append(f"Agenda: {agenda}")
 
         # Add participants
-        if "participants" in meeting and meeting["participants"]:
-            if isinstance(meeting["participants"], list):
-                participants_text = ", ".join(meeting["participants"])
+        if participants := meeting.get("participants"):
+            if isinstance(participants, list):
+                participants_text = ", ".join(participants)
             else:
-                participants_text = meeting["participants"]
+                participants_text = participants
             description_parts.append(f"Participants: {participants_text}")
 
         # Add location
-        if "location" in meeting and meeting["location"]:
-            description_parts.append(f"Location: {meeting['location']}")
+        if location := meeting.get("location"):
+            description_parts.append(f"Location: {location}")
 
         # Add transcript context if available
         if meeting.get("context", ""):
@@ -737,56 +900,48 @@ class DataTransformer:
         created_date = meeting.get("created_date", self.current_date)
 
         # Determine priority if present, otherwise default to Medium
-        priority = meeting.get("priority", "Medium").capitalize()
-
-        notion_task = {
-            "item_id": meeting.get("item_id"),
-            "transcript_id": meeting.get("transcript_id"),
-            "transcript_details": meeting.get("transcript_details", {}),  # Store full transcript details for comments
-            "properties": {
-                "Title": {"title": [{"text": {"content": title}}]},
-                "Description": {"rich_text": [{"text": {"content": description}}]},
-                "Status": {"status": {"name": "Not Started"}},
-                "Type": {"select": {"name": "Meeting"}},
-                "Priority": {"select": {"name": priority}},
-                "Created Date": {"date": {"start": created_date}}
-            }
+        priority = _priority(meeting)
+
+        properties = {
+            "Title": _title(title),
+            "Description": _rich_text(description),
+            "Status": _status("Not Started"),
+            "Type": _select("Meeting"),
+            "Priority": _select(priority),
+            "Created Date": _date(created_date)
         }
 
         # Add scheduled date/time if present
-        scheduled_date = None
-
-        if "date" in meeting and meeting["date"]:
-            scheduled_date = meeting["date"]
-
+        scheduled_date = meeting.get("date")
+        if scheduled_date:
             date_value = {"start": scheduled_date}
 
             # Add time if present
-            if "time" in meeting and meeting["time"]:
-                date_value["start"] += f"T{meeting['time']}"
+            meeting_time = meeting.get("time")
+            if meeting_time:
+                date_value["start"] += f"T{meeting_time}"
 
-            notion_task["properties"]["Due Date"] = {"date": date_value}
-            notion_task["properties"]["Meeting Date"] = {"date": date_value}
+            properties["Due Date"] = {"date": date_value}
+            properties["Meeting Date"] = {"date": date_value}
         else:
             # Default to one week from now
-            from datetime import datetime, timedelta
-            default_meeting_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-            notion_task["properties"]["Due Date"] = {"date": {"start": default_meeting_date}}
-            notion_task["properties"]["Meeting Date"] = {"date": {"start": default_meeting_date}}
-
-        # Add duration if present
-        if "duration" in meeting and meeting["duration"]:
-            notion_task["properties"]["Duration"] = {"rich_text": [{"text": {"content": meeting["duration"]}}]}
+            properties["Due Date"] = _date(self._week_str)
+            properties["Meeting Date"] = _date(self._week_str)
 
-        # Add recurrence if present
-        if "recurrence" in meeting and meeting["recurrence"]:
-            notion_task["properties"]["Recurrence"] = {"rich_text": [{"text": {"content": meeting["recurrence"]}}]}
+        # Add duration, recurrence and meeting notes if present
+        for field, prop_name in (("duration", "Duration"), ("recurrence", "Recurrence"), ("notes", "Meeting Notes")):
+            value = meeting.get(field)
+            if value:
+                properties[prop_name] = _rich_text(value)
 
-        # Add meeting notes if present
-        if "notes" in meeting and meeting["notes"]:
-            notion_task["properties"]["Meeting Notes"] = {"rich_text": [{"text": {"content": meeting["notes"]}}]}
+        notion_task = {
+            "item_id": meeting.get("item_id"),
+            "transcript_id": meeting.get("transcript_id"),
+            "transcript_details": meeting.get("transcript_details", _EMPTY_DICT),  # Store full transcript details for comments
+            "properties": properties
+        }
 
-        return notion_task
+        return _with_source(notion_task)
     
     def _transform_project(self, project: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -798,141 +953,113 @@ class DataTransformer:
         Returns:
             Notion-formatted project
         """
+        # Read the fields used in several places once
+        timeline = project.get("timeline")
+        team = project.get("team")
+        transcript_details = project.get("transcript_details", _EMPTY_DICT)
+
+        # Combine dependencies and blockers
+        dependencies = []
+        for field in ("dependencies", "blocked_by"):
+            value = project.get(field)
+            if value:
+                if isinstance(value, list):
+                    dependencies.extend(value)
+                else:
+                    dependencies.append(value)
+
         # Get basic title
         raw_title = project.get("name", "Untitled Project")
 
         # Add date prefix to title if enabled
-        if self.add_date_prefix:
-            from datetime import datetime
-            date_str = project.get("created_date", self.current_date)
-            title = f"{date_str} | {raw_title}"
-        else:
-            title = raw_title
-
-        # Build enhanced description with better structure
-        description_parts = []
+        title = self._prefix_title(raw_title, project)
 
         # Project Purpose and Overview section
-        overview_parts = []
-        if project.get("description", ""):
-            overview_parts.append(project["description"])
-        else:
-            overview_parts.append("This project was created based on transcript content and detected project references.")
-
-        description_parts.append("## Project Overview\n" + "\n\n".join(overview_parts))
+        overview = project.get("description", "") or "This project was created based on transcript content and detected project references."
 
         # Project Goals and Objectives section
-        goal_parts = []
-        if project.get("goals", ""):
-            if isinstance(project["goals"], list):
-                goals_text = "\n".join([f"- {goal}" for goal in project["goals"]])
-                goal_parts.append(f"{goals_text}")
-            else:
-                goal_parts.append(f"{project['goals']}")
-
-        # Make sure we have some goals, even if very basic
-        if not goal_parts:
-            goal_parts.append("- Successfully implement and deliver the project as described")
-            goal_parts.append("- Track progress and coordinate efforts related to this project")
-
-        description_parts.append("## Goals & Objectives\n" + "\n".join(goal_parts))
-
-        # Project Scope section
-        scope_parts = []
-        if project.get("scope", ""):
-            scope_parts.append(project["scope"])
-
-        # Add a timeline scope if we have timeline data
-        if "timeline" in project and project["timeline"]:
-            if isinstance(project["timeline"], dict):
-                if "start" in project["timeline"] and "end" in project["timeline"]:
-                    scope_parts.append(f"**Timeline**: {project['timeline']['start']} to {project['timeline']['end']}")
-            elif isinstance(project["timeline"], str):
-                scope_parts.append(f"**Timeline**: {project['timeline']}")
-
-        if scope_parts:
-            description_parts.append("## Project Scope\n" + "\n\n".join(scope_parts))
+        goals = project.get("goals", "")
+        if goals:
+            goals_text = "\n".join([f"- {goal}" for goal in goals]) if isinstance(goals, list) else goals
+        else:
+            # Make sure we have some goals, even if very basic
+            goals_text = ("- Successfully implement and deliver the project as described\n"
+                          "- Track progress and coordinate efforts related to this project")
+
+        # Project Scope section, with a timeline scope if we have timeline data
+        scope = project.get("scope", "")
+        timeline_scope = ""
+        if timeline:
+            if isinstance(timeline, dict):
+                if "start" in timeline and "end" in timeline:
+                    timeline_scope = f"**Timeline**: {timeline['start']} to {timeline['end']}"
+            elif isinstance(timeline, str):
+                timeline_scope = f"**Timeline**: {timeline}"
+        scope_text = f"{scope}\n\n{timeline_scope}" if scope and timeline_scope else scope or timeline_scope
 
         # Context and Background
-        context_parts = []
-        if project.get("context", ""):
-            context_parts.append(project["context"])
-        elif project.get("extracted_context", ""):
-            context_parts.append(project["extracted_context"])
+        context = project.get("context", "") or project.get("extracted_context", "")
 
-        if context_parts:
-            description_parts.append("## Background & Context\n" + "\n\n".join(context_parts))
-
-        # Team and Stakeholders
-        stakeholder_parts = []
-        if "team" in project and project["team"]:
-            if isinstance(project["team"], list):
-                team_text = ", ".join(project["team"])
-                stakeholder_parts.append(f"**Team Members**: {team_text}")
-            else:
-                stakeholder_parts.append(f"**Team Members**: {project['team']}")
+        # Team and Stakeholders, with owner info if available
+        team_line = ""
+        if team:
+            team_text = ", ".join(team) if isinstance(team, list) else team
+            team_line = f"**Team Members**: {team_text}"
 
-        # Add owner info if available
-        if project.get("owner", "") or project.get("manager", ""):
-            owner = project.get("owner", project.get("manager", ""))
-            if owner:
-                stakeholder_parts.append(f"**Project Owner**: {owner}")
-
-        if stakeholder_parts:
-            description_parts.append("## Team & Stakeholders\n" + "\n".join(stakeholder_parts))
+        owner_line = ""
+        owner = project.get("owner", project.get("manager", ""))
+        if owner:
+            owner_line = f"**Project Owner**: {owner}"
+        stakeholders_text = f"{team_line}\n{owner_line}" if team_line and owner_line else team_line or owner_line
 
         # Dependencies and Relationships
-        dependency_parts = []
-        if "dependencies" in project or "blocked_by" in project:
-            deps = []
-            if "dependencies" in project and project["dependencies"]:
-                if isinstance(project["dependencies"], list):
-                    deps.extend(project["dependencies"])
-                else:
-                    deps.append(project["dependencies"])
-
-            if "blocked_by" in project and project["blocked_by"]:
-                if isinstance(project["blocked_by"], list):
-                    deps.extend(project["blocked_by"])
-                else:
-                    deps.append(project["blocked_by"])
-
-            if deps:
-                dependency_parts.append("**Dependencies**:")
-                for dep in deps:
-                    dependency_parts.append(f"- {dep}")
-
-        if dependency_parts:
-            description_parts.append("## Dependencies & Relationships\n" + "\n".join(dependency_parts))
+        deps_text = ""
+        if dependencies:
+            deps_text = "**Dependencies**:\n" + "\n".join([f"- {dep}" for dep in dependencies])
 
-        # Transcript Information section
-        transcript_details = project.get("transcript_details", {})
+        # Transcript Information sections
+        excerpt_section = keywords_section = importance_section = ""
         if transcript_details:
+            content = transcript_details.get("content")
+            keywords = transcript_details.get("keywords")
+            importance = transcript_details.get("importance_level")
+
             # Add original content excerpt with more context
-            if "content" in transcript_details:
-                excerpt = transcript_details["content"][:500] + "..." if len(transcript_details["content"]) > 500 else transcript_details["content"]
-                description_parts.append(f"## Original Transcript\n{excerpt}")
+            if content is not None:
+                excerpt_section = f"## Original Transcript\n{_truncate(content, 500)}"
 
             # Add keywords with better formatting
-            if "keywords" in transcript_details and transcript_details["keywords"]:
-                keywords_str = ", ".join([f"**{kw}**" for kw in transcript_details["keywords"][:15]])
-                description_parts.append(f"## Key Topics & Themes\n{keywords_str}")
+            if keywords:
+                keywords_str = ", ".join([f"**{kw}**" for kw in keywords[:15]])
+                keywords_section = f"## Key Topics & Themes\n{keywords_str}"
 
             # Add importance level with reasoning
-            if "importance_level" in transcript_details:
-                importance = transcript_details["importance_level"].upper()
-                description_parts.append(f"## Priority Assessment\nThis project has been assessed as **{importance} PRIORITY** based on the transcript content and context.")
+            if importance is not None:
+                importance = importance.upper()
+                importance_section = f"## Priority Assessment\nThis project has been assessed as **{importance} PRIORITY** based on the transcript content and context."
 
         # Add original transcript reference
+        reference = ""
         if project.get("transcript_id", ""):
-            description_parts.append(f"## Reference\nSource: Transcript ID {project['transcript_id']}")
-
-        # Join all description parts
-        description = "\n\n".join(description_parts)
+            reference = f"Source: Transcript ID {project['transcript_id']}"
+
+        # Join the sections that have content
+        description = "\n\n".join([section for section in (
+            _section("Project Overview", overview),
+            _section("Goals & Objectives", goals_text),
+            _section("Project Scope", scope_text),
+            _section("Background & Context", context),
+            _section("Team & Stakeholders", stakeholders_text),
+            _section("Dependencies & Relationships", deps_text),
+            excerpt_section,
+            keywords_section,
+            importance_section,
+            _section("Reference", reference),
+        ) if section])
 
         # Extract status and priority
         status = project.get("status", "Planning")
-        priority = project.get("priority", "Medium").capitalize()
+        priority = _priority(project)
 
         # Extract date fields
         created_date = project.get("created_date", self.current_date)
@@ -948,42 +1075,39 @@ class DataTransformer:
         if isinstance(completion, str):
             try:
                 completion = int(completion.replace("%", ""))
-            except:
+            except ValueError:
                 completion = 0
 
         notion_project = {
             "item_id": project.get("item_id"),
             "transcript_id": project.get("transcript_id"),
-            "transcript_details": project.get("transcript_details", {}),  # Store transcript details for comments
+            "transcript_details": transcript_details,  # Store transcript details for comments
             "properties": {
-                "Name": {"title": [{"text": {"content": title}}]},
-                "Description": {"rich_text": [{"text": {"content": description}}]},
-                "Status": {"select": {"name": status}},
-                "Priority": {"select": {"name": priority}},
-                "Created Date": {"date": {"start": created_date}},
+                "Name": _title(title),
+                "Description": _rich_text(description),
+                "Status": _select(status),
+                "Priority": _select(priority),
+                "Created Date": _date(created_date),
                 "Owner": {"people": []},  # Changed to people type to match Notion schema
                 "Completion": {"number": completion}
             }
         }
 
         # Add timeline if present
-        if "timeline" in project and project["timeline"]:
-            if isinstance(project["timeline"], dict) and "start" in project["timeline"] and "end" in project["timeline"]:
+        if timeline:
+            if isinstance(timeline, dict) and "start" in timeline and "end" in timeline:
                 notion_project["properties"]["Timeline"] = {
                     "date": {
-                        "start": project["timeline"]["start"],
-                        "end": project["timeline"]["end"]
+                        "start": timeline["start"],
+                        "end": timeline["end"]
                     }
                 }
-            elif isinstance(project["timeline"], str):
-                notion_project["properties"]["Timeline Description"] = {
-                    "rich_text": [{"text": {"content": project["timeline"]}}]
-                }
+            elif isinstance(timeline, str):
+                notion_project["properties"]["Timeline Description"] = _rich_text(timeline)
         else:
             # Add default timeline (3 months by default)
-            from datetime import datetime, timedelta
             start_date = self.current_date
-            end_date = (datetime.now() + timedelta(days=90)).strftime("%Y-%m-%d")
+            end_date = self._quarter_str
             notion_project["properties"]["Timeline"] = {
                 "date": {
                     "start": start_date,
@@ -992,47 +1116,29 @@ class DataTransformer:
             }
 
         # Add team/stakeholders if present
-        if "team" in project and project["team"]:
-            if isinstance(project["team"], list):
-                team_text = ", ".join(project["team"])
-            else:
-                team_text = project["team"]
-            notion_project["properties"]["Team"] = {"rich_text": [{"text": {"content": team_text}}]}
+        if team:
+            notion_project["properties"]["Team"] = _rich_text(team_text)
 
         # Add tags as multi-select if we have any
         if tags:
-            # Limit to top 10 tags to avoid overwhelming the UI
-            tags = tags[:10]
-            notion_project["properties"]["Tags"] = {"multi_select": [{"name": tag} for tag in tags]}
+            # Limit to top 10 tags to avoid overwhelming the UI, without copying the list
+            notion_project["properties"]["Tags"] = _multi_select(islice(tags, _MAX_TAGS))
 
         # Add updates if present
-        if "updates" in project and project["updates"]:
-            updates_text = "\n".join([f"- {update}" for update in project["updates"]])
-            notion_project["properties"]["Updates"] = {"rich_text": [{"text": {"content": updates_text}}]}
+        if updates := project.get("updates"):
+            updates_text = "\n".join([f"- {update}" for update in updates])
+            notion_project["properties"]["Updates"] = _rich_text(updates_text)
 
         # Add budget if present
-        if "budget" in project and project["budget"]:
-            notion_project["properties"]["Budget"] = {"rich_text": [{"text": {"content": str(project["budget"])}}]}
+        if budget := project.get("budget"):
+            notion_project["properties"]["Budget"] = _rich_text(str(budget))
 
         # Add dependencies or blocked by information if present
-        dependencies = []
-        if "dependencies" in project and project["dependencies"]:
-            if isinstance(project["dependencies"], list):
-                dependencies.extend(project["dependencies"])
-            else:
-                dependencies.append(project["dependencies"])
-
-        if "blocked_by" in project and project["blocked_by"]:
-            if isinstance(project["blocked_by"], list):
-                dependencies.extend(project["blocked_by"])
-            else:
-                dependencies.append(project["blocked_by"])
-
         if dependencies:
             dependencies_text = ", ".join(dependencies)
-            notion_project["properties"]["Dependencies"] = {"rich_text": [{"text": {"content": dependencies_text}}]}
+            notion_project["properties"]["Dependencies"] = _rich_text(dependencies_text)
 
-        return notion_project
+        return _with_source(notion_project)
     
     def _transform_research_to_task(self, research: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1048,12 +1154,7 @@ class DataTransformer:
         raw_title = f"Research: {research.get('topic', 'Untitled Research')}"
 
         # Add date prefix to title if enabled
-        if self.add_date_prefix:
-            from datetime import datetime
-            date_str = research.get("created_date", self.current_date)
-            title = f"{date_str} | {raw_title}"
-        else:
-            title = raw_title
+        title = self._prefix_title(raw_title, research)
 
         # Build enhanced description
         description_parts = []
@@ -1097,39 +1198,39 @@ class DataTransformer:
 
         # Determine status and priority
         status = research.get("status", "Not Started")
-        priority = research.get("priority", "Medium").capitalize()
+        priority = _priority(research)
 
         notion_task = {
             "item_id": research.get("item_id"),
             "transcript_id": research.get("transcript_id"),
-            "transcript_details": research.get("transcript_details", {}),  # Store full transcript details for comments
+            "transcript_details": research.get("transcript_details", _EMPTY_DICT),  # Store full transcript details for comments
             "properties": {
-                "Title": {"title": [{"text": {"content": title}}]},
-                "Description": {"rich_text": [{"text": {"content": description}}]},
-                "Status": {"status": {"name": status}},
-                "Type": {"select": {"name": "Research"}},
-                "Priority": {"select": {"name": priority}},
-                "Created Date": {"date": {"start": created_date}},
-                "Due Date": {"date": {"start": due_date}}
+                "Title": _title(title),
+                "Description": _rich_text(description),
+                "Status": _status(status),
+                "Type": _select("Research"),
+                "Priority": _select(priority),
+                "Created Date": _date(created_date),
+                "Due Date": _date(due_date)
             }
         }
 
         # Add project if present
-        if "project" in research and research["project"]:
-            notion_task["properties"]["Project"] = {"select": {"name": research["project"]}}
+        if project := research.get("project"):
+            notion_task["properties"]["Project"] = _select(project)
 
         # Add tags/keywords if present
-        if "tags" in research and research["tags"]:
-            if isinstance(research["tags"], list):
-                notion_task["properties"]["Tags"] = {"multi_select": [{"name": tag} for tag in research["tags"]]}
-            elif isinstance(research["tags"], str):
-                notion_task["properties"]["Tags"] = {"multi_select": [{"name": tag.strip()} for tag in research["tags"].split(",")]}
+        if tags := research.get("tags"):
+            if isinstance(tags, list):
+                notion_task["properties"]["Tags"] = _multi_select(tags)
+            elif isinstance(tags, str):
+                notion_task["properties"]["Tags"] = _multi_select(tag.strip() for tag in tags.split(","))
 
         # Add estimated completion time if present
-        if "estimated_time" in research and research["estimated_time"]:
-            notion_task["properties"]["Estimated Time"] = {"rich_text": [{"text": {"content": research["estimated_time"]}}]}
+        if estimated_time := research.get("estimated_time"):
+            notion_task["properties"]["Estimated Time"] = _rich_text(estimated_time)
 
-        return notion_task
+        return _with_source(notion_task)
     
     def _transform_message_to_todo(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1143,15 +1244,10 @@ class DataTransformer:
         """
         recipient = message.get("recipient", "")
         content = message.get("content", "")
-        raw_title = f"Message to {recipient}: {content[:30]}..." if len(content) > 30 else f"Message to {recipient}: {content}"
+        raw_title = f"Message to {recipient}: {_truncate(content, 30)}"
 
         # Add date prefix to title if enabled
-        if self.add_date_prefix:
-            from datetime import datetime
-            date_str = message.get("created_date", self.current_date)
-            title = f"{date_str} | {raw_title}"
-        else:
-            title = raw_title
+        title = self._prefix_title(raw_title, message)
 
         # Build enhanced notes
         notes_parts = []
@@ -1184,50 +1280,43 @@ class DataTransformer:
         due_date = message.get("due_date", self.current_date)  # Messages usually need to be sent today
 
         # Determine status - use provided or default to Not Sent
-        status = False  # Not sent yet (checkbox)
-        if message.get("status", "").lower() in ["sent", "completed", "done"]:
-            status = True
+        status = message.get("status", "").lower() in _SENT_STATES  # Checkbox, unticked until sent
 
         # Determine priority based on urgency or default to Medium
-        if message.get("urgency", "").lower() in ["high", "urgent", "important"]:
-            priority = "High"
-        elif message.get("urgency", "").lower() in ["low", "whenever"]:
-            priority = "Low"
-        else:
-            priority = "Medium"
+        priority = _URGENCY_TO_PRIORITY.get(message.get("urgency", "").lower(), "Medium")
 
         notion_todo = {
             "item_id": message.get("item_id"),
             "transcript_id": message.get("transcript_id"),
-            "transcript_details": message.get("transcript_details", {}),  # Store full transcript details for comments
+            "transcript_details": message.get("transcript_details", _EMPTY_DICT),  # Store full transcript details for comments
             "properties": {
-                "Title": {"title": [{"text": {"content": title}}]},
+                "Title": _title(title),
                 "Status": {"checkbox": status},
-                "Type": {"select": {"name": "Message"}},
-                "Priority": {"select": {"name": priority}},
-                "Created Date": {"date": {"start": created_date}},
-                "Due": {"date": {"start": due_date}},
-                "Notes": {"rich_text": [{"text": {"content": notes}}]},
-                "Recipient": {"rich_text": [{"text": {"content": recipient}}]}
+                "Type": _select("Message"),
+                "Priority": _select(priority),
+                "Created Date": _date(created_date),
+                "Due": _date(due_date),
+                "Notes": _rich_text(notes),
+                "Recipient": _rich_text(recipient)
             }
         }
 
         # Add communication medium if present (call, email, text, etc.)
-        if "medium" in message and message["medium"]:
-            notion_todo["properties"]["Medium"] = {"select": {"name": message["medium"].capitalize()}}
+        if medium := message.get("medium"):
+            notion_todo["properties"]["Medium"] = _select(medium.capitalize())
 
         # Add follow-up date if present
-        if "follow_up_date" in message and message["follow_up_date"]:
-            notion_todo["properties"]["Follow-up Date"] = {"date": {"start": message["follow_up_date"]}}
+        if follow_up_date := message.get("follow_up_date"):
+            notion_todo["properties"]["Follow-up Date"] = _date(follow_up_date)
 
         # Add tags if present
-        if "tags" in message and message["tags"]:
-            if isinstance(message["tags"], list):
-                notion_todo["properties"]["Tags"] = {"multi_select": [{"name": tag} for tag in message["tags"]]}
-            elif isinstance(message["tags"], str):
-                notion_todo["properties"]["Tags"] = {"multi_select": [{"name": tag.strip()} for tag in message["tags"].split(",")]}
+        if tags := message.get("tags"):
+            if isinstance(tags, list):
+                notion_todo["properties"]["Tags"] = _multi_select(tags)
+            elif isinstance(tags, str):
+                notion_todo["properties"]["Tags"] = _multi_select(tag.strip() for tag in tags.split(","))
 
-        return notion_todo
+        return _with_source(notion_todo)
     
     def _create_lifelog_entry(self, extracted_items: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
         """
@@ -1239,27 +1328,31 @@ class DataTransformer:
         Returns:
             Notion-formatted lifelog entry
         """
-        # Count items in each category
-        counts = {
-            "tasks": len(extracted_items.get("tasks", [])),
-            "meetings": len(extracted_items.get("meetings", [])),
-            "projects": len(extracted_items.get("projects", [])),
-            "research": len(extracted_items.get("research", [])),
-            "messages": len(extracted_items.get("messages", []))
-        }
+        # Look up each category once for both counting and summarising; a category
+        # given as None counts as empty, as in transform()
+        tasks = extracted_items.get("tasks") or ()
+        meetings = extracted_items.get("meetings") or ()
+        projects = extracted_items.get("projects") or ()
+        research_items = extracted_items.get("research") or ()
+        messages = extracted_items.get("messages") or ()
+
+        # Count items in the categories that have any, in display order
+        counts = (
+            ("tasks", len(tasks)),
+            ("meetings", len(meetings)),
+            ("projects", len(projects)),
+            ("research", len(research_items)),
+            ("messages", len(messages)),
+        )
+        present = [(category, count) for category, count in counts if count]
 
         # Only create entry if we have any items
-        total_items = sum(counts.values())
-        if total_items == 0:
+        if not present:
             return None
+        total_items = sum(count for _, count in present)
 
         # Create entry title based on counts
-        title_parts = []
-        for category, count in counts.items():
-            if count > 0:
-                title_parts.append(f"{count} {category}")
-
-        title = "Processed: " + ", ".join(title_parts)
+        title = "Processed: " + ", ".join([f"{count} {category}" for category, count in present])
 
         # Create enhanced notes with detailed summary
         notes_parts = []
@@ -1268,104 +1361,93 @@ class DataTransformer:
         notes_parts.append(f"Processed {total_items} total items on {self._get_today_date()}:")
 
         # Category counts
-        category_summary = []
-        for category, count in counts.items():
-            if count > 0:
-                category_summary.append(f"- {count} {category}")
-        notes_parts.append("\n".join(category_summary))
+        notes_parts.append("\n".join([f"- {count} {category}" for category, count in present]))
 
         # Add details about each category
-        # Tasks
-        if counts["tasks"] > 0:
-            task_summary = ["", "## Tasks"]
-            for task in extracted_items.get("tasks", []):
-                task_title = task.get("title", "Untitled Task")
-                priority = task.get("priority", "Medium").capitalize()
-                task_summary.append(f"- {task_title} (Priority: {priority})")
-            notes_parts.append("\n".join(task_summary))
-
-        # Meetings
-        if counts["meetings"] > 0:
-            meeting_summary = ["", "## Meetings"]
-            for meeting in extracted_items.get("meetings", []):
-                meeting_title = meeting.get("title", "Untitled Meeting")
-                date_info = meeting.get("date", "No date specified")
-                meeting_summary.append(f"- {meeting_title} (Date: {date_info})")
-            notes_parts.append("\n".join(meeting_summary))
-
-        # Projects
-        if counts["projects"] > 0:
-            project_summary = ["", "## Projects"]
-            for project in extracted_items.get("projects", []):
-                project_name = project.get("name", "Untitled Project")
-                status = project.get("status", "Planning")
-                project_summary.append(f"- {project_name} (Status: {status})")
-            notes_parts.append("\n".join(project_summary))
-
-        # Research items
-        if counts["research"] > 0:
-            research_summary = ["", "## Research"]
-            for research in extracted_items.get("research", []):
-                topic = research.get("topic", "Untitled Research")
-                research_summary.append(f"- {topic}")
-            notes_parts.append("\n".join(research_summary))
-
-        # Messages
-        if counts["messages"] > 0:
-            message_summary = ["", "## Messages"]
-            for message in extracted_items.get("messages", []):
-                recipient = message.get("recipient", "")
-                content_preview = message.get("content", "")[:50] + "..." if len(message.get("content", "")) > 50 else message.get("content", "")
-                message_summary.append(f"- To {recipient}: {content_preview}")
-            notes_parts.append("\n".join(message_summary))
+        if tasks:
+            notes_parts.append("\n".join(["", "## Tasks"] + [
+                f"- {task.get('title', 'Untitled Task')} (Priority: {_priority(task)})" for task in tasks
+            ]))
+
+        if meetings:
+            notes_parts.append("\n".join(["", "## Meetings"] + [
+                f"- {meeting.get('title', 'Untitled Meeting')} (Date: {meeting.get('date', 'No date specified')})"
+                for meeting in meetings
+            ]))
+
+        if projects:
+            notes_parts.append("\n".join(["", "## Projects"] + [
+                f"- {project.get('name', 'Untitled Project')} (Status: {project.get('status', 'Planning')})"
+                for project in projects
+            ]))
+
+        if research_items:
+            notes_parts.append("\n".join(["", "## Research"] + [
+                f"- {research.get('topic', 'Untitled Research')}" for research in research_items
+            ]))
+
+        if messages:
+            notes_parts.append("\n".join(["", "## Messages"] + [
+                f"- To {message.get('recipient', '')}: {_truncate(message.get('content', ''), 50)}"
+                for message in messages
+            ]))
 
         # Add transcript sources if available
-        transcript_ids = set()
-        for category, items in extracted_items.items():
-            for item in items:
-                if "transcript_id" in item and item["transcript_id"]:
-                    transcript_ids.add(item["transcript_id"])
+        transcript_ids = {
+            item["transcript_id"] for items in extracted_items.values() for item in items if item.get("transcript_id")
+        }
 
         if transcript_ids:
-            transcript_part = ["", "## Source Transcripts"]
-            for transcript_id in sorted(transcript_ids):
-                transcript_part.append(f"- Transcript ID: {transcript_id}")
-            notes_parts.append("\n".join(transcript_part))
+            notes_parts.append("\n".join(["", "## Source Transcripts"] + [
+                f"- Transcript ID: {transcript_id}" for transcript_id in sorted(transcript_ids)
+            ]))
 
         # Join all notes parts
         detailed_notes = "\n".join(notes_parts)
 
         # Create mood based on items
         mood = "Productive"  # Default mood for entries with tasks
-        if counts["projects"] > 0:
+        if projects:
             mood = "Creative"
-        elif counts["research"] > 0:
+        elif research_items:
             mood = "Curious"
-        elif counts["meetings"] > counts["tasks"]:
+        elif len(meetings) > len(tasks):
             mood = "Collaborative"
 
         notion_entry = {
             "properties": {
-                "Entry": {"title": [{"text": {"content": title}}]},
-                "Date": {"date": {"start": self._get_today_date()}},
-                "Notes": {"rich_text": [{"text": {"content": detailed_notes}}]},
-                "Category": {"select": {"name": "Productivity"}},
-                "Mood": {"select": {"name": mood}},
+                "Entry": _title(title),
+                "Date": _date(self._get_today_date()),
+                "Notes": _rich_text(detailed_notes),
+                "Category": _select("Productivity"),
+                "Mood": _select(mood),
                 "Item Count": {"number": total_items}
             }
         }
 
         # Add tags for each category that has items
-        tags = []
-        for category, count in counts.items():
-            if count > 0:
-                tags.append(category.capitalize())
+        tags = [category.capitalize() for category, count in present]
 
         if tags:
-            notion_entry["properties"]["Tags"] = {"multi_select": [{"name": tag} for tag in tags]}
+            notion_entry["properties"]["Tags"] = _multi_select(tags)
 
         return notion_entry
     
+    def _prefix_title(self, raw_title: str, item: Dict[str, Any]) -> str:
+        """
+        Prefix a title with the item's created date when date prefixes are enabled.
+
+        Args:
+            raw_title: Title without a date prefix
+            item: Item the title belongs to
+
+        Returns:
+            Title to use for the Notion entry
+        """
+        if not self.add_date_prefix:
+            return raw_title
+        return f"{item.get('created_date', self.current_date)} | {raw_title}"
+
     def _get_today_date(self) -> str:
         """
         Get today's date in ISO format.
@@ -1373,8 +1455,7 @@ class DataTransformer:
         Returns:
             ISO format date string (YYYY-MM-DD)
         """
-        from datetime import datetime
-        return datetime.now().strftime("%Y-%m-%d")
+        return self._today_str
 
     def _ensure_valid_dates(self, item: Dict[str, Any]) -> None:
         """
@@ -1383,63 +1464,57 @@ class DataTransformer:
         Args:
             item: Dictionary with item details
         """
-        from datetime import datetime
-
-        # Date fields to check
-        date_fields = ["due_date", "created_date", "timeline", "date", "follow_up_date", "meeting_date"]
-
-        # Validate each field
-        for field in date_fields:
-            if field in item and item[field] is not None:
-                # Check if empty
-                if item[field] == "":
-                    if self.empty_value_handling == "default_date":
-                        if field == "due_date":
-                            item[field] = self.default_due_date
-                        else:
-                            item[field] = self.current_date
-                    elif self.empty_value_handling == "remove":
-                        del item[field]
-                    else:  # "null"
-                        item[field] = None
-
-                # Check for special date object formats
-                elif isinstance(item[field], dict):
-                    if "start" in item[field]:
-                        if not item[field]["start"] or item[field]["start"] == "":
-                            item[field]["start"] = self.current_date
-                    if "end" in item[field]:
-                        if not item[field]["end"] or item[field]["end"] == "":
-                            if self.empty_value_handling != "null":
-                                # Default end date is 30 days from start
-                                try:
-                                    from datetime import datetime, timedelta
-                                    start_date = datetime.strptime(item[field]["start"], "%Y-%m-%d")
-                                    item[field]["end"] = (start_date + timedelta(days=30)).strftime("%Y-%m-%d")
-                                except:
-                                    del item[field]["end"]
-                            else:
-                                del item[field]["end"]
+        # Read the defaults once rather than per field
+        current_date = self.current_date
+        empty_handling = self.empty_value_handling
+
+        # Validate each date field the item actually has
+        for field in _DATE_FIELDS.intersection(item):
+            value = item[field]
+            if value is None:
+                continue
+
+            # Check if empty
+            if value == "":
+                if empty_handling == "default_date":
+                    item[field] = self.default_due_date if field == "due_date" else current_date
+                elif empty_handling == "remove":
+                    del item[field]
+                else:  # "null"
+                    item[field] = None
+
+            # Check for special date object formats
+            elif isinstance(value, dict):
+                if not value.get("start", True):  # Present but empty
+                    value["start"] = current_date
+                if not value.get("end", True):  # Present but empty
+                    start = value.get("start")
+                    if empty_handling != "null" and isinstance(start, str):
+                        # Default end date is 30 days from start
+                        try:
+                            value["end"] = (_parse_ymd(start) + timedelta(days=30)).isoformat()
+                        except ValueError:  # Not a date, or out of range such as 2024-02-30
+                            del value["end"]
+                    else:
+                        del value["end"]
 
         # Also check in properties directly if this is already a Notion-formatted item
         if "properties" in item:
-            for prop_name, prop_value in item["properties"].items():
-                if isinstance(prop_value, dict) and "date" in prop_value:
-                    date_value = prop_value["date"]
+            for prop_value in item["properties"].values():
+                if isinstance(prop_value, dict):
+                    date_value = prop_value.get("date")
 
-                    # Skip if None
-                    if date_value is None:
+                    # Skip unless it is a date object
+                    if not isinstance(date_value, dict):
                         continue
 
                     # Handle start date
-                    if isinstance(date_value, dict) and "start" in date_value:
-                        if not date_value["start"] or date_value["start"] == "":
-                            date_value["start"] = self.current_date
+                    if not date_value.get("start", True):  # Present but empty
+                        date_value["start"] = current_date
 
                     # Handle end date
-                    if isinstance(date_value, dict) and "end" in date_value:
-                        if not date_value["end"] or date_value["end"] == "":
-                            date_value["end"] = None  # Remove end date
+                    if not date_value.get("end", True):  # Present but empty
+                        date_value["end"] = None  # Remove end date
 
     def _enrich_transcript_details(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1455,36 +1530,43 @@ class DataTransformer:
         if "transcript_id" not in item:
             return item
 
-        # Create a copy to avoid modifying the original
+        # Create a copy to avoid modifying the original; date normalisation below
+        # rewrites top-level fields that the lifelog summary still reads
         enriched_item = item.copy()
+        current_date = self.current_date
 
-        # Ensure there's a transcript_details dictionary
-        if "transcript_details" not in enriched_item:
-            enriched_item["transcript_details"] = {
+        # Give the item its own transcript_details dictionary; the extractor shares one
+        # between every item from the same transcript, so writing into it would leak
+        # each item's dates into its siblings
+        if "transcript_details" in item:
+            td = dict(item["transcript_details"])
+        else:
+            td = {
                 "content": "",
-                "created_at": self.current_date
+                "created_at": current_date
             }
+        enriched_item["transcript_details"] = td
 
         # Add contextual information about the extraction
-        if "context" not in enriched_item["transcript_details"] and "context" in enriched_item:
-            enriched_item["transcript_details"]["context"] = enriched_item["context"]
+        if "context" not in td and "context" in enriched_item:
+            td["context"] = enriched_item["context"]
 
         # Add creation date
         if "created_date" in enriched_item:
-            enriched_item["transcript_details"]["created_at"] = enriched_item["created_date"]
+            td["created_at"] = enriched_item["created_date"]
         else:
             # Add creation date as of today if not present
-            enriched_item["created_date"] = self.current_date
-            enriched_item["transcript_details"]["created_at"] = self.current_date
+            enriched_item["created_date"] = current_date
+            td["created_at"] = current_date
 
         # Add source reference
         transcript_id = enriched_item.get("transcript_id", "")
         if transcript_id:
-            enriched_item["transcript_details"]["source_reference"] = f"Transcript ID: {transcript_id}"
+            td["source_reference"] = f"Transcript ID: {transcript_id}"
 
         # Add extraction metadata
-        enriched_item["transcript_details"]["extraction_date"] = self.current_date
-        enriched_item["transcript_details"]["extraction_method"] = "Limitless Lifelog Processor"
+        td["extraction_date"] = current_date
+        td["extraction_method"] = "Limitless Lifelog Processor"
 
         # Validate all date fields to ensure they are ISO format
         self._ensure_valid_dates(enriched_item)
@@ -0,0 +1,55 @@
+"""
+Shared LLM API clients for Limitless Lifelog.
+
+Every component that talks to the same provider reuses one client, so TLS
+sessions and keep-alive connections stay warm for the whole run.
+"""
+
+import os
+from functools import lru_cache
+from typing import Any
+
+# Connection pool settings shared by all LLM clients
+_MAX_CONNECTIONS = 100
+_MAX_KEEPALIVE_CONNECTIONS = 20
+_TIMEOUT = 60.0
+
+
+@lru_cache(maxsize=None)
+def get_openai_client() -> Any:
+    """
+    Get the process-wide OpenAI client.
+
+    Returns:
+        openai.OpenAI client backed by a pooled HTTP client
+    """
+    import httpx
+    import openai
+    limits = httpx.Limits(
+        max_connections=_MAX_CONNECTIONS,
+        max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS
+    )
+    return openai.OpenAI(
+        api_key=os.environ.get("OPENAI_API_KEY"),
+        http_client=openai.DefaultHttpxClient(limits=limits, timeout=_TIMEOUT)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_anthropic_client() -> Any:
+    """
+    Get the process-wide Anthropic client.
+
+    Returns:
+        anthropic.Anthropic client backed by a pooled HTTP client
+    """
+    import httpx
+    import anthropic
+    limits = httpx.Limits(
+        max_connections=_MAX_CONNECTIONS,
+        max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS
+    )
+    return anthropic.Anthropic(
+        api_key=os.environ.get("ANTHROPIC_API_KEY"),
+        http_client=anthropic.DefaultHttpxClient(limits=limits, timeout=_TIMEOUT)
+    )
@@ -3,18 +3,27 @@ Configuration management for Limitless Lifelog.
 """
 
 import os
-import configparser
 from pathlib import Path
 from typing import Dict, Optional
 from loguru import logger
 
+# Notion databases the configuration holds an ID for
+_NOTION_DATABASES = ("tasks", "projects", "todo", "lifelog")
+
+
 class Config:
     """
     Configuration manager for Limitless Lifelog.
     
     Handles loading configuration from environment variables and config files.
     """
-    
+
+    __slots__ = (
+        "limitless_api_key", "limitless_api_url", "notion_api_key",
+        "llm_provider", "llm_model", "openai_api_key", "anthropic_api_key",
+        "notion_database_ids",
+    )
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize configuration with optional config file path.
@@ -23,22 +32,22 @@ class Config:
             config_path: Path to configuration file (optional)
         """
         # Default settings
-        self.limitless_api_key = os.environ.get("LIMITLESS_API_KEY", "")
+        env = os.environ
+        self.limitless_api_key = env.get("LIMITLESS_API_KEY", "")
         # Default to environment variable or use a more direct endpoint without added path segments
-        self.limitless_api_url = os.environ.get("LIMITLESS_API_URL", "https://api.limitless.ai/v1")
-        self.notion_api_key = os.environ.get("NOTION_API_KEY", "")
+        self.limitless_api_url = env.get("LIMITLESS_API_URL", "https://api.limitless.ai/v1")
+        self.notion_api_key = env.get("NOTION_API_KEY", "")
 
-        self.llm_provider = os.environ.get("DEFAULT_LLM_PROVIDER", "openai")
-        self.llm_model = os.environ.get("DEFAULT_LLM_MODEL", "gpt-4")
+        self.llm_provider = env.get("DEFAULT_LLM_PROVIDER", "openai")
+        self.llm_model = env.get("DEFAULT_LLM_MODEL", "gpt-4")
 
-        self.openai_api_key = os.environ.get("OPENAI_API_KEY", "")
-        self.anthropic_api_key = os.environ.get("ANTHROPIC_API_KEY", "")
+        self.openai_api_key = env.get("OPENAI_API_KEY", "")
+        self.anthropic_api_key = env.get("ANTHROPIC_API_KEY", "")
         
+        # Database IDs come from NOTION_<DATABASE>_DB_ID, the same keys the config file uses
         self.notion_database_ids = {
-            "tasks": os.environ.get("NOTION_TASKS_DB_ID", ""),
-            "projects": os.environ.get("NOTION_PROJECTS_DB_ID", ""),
-            "todo": os.environ.get("NOTION_TODO_DB_ID", ""),
-            "lifelog": os.environ.get("NOTION_LIFELOG_DB_ID", "")
+            database: env.get(f"NOTION_{database.upper()}_DB_ID", "")
+            for database in _NOTION_DATABASES
         }
         
         # Load from config file if provided
@@ -60,6 +69,9 @@ class Config:
             logger.warning(f"Config file not found: {config_path}")
             return
         
+        # Imported here so runs without a config file skip the import at startup
+        import configparser
+
         config = configparser.ConfigParser()
         config.read(path)
         
@@ -0,0 +1,99 @@
+"""
+Multi-keyword substring scanning for Limitless Lifelog.
+"""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # Optional: pip install -e ".[fast-scan]"
+    ahocorasick = None
+
+
+class KeywordScanner:
+    """
+    Finds the first occurrence of every configured keyword in a text.
+
+    Uses a single Aho-Corasick pass when pyahocorasick is installed. Otherwise
+    the keywords are compiled into one trie-shaped regex, so the scan still
+    runs in C rather than once per keyword.
+    """
+
+    def __init__(self, keywords: List[str]):
+        """
+        Build the scanner.
+
+        Args:
+            keywords: Lowercased keywords to look for
+        """
+        self.keywords = tuple(dict.fromkeys(k for k in keywords if k))
+        self._automaton = None
+        self._pattern = None
+        if not self.keywords:
+            return
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        else:
+            # The lookahead reports the longest keyword starting at each position;
+            # every keyword that is a prefix of it occurs there as well.
+            self._pattern = re.compile(f"(?=({self._trie_pattern(self.keywords)}))")
+            self._prefixes = {
+                keyword: tuple(other for other in self.keywords if keyword.startswith(other))
+                for keyword in self.keywords
+            }
+
+    @staticmethod
+    def _trie_pattern(keywords: Tuple[str, ...]) -> str:
+        """
+        Build a regex matching the longest of the keywords at a position.
+
+        Args:
+            keywords: Keywords to match
+
+        Returns:
+            Regex source in which alternatives share common prefixes
+        """
+        trie = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        def to_pattern(node: Dict[str, Any]) -> str:
+            branches = [re.escape(char) + to_pattern(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+            # Greedy optional continuation prefers the longer keyword
+            return f"(?:{body})?" if "" in node else body
+
+        return to_pattern(trie)
+
+    def scan(self, text_lower: str) -> Dict[str, int]:
+        """
+        Locate keywords in lowercased text.
+
+        Args:
+            text_lower: Lowercased text to scan
+
+        Returns:
+            Dictionary mapping each keyword found to the index of its first occurrence
+        """
+        hits = {}
+        if self._automaton is not None:
+            # Matches arrive ordered by end position, so the first one seen per keyword is its earliest
+            for end, keyword in self._automaton.iter(text_lower):
+                if keyword not in hits:
+                    hits[keyword] = end - len(keyword) + 1
+        elif self._pattern is not None:
+            for match in self._pattern.finditer(text_lower):
+                for keyword in self._prefixes[match.group(1)]:
+                    if keyword not in hits:
+                        hits[keyword] = match.start()
+        return hits
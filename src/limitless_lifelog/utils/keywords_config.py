@@ -4,12 +4,54 @@ Keyword configuration loader for Limitless Lifelog.
 Provides functions to load and manage keyword configurations for transcript processing.
 """
 
+import copy
 import os
-import json
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, FrozenSet, List, Any, Optional, Set
+import orjson
 from loguru import logger
 
+# Keyword configuration used when the file is missing or lacks a section. Accessors
+# return its lists directly, so it must never be modified; _get_default_config()
+# hands out a copy for configurations that may be edited and saved
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "priority_keywords": {
+        "high": ["urgent", "asap", "critical", "important", "high priority", "p0", "p1"],
+        "medium": ["moderate", "medium priority", "p2", "soon"],
+        "low": ["low priority", "whenever", "p3", "p4", "sometime"]
+    },
+    "status_keywords": {
+        "Not Started": ["todo", "to-do", "to do", "planned", "not started", "upcoming", "new", "need to"],
+        "In Progress": ["in progress", "started", "working on", "ongoing", "underway", "beginning"],
+        "Completed": ["done", "completed", "finished", "complete", "resolved"]
+    },
+    "action_keywords": [
+        "todo", "to-do", "to do", "task", "action", "action item",
+        "need to", "should", "must", "will", "plan", "remind me",
+        "don't forget", "remember to", "important", "priority",
+        "follow up", "followup", "follow-up", "deadline", "due",
+        "schedule", "meeting", "project", "complete", "finish",
+        "implement", "create", "build", "make", "fix", "update",
+        "write", "send", "email", "call", "contact", "check",
+        "review", "investigate", "research", "analyze", "test",
+        "TB", "TeeBee"
+    ],
+    "excluded_common_words": [
+        "the", "and", "or", "but", "if", "then", "to", "a", "an", "of", "for", "in",
+        "on", "at", "by", "with", "about", "task", "todo", "need", "should", "must",
+        "important", "critical", "high", "medium", "low", "tb", "teebee"
+    ],
+    "existing_notion_tags": [],
+    "descriptor_tags": {
+        "task": ["action", "task", "todo", "assignment", "work", "responsibility", "duty", "job", "activity"],
+        "project": ["project", "initiative", "endeavor", "undertaking", "plan", "effort", "venture", "mission"],
+        "meeting": ["meeting", "discussion", "call", "conference", "gathering", "session", "huddle", "sync"],
+        "research": ["research", "investigation", "analysis", "study", "exploration", "review", "assessment"],
+        "message": ["message", "communication", "email", "notification", "update", "reminder", "alert"]
+    }
+}
+
+
 class KeywordsConfig:
     """
     Manages keyword configurations for transcript processing and extraction.
@@ -27,7 +69,41 @@ class KeywordsConfig:
         """
         self.default_config_path = str(Path(__file__).parent.parent.parent.parent / "specs" / "config" / "keywords.json")
         self.config_path = config_path or self.default_config_path
-        self.config = self._load_config()
+        # Loaded from disk on first access
+        self._config: Optional[Dict[str, Any]] = None
+
+        # Hash of the file contents last read or written, to skip saves that change nothing
+        self._saved_hash: Optional[int] = None
+
+        self._reset_lookups()
+
+    def _reset_lookups(self) -> None:
+        """Drop the lookup sets derived from the configuration so they are rebuilt on next use."""
+        # Lowercased lookup sets, built on first use
+        self._action_keywords_set: Optional[FrozenSet[str]] = None
+        self._excluded_words_set: Optional[FrozenSet[str]] = None
+
+        # Membership mirrors of the existing Notion tag and descriptor tag lists,
+        # which stay lists to keep their order in the saved file
+        self._existing_tags_set: Optional[Set[str]] = None
+        self._descriptor_tag_sets: Dict[str, Set[str]] = {}
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """
+        Keyword configuration, read from the configuration file on first access.
+
+        Returns:
+            Dictionary with keyword configurations
+        """
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
+
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+        self._reset_lookups()
 
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -37,14 +113,15 @@ class KeywordsConfig:
             Dictionary with keyword configurations
         """
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    config = json.load(f)
-                logger.debug(f"Loaded keywords configuration from {self.config_path}")
-                return config
-            else:
-                logger.warning(f"Keywords configuration file not found at {self.config_path}, using defaults")
-                return self._get_default_config()
+            with open(self.config_path, 'rb') as f:
+                data = f.read()
+            config = orjson.loads(data)
+            self._saved_hash = hash(data)
+            logger.debug(f"Loaded keywords configuration from {self.config_path}")
+            return config
+        except FileNotFoundError:
+            logger.warning(f"Keywords configuration file not found at {self.config_path}, using defaults")
+            return self._get_default_config()
         except Exception as e:
             logger.error(f"Error loading keywords configuration: {e}")
             return self._get_default_config()
@@ -56,42 +133,7 @@ class KeywordsConfig:
         Returns:
             Dictionary with default keyword configurations
         """
-        return {
-            "priority_keywords": {
-                "high": ["urgent", "asap", "critical", "important", "high priority", "p0", "p1"],
-                "medium": ["moderate", "medium priority", "p2", "soon"],
-                "low": ["low priority", "whenever", "p3", "p4", "sometime"]
-            },
-            "status_keywords": {
-                "Not Started": ["todo", "to-do", "to do", "planned", "not started", "upcoming", "new", "need to"],
-                "In Progress": ["in progress", "started", "working on", "ongoing", "underway", "beginning"],
-                "Completed": ["done", "completed", "finished", "complete", "resolved"]
-            },
-            "action_keywords": [
-                "todo", "to-do", "to do", "task", "action", "action item",
-                "need to", "should", "must", "will", "plan", "remind me",
-                "don't forget", "remember to", "important", "priority",
-                "follow up", "followup", "follow-up", "deadline", "due",
-                "schedule", "meeting", "project", "complete", "finish",
-                "implement", "create", "build", "make", "fix", "update",
-                "write", "send", "email", "call", "contact", "check",
-                "review", "investigate", "research", "analyze", "test",
-                "TB", "TeeBee"
-            ],
-            "excluded_common_words": [
-                "the", "and", "or", "but", "if", "then", "to", "a", "an", "of", "for", "in",
-                "on", "at", "by", "with", "about", "task", "todo", "need", "should", "must",
-                "important", "critical", "high", "medium", "low", "tb", "teebee"
-            ],
-            "existing_notion_tags": [],
-            "descriptor_tags": {
-                "task": ["action", "task", "todo", "assignment", "work", "responsibility", "duty", "job", "activity"],
-                "project": ["project", "initiative", "endeavor", "undertaking", "plan", "effort", "venture", "mission"],
-                "meeting": ["meeting", "discussion", "call", "conference", "gathering", "session", "huddle", "sync"],
-                "research": ["research", "investigation", "analysis", "study", "exploration", "review", "assessment"],
-                "message": ["message", "communication", "email", "notification", "update", "reminder", "alert"]
-            }
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG)
 
     def get_priority_keywords(self) -> Dict[str, List[str]]:
         """
@@ -100,7 +142,8 @@ class KeywordsConfig:
         Returns:
             Dictionary mapping priority levels to keywords
         """
-        return self.config.get("priority_keywords", self._get_default_config()["priority_keywords"])
+        value = self.config.get("priority_keywords")
+        return value if value is not None else _DEFAULT_CONFIG["priority_keywords"]
 
     def get_status_keywords(self) -> Dict[str, List[str]]:
         """
@@ -109,7 +152,8 @@ class KeywordsConfig:
         Returns:
             Dictionary mapping status values to keywords
         """
-        return self.config.get("status_keywords", self._get_default_config()["status_keywords"])
+        value = self.config.get("status_keywords")
+        return value if value is not None else _DEFAULT_CONFIG["status_keywords"]
 
     def get_action_keywords(self) -> List[str]:
         """
@@ -118,7 +162,19 @@ class KeywordsConfig:
         Returns:
             List of action keywords
         """
-        return self.config.get("action_keywords", self._get_default_config()["action_keywords"])
+        value = self.config.get("action_keywords")
+        return value if value is not None else _DEFAULT_CONFIG["action_keywords"]
+
+    def get_action_keywords_set(self) -> FrozenSet[str]:
+        """
+        Get action keywords as a lowercased set for membership tests.
+
+        Returns:
+            Frozen set of lowercased action keywords
+        """
+        if self._action_keywords_set is None:
+            self._action_keywords_set = frozenset(k.lower() for k in self.get_action_keywords())
+        return self._action_keywords_set
 
     def get_excluded_words(self) -> List[str]:
         """
@@ -127,7 +183,19 @@ class KeywordsConfig:
         Returns:
             List of common words to exclude from keyword extraction
         """
-        return self.config.get("excluded_common_words", self._get_default_config()["excluded_common_words"])
+        value = self.config.get("excluded_common_words")
+        return value if value is not None else _DEFAULT_CONFIG["excluded_common_words"]
+
+    def get_excluded_words_set(self) -> FrozenSet[str]:
+        """
+        Get excluded common words as a lowercased set for membership tests.
+
+        Returns:
+            Frozen set of lowercased words to exclude from keyword extraction
+        """
+        if self._excluded_words_set is None:
+            self._excluded_words_set = frozenset(w.lower() for w in self.get_excluded_words())
+        return self._excluded_words_set
 
     def get_project_category_keywords(self) -> Dict[str, List[str]]:
         """
@@ -166,7 +234,9 @@ class KeywordsConfig:
         Returns:
             List of descriptor tags for the item type
         """
-        descriptors = self.config.get("descriptor_tags", self._get_default_config()["descriptor_tags"])
+        descriptors = self.config.get("descriptor_tags")
+        if descriptors is None:
+            descriptors = _DEFAULT_CONFIG["descriptor_tags"]
         return descriptors.get(item_type, [])
 
     def update_existing_notion_tags(self, tags: List[str]) -> None:
@@ -180,13 +250,18 @@ class KeywordsConfig:
             return
 
         # Get existing tags
-        existing_tags = set(self.config.get("existing_notion_tags", []))
+        existing_tags = self._existing_tags_set
+        if existing_tags is None:
+            existing_tags = self._existing_tags_set = set(self.config.get("existing_notion_tags", []))
 
-        # Add new tags
-        existing_tags.update(tags)
+        # Nothing to save if every tag is already known
+        new_tags = set(tags) - existing_tags
+        if not new_tags:
+            return
 
-        # Update config
-        self.config["existing_notion_tags"] = sorted(list(existing_tags))
+        # Add new tags and update config
+        existing_tags.update(new_tags)
+        self.config["existing_notion_tags"] = sorted(existing_tags)
 
         # Save to file
         self._save_config()
@@ -194,8 +269,17 @@ class KeywordsConfig:
     def _save_config(self) -> None:
         """Save the current configuration to file."""
         try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            data_hash = hash(data)
+            if data_hash == self._saved_hash:
+                return
+
+            # Write to a temporary file and swap it in so readers never see a partial file
+            tmp_path = f"{self.config_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.config_path)
+            self._saved_hash = data_hash
             logger.debug(f"Saved updated keywords configuration to {self.config_path}")
         except Exception as e:
             logger.error(f"Error saving keywords configuration: {e}")
@@ -212,14 +296,19 @@ class KeywordsConfig:
             return
 
         # Initialize descriptor_tags if it doesn't exist
-        if "descriptor_tags" not in self.config:
-            self.config["descriptor_tags"] = self._get_default_config()["descriptor_tags"]
+        descriptor_tags = self.config.get("descriptor_tags")
+        if descriptor_tags is None:
+            descriptor_tags = self.config["descriptor_tags"] = copy.deepcopy(_DEFAULT_CONFIG["descriptor_tags"])
+            self._descriptor_tag_sets.clear()
 
         # Initialize item type if it doesn't exist
-        if item_type not in self.config["descriptor_tags"]:
-            self.config["descriptor_tags"][item_type] = []
+        item_tags = descriptor_tags.setdefault(item_type, [])
+        known_tags = self._descriptor_tag_sets.get(item_type)
+        if known_tags is None:
+            known_tags = self._descriptor_tag_sets[item_type] = set(item_tags)
 
         # Add tag if it doesn't exist
-        if tag not in self.config["descriptor_tags"][item_type]:
-            self.config["descriptor_tags"][item_type].append(tag)
+        if tag not in known_tags:
+            known_tags.add(tag)
+            item_tags.append(tag)
             self._save_config()
\ No newline at end of file
@@ -3,12 +3,19 @@ State management for Limitless Lifelog.
 """
 
 import os
-import json
 import datetime
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Iterator, Optional, Dict, Any
+import orjson
 from loguru import logger
 
+
+def _dumps(state: Dict[str, Any]) -> bytes:
+    """Serialize state as indented JSON, stringifying values JSON cannot represent."""
+    return orjson.dumps(state, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
 class StateManager:
     """
     Manages state between runs, including tracking last execution time,
@@ -30,15 +37,24 @@ class StateManager:
             config_dir.mkdir(parents=True, exist_ok=True)
             self.state_file = config_dir / "state.json"
         
-        # Create state file if it doesn't exist
-        if not self.state_file.exists():
-            self._initialize_state_file()
-        
-        # Load state
+        # Load state, creating the state file if it doesn't exist
         self.state = self._load_state()
+        
+        # Mirrors state["processed_transcripts"] for constant-time membership checks;
+        # the list is kept as the on-disk form
+        self._processed = set(self.state.get("processed_transcripts", []))
+        
+        # Unsaved changes, and how many batch() blocks are currently open
+        self._dirty = False
+        self._batch_depth = 0
     
-    def _initialize_state_file(self):
-        """Initialize state file with default values."""
+    def _initialize_state_file(self) -> Dict[str, Any]:
+        """
+        Initialize state file with default values.
+        
+        Returns:
+            The default state that was written
+        """
         default_state = {
             "last_run_time": None,
             "processed_transcripts": [],
@@ -57,8 +73,8 @@ class StateManager:
             }
         }
         
-        with open(self.state_file, "w") as f:
-            json.dump(default_state, f, indent=2, default=str)
+        self._write_state(default_state)
+        return default_state
     
     def _load_state(self) -> Dict[str, Any]:
         """
@@ -68,22 +84,63 @@ class StateManager:
             Dictionary containing state information
         """
         try:
-            with open(self.state_file, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+            return orjson.loads(self.state_file.read_bytes())
+        except FileNotFoundError:
+            pass  # First run
+        except orjson.JSONDecodeError as e:
             logger.error(f"Error loading state file: {e}")
-            # If corrupted or missing, create a new one
-            self._initialize_state_file()
-            return self._load_state()
+        
+        # If corrupted or missing, create a new one
+        return self._initialize_state_file()
+    
+    def _write_state(self, state: Dict[str, Any]):
+        """
+        Write state to the state file.
+        
+        Writes to a temporary file and swaps it in, so a crash never leaves a partial state file.
+        
+        Args:
+            state: State to write
+        """
+        tmp_file = self.state_file.with_name(self.state_file.name + ".tmp")
+        tmp_file.write_bytes(_dumps(state))
+        os.replace(tmp_file, self.state_file)
     
     def _save_state(self):
         """Save current state to state file."""
         try:
-            with open(self.state_file, "w") as f:
-                json.dump(self.state, f, indent=2, default=str)
+            self._write_state(self.state)
+            self._dirty = False
         except Exception as e:
             logger.error(f"Error saving state file: {e}")
     
+    def _mark_dirty(self):
+        """Record a state change, saving it straight away unless a batch is open."""
+        self._dirty = True
+        if not self._batch_depth:
+            self._save_state()
+    
+    def flush(self):
+        """Save the state file if anything changed since it was last written."""
+        if self._dirty:
+            self._save_state()
+    
+    @contextmanager
+    def batch(self) -> Iterator["StateManager"]:
+        """
+        Defer state file writes until the block exits, then save once.
+        
+        Yields:
+            This state manager
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+    
     def get_last_run_time(self) -> Optional[datetime.datetime]:
         """
         Get the timestamp of the last run.
@@ -113,7 +170,7 @@ class StateManager:
             time = datetime.datetime.now()
         
         self.state["last_run_time"] = time.isoformat()
-        self._save_state()
+        self._mark_dirty()
     
     def add_processed_transcript(self, transcript_id: str):
         """
@@ -122,10 +179,11 @@ class StateManager:
         Args:
             transcript_id: ID of processed transcript
         """
-        if transcript_id not in self.state["processed_transcripts"]:
+        if transcript_id not in self._processed:
+            self._processed.add(transcript_id)
             self.state["processed_transcripts"].append(transcript_id)
             self.state["statistics"]["total_transcripts_processed"] += 1
-            self._save_state()
+            self._mark_dirty()
     
     def is_transcript_processed(self, transcript_id: str) -> bool:
         """
@@ -137,7 +195,7 @@ class StateManager:
         Returns:
             True if transcript has been processed, False otherwise
         """
-        return transcript_id in self.state["processed_transcripts"]
+        return transcript_id in self._processed
     
     def add_notion_mapping(self, item_type: str, transcript_id: str, notion_id: str):
         """
@@ -157,7 +215,7 @@ class StateManager:
         if item_type in self.state["statistics"]["items_created"]:
             self.state["statistics"]["items_created"][item_type] += 1
         
-        self._save_state()
+        self._mark_dirty()
     
     def get_notion_id(self, item_type: str, transcript_id: str) -> Optional[str]:
         """
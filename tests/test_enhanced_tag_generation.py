@@ -89,8 +89,6 @@ class TestEnhancedTagGeneration(unittest.TestCase):
         self.assertTrue(any(kw.lower() in [t.lower() for t in tags] 
                            for kw in ["login", "form", "validation"]),
                        f"No content keywords found in: {tags}")
-        
-        print(f"Task tags generated: {tags}")
 
     def test_generate_enhanced_tags_for_projects(self):
         """Test enhanced tag generation for projects."""
@@ -118,8 +116,6 @@ class TestEnhancedTagGeneration(unittest.TestCase):
         # Verify project type is detected
         self.assertTrue(any(tag in ["Development", "Web"] for tag in tags),
                        f"No project type tag found in: {tags}")
-        
-        print(f"Project tags generated: {tags}")
 
     def test_tags_from_existing_notion_tags(self):
         """Test that existing Notion tags are used when relevant."""
@@ -134,8 +130,24 @@ class TestEnhancedTagGeneration(unittest.TestCase):
         # Verify existing Notion tags are found and included
         self.assertTrue(any(tag in ["Web Development", "API Integration"] for tag in tags),
                        f"No existing Notion tags found in: {tags}")
-        
-        print(f"Tags with existing Notion tags: {tags}")
+
+    def test_existing_notion_tags_match_whole_words(self):
+        """Test that single-word Notion tags only match whole words in the content."""
+        details = {"content": "Please reply urgently about the data analysis."}
+
+        tags = self.transformer._generate_enhanced_tags({"title": "Reply"}, "task", details)
+
+        self.assertNotIn("Urgent", tags)
+        self.assertIn("Data Analysis", tags)
+
+    def test_tags_capped_when_explicit_tags_saturate(self):
+        """Test that explicit tags beyond the cap are dropped and later stages are skipped."""
+        explicit = [f"Tag{i}" for i in range(12)]
+        task = dict(self.task_data, tags=explicit)
+
+        tags = self.transformer._generate_enhanced_tags(task, "task", task["transcript_details"])
+
+        self.assertEqual(tags, explicit[:10])
 
     def test_tags_for_minimal_item(self):
         """Test tag generation for items with minimal data."""
@@ -161,8 +173,6 @@ class TestEnhancedTagGeneration(unittest.TestCase):
         default_tags = ["Task", "Action", "Voice", "Transcript"]
         self.assertTrue(any(tag in default_tags for tag in tags),
                        f"No default tags found in: {tags}")
-        
-        print(f"Minimal task tags generated: {tags}")
 
 
 if __name__ == "__main__":
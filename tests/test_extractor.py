@@ -0,0 +1,254 @@
+"""
+Tests for item extractor module.
+"""
+
+import json
+import asyncio
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from limitless_lifelog.transcripts.extractor import ItemExtractor, _resolve_date
+
+# Mock transcript data
+MOCK_TRANSCRIPTS = [
+    {
+        "id": "test-id-1",
+        "content": "I need to finish the project report by Friday.",
+        "transcript_details": {"importance_level": "high"}
+    },
+    {
+        "id": "test-id-2",
+        "content": "Schedule a dentist appointment for next week."
+    },
+    {
+        "id": "test-id-3",
+        "content": ""  # Empty content
+    }
+]
+
+
+class FakeCompletions:
+    """Returns one task per request, titled after the transcript content."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, **kwargs):
+        content = kwargs["messages"][-1]["content"]
+        self.calls.append(content)
+        payload = json.dumps({"tasks": [{"title": content}]})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=payload))])
+
+
+class FakeAsyncClient:
+    """Async OpenAI client that, like the real one, only works in the loop it was created in."""
+
+    def __init__(self, completions):
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        self.chat = SimpleNamespace(completions=self)
+        self._completions = completions
+
+    async def create(self, **kwargs):
+        assert asyncio.get_running_loop() is self.loop and not self.closed
+        return await self._completions.create(**kwargs)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBatchClient:
+    """Fakes the OpenAI files and batches endpoints used by the Batch API path."""
+
+    def __init__(self, failing=()):
+        self.files = self
+        self.batches = self
+        self.uploaded = None
+        self.polls = 0
+        # Transcript contents whose individual requests fail inside the batch
+        self.failing = failing
+
+    def create(self, **kwargs):
+        if "purpose" in kwargs:
+            self.uploaded = kwargs["file"][1].decode("utf-8")
+            return SimpleNamespace(id="file-in")
+        return SimpleNamespace(id="batch-1", status="validating", output_file_id=None)
+
+    def retrieve(self, batch_id):
+        self.polls += 1
+        if self.polls < 2:
+            return SimpleNamespace(id=batch_id, status="in_progress", output_file_id=None)
+        return SimpleNamespace(id=batch_id, status="completed", output_file_id="file-out")
+
+    def content(self, file_id):
+        lines = []
+        for line in self.uploaded.splitlines():
+            request = json.loads(line)
+            prompt = request["body"]["messages"][-1]["content"]
+            if any(content in prompt for content in self.failing):
+                lines.append(json.dumps({"custom_id": request["custom_id"], "response": {"status_code": 500}}))
+                continue
+            payload = json.dumps({"tasks": [{"title": prompt}]})
+            lines.append(json.dumps({
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": {"choices": [{"message": {"content": payload}}]}}
+            }))
+        # Batch output order isn't guaranteed to match the input
+        return SimpleNamespace(text="\n".join(reversed(lines)))
+
+
+@pytest.fixture
+def completions():
+    """Completions endpoint shared by the async clients of every run."""
+    return FakeCompletions()
+
+
+@pytest.fixture
+def extractor(tmp_path, completions):
+    """Extractor wired to fake async OpenAI clients and a temporary cache."""
+    item_extractor = ItemExtractor(llm_provider="none", llm_model="none", cache_path=str(tmp_path / "processed.db"))
+    item_extractor.llm_provider = "openai"
+    item_extractor.async_clients = []
+
+    def new_async_client():
+        client = FakeAsyncClient(completions)
+        item_extractor.async_clients.append(client)
+        return client
+
+    item_extractor._new_async_client = new_async_client
+    return item_extractor
+
+
+class TestItemExtractor:
+    """Test suite for ItemExtractor class."""
+
+    def test_extract_items_concurrently(self, extractor, completions):
+        """Test that every non-empty transcript is extracted, in input order."""
+        result = extractor.extract_items(MOCK_TRANSCRIPTS)
+
+        tasks = result["tasks"]
+        assert [task["transcript_id"] for task in tasks] == ["test-id-1", "test-id-2"]
+        assert tasks[0]["transcript_details"] == {"importance_level": "high"}
+        assert "transcript_details" not in tasks[1]
+        assert len(completions.calls) == 2
+
+    def test_extract_items_deduplicates_content(self, extractor, completions):
+        """Test that transcripts with identical content share one LLM call."""
+        duplicate = dict(MOCK_TRANSCRIPTS[0], id="test-id-1-copy")
+        
+        result = extractor.extract_items([MOCK_TRANSCRIPTS[0], duplicate])
+        
+        tasks = result["tasks"]
+        assert [task["transcript_id"] for task in tasks] == ["test-id-1", "test-id-1-copy"]
+        assert tasks[0]["item_id"] != tasks[1]["item_id"]
+        assert len(completions.calls) == 1
+
+    def test_extract_items_async_deduplicates_without_cache(self, extractor, completions):
+        """Test that duplicates reuse the first copy's response even when no cache is available."""
+        extractor.cache.close()
+        duplicate = dict(MOCK_TRANSCRIPTS[0], id="test-id-1-copy")
+
+        result = asyncio.run(extractor.extract_items_async([MOCK_TRANSCRIPTS[0], duplicate, duplicate]))
+
+        tasks = result["tasks"]
+        assert [task["transcript_id"] for task in tasks] == ["test-id-1", "test-id-1-copy", "test-id-1-copy"]
+        assert len({task["item_id"] for task in tasks}) == 3
+        assert len(completions.calls) == 1
+
+    def test_extract_items_uses_cache(self, extractor, completions):
+        """Test that repeated content is served from the extraction cache."""
+        first = extractor.extract_items(MOCK_TRANSCRIPTS)
+        second = extractor.extract_items(MOCK_TRANSCRIPTS)
+
+        assert len(completions.calls) == 2
+        assert [task["title"] for task in second["tasks"]] == [task["title"] for task in first["tasks"]]
+        # Item IDs are regenerated for every extraction
+        assert second["tasks"][0]["item_id"] != first["tasks"][0]["item_id"]
+
+    def test_extract_items_twice_uses_fresh_async_client(self, extractor, completions):
+        """Test that each run gets its own async client, closed before its event loop ends."""
+        first = extractor.extract_items(MOCK_TRANSCRIPTS[:1])
+        second = extractor.extract_items(MOCK_TRANSCRIPTS[1:])
+
+        assert [task["transcript_id"] for task in first["tasks"] + second["tasks"]] == ["test-id-1", "test-id-2"]
+        assert len(completions.calls) == 2
+        assert len(extractor.async_clients) == 2
+        assert all(client.closed for client in extractor.async_clients)
+
+    def test_extract_items_batch(self, extractor, monkeypatch):
+        """Test that batch results are mapped back to their transcripts."""
+        monkeypatch.setattr("limitless_lifelog.transcripts.extractor.time.sleep", lambda seconds: None)
+        extractor.client = FakeBatchClient()
+
+        duplicate = dict(MOCK_TRANSCRIPTS[1], id="test-id-2-copy")
+        result = extractor.extract_items_batch(MOCK_TRANSCRIPTS + [duplicate])
+
+        tasks = result["tasks"]
+        assert [task["transcript_id"] for task in tasks] == ["test-id-1", "test-id-2", "test-id-2-copy"]
+        assert tasks[1]["title"].endswith(MOCK_TRANSCRIPTS[1]["content"])
+        assert len(extractor.client.uploaded.splitlines()) == 2
+        assert extractor.client.polls == 2
+
+    def test_extract_items_batch_retries_failed_requests(self, extractor, completions, monkeypatch):
+        """Test that transcripts whose batch request failed are extracted directly instead."""
+        monkeypatch.setattr("limitless_lifelog.transcripts.extractor.time.sleep", lambda seconds: None)
+        extractor.client = FakeBatchClient(failing=[MOCK_TRANSCRIPTS[0]["content"]])
+
+        result = extractor.extract_items_batch(MOCK_TRANSCRIPTS)
+
+        assert [task["transcript_id"] for task in result["tasks"]] == ["test-id-2", "test-id-1"]
+        assert len(completions.calls) == 1
+        assert MOCK_TRANSCRIPTS[0]["content"] in completions.calls[0]
+
+    def test_relative_dates_resolved_after_extraction(self, extractor):
+        """Test that relative due dates left by the LLM are resolved locally and unresolved ones dropped."""
+        payload = json.dumps({"tasks": [
+            {"title": "Report", "due_date": "tomorrow"},
+            {"title": "Review", "due_date": "2024-05-10"},
+            {"title": "Someday", "due_date": "eventually"},
+            {"title": "Later", "due_date": "the day after tomorrow"}
+        ]})
+
+        extracted = extractor._parse_extraction(payload, "test-id-1")
+
+        today = datetime.now()
+        tomorrow = (today + timedelta(days=1)).strftime("%Y-%m-%d")
+        day_after = (today + timedelta(days=2)).strftime("%Y-%m-%d")
+        assert [task.get("due_date") for task in extracted["tasks"]] == [tomorrow, "2024-05-10", None, day_after]
+        assert "due_date" not in extracted["tasks"][2]
+
+    def test_message_follow_up_date_resolved(self, extractor):
+        """Test that message follow-up dates are resolved like due dates."""
+        payload = json.dumps({"messages": [
+            {"recipient": "Sam", "follow_up_date": "tomorrow"},
+            {"recipient": "Alex", "follow_up_date": "when they reply"}
+        ]})
+
+        extracted = extractor._parse_extraction(payload, "test-id-1")
+
+        tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+        assert [m.get("follow_up_date") for m in extracted["messages"]] == [tomorrow, None]
+
+    def test_resolve_date_phrases(self):
+        """Test weekday, month and day phrases against a fixed Thursday."""
+        thursday = date(2026, 10, 15).toordinal()
+
+        assert _resolve_date("last friday", thursday) == "2026-10-09"
+        assert _resolve_date("next tuesday", thursday) == "2026-10-20"
+        assert _resolve_date("in two weeks", thursday) == "2026-10-29"
+        assert _resolve_date("nov 3", thursday) == "2026-11-03"
+        assert _resolve_date("3rd of march", thursday) == "2027-03-03"
+        assert _resolve_date("the 14th", thursday) == "2026-11-14"
+        assert _resolve_date("maybe 5", thursday) is None
+        assert _resolve_date("end of the week", thursday) is None
+
+    def test_unwritable_home_disables_extraction_cache(self, tmp_path, monkeypatch):
+        """Test that a cache directory that cannot be created falls back to no cache."""
+        home = tmp_path / "home"
+        home.write_text("not a directory")
+        monkeypatch.setattr("pathlib.Path.home", lambda: home)
+
+        item_extractor = ItemExtractor(llm_provider="none", llm_model="none")
+
+        assert item_extractor.cache._db is None
@@ -0,0 +1,84 @@
+"""
+Tests for keywords configuration module.
+"""
+
+import json
+from limitless_lifelog.utils.keywords_config import KeywordsConfig
+
+
+class TestKeywordsConfig:
+    """Test suite for KeywordsConfig class."""
+
+    def test_keyword_sets_are_lowercased(self, tmp_path):
+        """Test that the lookup sets hold lowercased keywords and are built once."""
+        config_path = tmp_path / "keywords.json"
+        config_path.write_text(json.dumps({
+            "action_keywords": ["Follow Up", "TB", "call"],
+            "excluded_common_words": ["The", "and"]
+        }))
+        config = KeywordsConfig(str(config_path))
+
+        assert config.get_action_keywords_set() == {"follow up", "tb", "call"}
+        assert config.get_excluded_words_set() == {"the", "and"}
+        assert config.get_action_keywords_set() is config.get_action_keywords_set()
+        # The original spellings are still available from the list accessors
+        assert config.get_action_keywords() == ["Follow Up", "TB", "call"]
+
+    def test_config_file_read_on_first_access(self, tmp_path):
+        """Test that the configuration file is only read when a keyword is first requested."""
+        config_path = tmp_path / "keywords.json"
+        config = KeywordsConfig(str(config_path))
+
+        # Written after construction, yet still picked up by the first accessor call
+        config_path.write_text(json.dumps({"date_keywords": ["tomorrow"]}))
+
+        assert config.get_date_keywords() == ["tomorrow"]
+
+    def test_missing_sections_fall_back_to_shared_defaults(self, tmp_path):
+        """Test that missing sections use the defaults without letting edits leak into them."""
+        config_path = tmp_path / "keywords.json"
+        config_path.write_text(json.dumps({"action_keywords": ["call"]}))
+        config = KeywordsConfig(str(config_path))
+
+        assert "urgent" in config.get_priority_keywords()["high"]
+        assert "the" in config.get_excluded_words()
+        assert config.get_descriptor_tags("task")[0] == "action"
+
+        config.add_descriptor_tag("task", "chore")
+        assert "chore" in config.get_descriptor_tags("task")
+        assert "chore" not in KeywordsConfig(str(tmp_path / "missing.json")).get_descriptor_tags("task")
+
+    def test_tag_updates_only_save_changes(self, tmp_path, monkeypatch):
+        """Test that known Notion and descriptor tags are skipped without rewriting the file."""
+        config_path = tmp_path / "keywords.json"
+        config_path.write_text(json.dumps({"existing_notion_tags": ["Web"], "descriptor_tags": {"task": ["action"]}}))
+        config = KeywordsConfig(str(config_path))
+        saves = []
+        monkeypatch.setattr(config, "_save_config", lambda: saves.append(True))
+
+        config.update_existing_notion_tags(["Web"])
+        config.add_descriptor_tag("task", "action")
+        assert saves == []
+
+        config.update_existing_notion_tags(["Data", "Web"])
+        config.add_descriptor_tag("task", "chore")
+        config.add_descriptor_tag("task", "chore")
+        assert len(saves) == 2
+        assert config.get_existing_notion_tags() == ["Data", "Web"]
+        assert config.get_descriptor_tags("task") == ["action", "chore"]
+
+    def test_save_skipped_when_file_unchanged(self, tmp_path):
+        """Test that saving a configuration identical to the file on disk does not rewrite it."""
+        config_path = tmp_path / "keywords.json"
+        config = KeywordsConfig(str(config_path))
+        config.config = {"date_keywords": ["tomorrow"]}
+        config._save_config()
+        saved_at = config_path.stat().st_mtime_ns
+
+        config._save_config()
+        assert config_path.stat().st_mtime_ns == saved_at
+
+        config.config["date_keywords"].append("today")
+        config._save_config()
+        assert json.loads(config_path.read_text()) == {"date_keywords": ["tomorrow", "today"]}
+        assert not (tmp_path / "keywords.json.tmp").exists()
@@ -0,0 +1,113 @@
+"""
+Tests for Notion client module.
+"""
+
+import pytest
+from limitless_lifelog.notion.client import NotionClient
+
+# Minimal schema for a tasks database
+MOCK_SCHEMA = {
+    "properties": {
+        "Name": {"type": "title"},
+        "Notes": {"type": "rich_text"},
+        "Priority": {"type": "select", "select": {"options": [{"name": "High"}, {"name": "Medium"}]}}
+    }
+}
+
+
+class FakeNotion:
+    """Records the calls made through the Notion SDK."""
+
+    def __init__(self):
+        self.created_pages = []
+        self.comments = self
+        self.pages = self
+        self.databases = self
+
+    def retrieve(self, database_id):
+        return MOCK_SCHEMA
+
+    def create(self, **kwargs):
+        if "properties" in kwargs:
+            self.created_pages.append(kwargs["properties"])
+            return {"id": f"page-{len(self.created_pages)}"}
+        return {}
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Notion client backed by a fake SDK and a temporary page cache."""
+    notion_client = NotionClient("test-key", {"tasks": "db-1"}, idempotency_db=str(tmp_path / "pages.db"))
+    notion_client.notion = FakeNotion()
+    yield notion_client
+    notion_client.close()
+
+
+def make_entry(title, transcript_id="test-id-1"):
+    return {
+        "transcript_id": transcript_id,
+        "properties": {
+            "Title": {"title": [{"text": {"content": title}}]},
+            "Priority": {"select": {"name": "High"}}
+        }
+    }
+
+
+class TestNotionClient:
+    """Test suite for NotionClient class."""
+
+    def test_update_databases_skips_created_entries(self, client):
+        """Test that re-running an update doesn't create duplicate pages."""
+        notion_data = {"tasks": [make_entry("Write report"), make_entry("Book dentist")]}
+
+        first = client.update_databases(notion_data)
+        second = client.update_databases(notion_data)
+
+        assert first["created"] == 2
+        assert second["created"] == 0
+        assert second["skipped"] == 2
+        assert len(client.notion.created_pages) == 2
+
+    def test_update_databases_strict_skips_placeholder_titles(self, client):
+        """Test that strict mode skips entries without title content."""
+        untitled = {"properties": {"Priority": {"select": {"name": "High"}}}}
+        notion_data = {"tasks": [make_entry("Write report"), untitled]}
+
+        results = client.update_databases(notion_data, strict=True)
+
+        assert results["created"] == 1
+        assert results["skipped"] == 1
+        assert len(client.notion.created_pages) == 1
+
+    def test_entries_sharing_a_title_are_kept_apart(self, client):
+        """Test that distinct items from one transcript with the same title each get a page."""
+        high = make_entry("Follow up")
+        medium = make_entry("Follow up")
+        medium["properties"]["Priority"] = {"select": {"name": "Medium"}}
+
+        results = client.update_databases({"tasks": [high, medium]})
+
+        assert results["created"] == 2
+
+    def test_entries_without_transcript_are_always_created(self, client):
+        """Test that entries with no source transcript, like the run summary, bypass the cache."""
+        summary = make_entry("Processed: 2 tasks, 1 meetings")
+        del summary["transcript_id"]
+
+        first = client.update_databases({"tasks": [summary]})
+        second = client.update_databases({"tasks": [summary]})
+
+        assert first["created"] == 1
+        assert second["created"] == 1
+        assert len(client.notion.created_pages) == 2
+
+    def test_unwritable_home_disables_page_cache(self, tmp_path, monkeypatch):
+        """Test that a page cache that cannot be created leaves the client usable."""
+        home = tmp_path / "home"
+        home.write_text("not a directory")
+        monkeypatch.setattr("pathlib.Path.home", lambda: home)
+
+        notion_client = NotionClient("test-key", {"tasks": "db-1"})
+
+        assert notion_client._idem_db is None
+        notion_client.close()
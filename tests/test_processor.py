@@ -2,11 +2,15 @@
 Tests for transcript processor module.
 """
 
+import io
+import json
+
+import orjson
 import pytest
 from limitless_lifelog.transcripts.processor import TranscriptProcessor
 
-# Mock transcript data
-MOCK_TRANSCRIPTS = [
+# Mock transcript data; a tuple so tests cannot add or drop entries from the shared fixture
+MOCK_TRANSCRIPTS = (
     {
         "id": "test-id-1",
         "timestamp": "2023-05-06T14:23:15",
@@ -31,81 +35,126 @@ MOCK_TRANSCRIPTS = [
         "content": "hmm",  # Too short content
         "metadata": {"tags": ["work"]}
     }
-]
+)
+
+# Serialized once for the tests that write transcript files
+MOCK_JSON_BYTES = orjson.dumps(MOCK_TRANSCRIPTS)
+MOCK_JSON_HALVES = (orjson.dumps(MOCK_TRANSCRIPTS[:2]), orjson.dumps(MOCK_TRANSCRIPTS[2:]))
+
+
+@pytest.fixture(scope="module")
+def processor():
+    """Processor shared by the tests that only read from it."""
+    return TranscriptProcessor(llm_provider="none", llm_model="none")
+
+
+@pytest.fixture
+def patchable_processor():
+    """Fresh processor for tests that patch its attributes, so parallel runs never share one."""
+    return TranscriptProcessor(llm_provider="none", llm_model="none")
+
+
+@pytest.fixture(scope="module")
+def load_layout(tmp_path_factory):
+    """Transcript files for the load tests, written once since loading only reads them."""
+    root = tmp_path_factory.mktemp("load")
+    
+    single = root / "test_transcript.json"
+    single.write_bytes(MOCK_JSON_BYTES)
+    
+    # Two files with two transcripts each
+    directory = root / "transcripts"
+    directory.mkdir()
+    (directory / "transcript1.json").write_bytes(MOCK_JSON_HALVES[0])
+    (directory / "transcript2.json").write_bytes(MOCK_JSON_HALVES[1])
+    
+    # Invalid files are logged and yield no transcripts
+    invalid = root / "invalid.json"
+    invalid.write_text("This is not valid JSON")
+    
+    return {"single": single, "dir": directory, "invalid": invalid}
+
 
 class TestTranscriptProcessor:
     """Test suite for TranscriptProcessor class."""
     
-    def test_filter_transcripts(self):
+    @pytest.mark.parametrize("relevant,expected_ids", [
+        (True, ["test-id-1", "test-id-2", "test-id-5"]),
+        (False, ["test-id-1", "test-id-2"]),
+    ])
+    def test_filter_transcripts(self, patchable_processor, monkeypatch, relevant, expected_ids):
         """Test filtering of transcripts."""
-        # Initialize processor with mock LLM provider that won't be used
-        # since we'll mock the _check_relevance method
-        processor = TranscriptProcessor(llm_provider="none", llm_model="none")
+        # Patch the _check_relevance method; it is only consulted for
+        # transcripts without action keywords, like the small-talk one here
+        monkeypatch.setattr(patchable_processor, "_check_relevance", lambda transcript: relevant)
+        small_talk = {
+            "id": "test-id-5",
+            "timestamp": "2023-05-06T14:40:00",
+            "content": "The weather was pleasant during the afternoon walk in the park.",
+            "metadata": {"tags": ["personal"]}
+        }
         
-        # Patch the _check_relevance method to always return True
-        # This simulates the LLM check always considering transcripts relevant
-        original_check = processor._check_relevance
-        processor._check_relevance = lambda transcript: True
+        filtered = patchable_processor.filter_transcripts([*MOCK_TRANSCRIPTS, small_talk])
         
-        try:
-            filtered = processor.filter_transcripts(MOCK_TRANSCRIPTS)
-            
-            # Should filter out empty and too short content
-            assert len(filtered) == 2
-            assert filtered[0]["id"] == "test-id-1"
-            assert filtered[1]["id"] == "test-id-2"
-            
-        finally:
-            # Restore original method
-            processor._check_relevance = original_check
+        # Should filter out empty and too short content, and irrelevant content
+        assert [t["id"] for t in filtered] == expected_ids
     
-    def test_load_from_path_single_file(self, tmp_path):
-        """Test loading transcripts from a single file."""
-        import json
-        
-        # Create a temporary file with mock transcript data
-        file_path = tmp_path / "test_transcript.json"
-        with open(file_path, 'w') as f:
-            json.dump(MOCK_TRANSCRIPTS, f)
-        
-        processor = TranscriptProcessor(llm_provider="none", llm_model="none")
-        loaded = processor.load_from_path(str(file_path))
-        
-        assert len(loaded) == 4
-        assert loaded[0]["id"] == "test-id-1"
+    def test_keyword_scanner_matches_fallback(self, monkeypatch):
+        """Test that the Aho-Corasick scan finds the same positions as str.find."""
+        from limitless_lifelog.utils import keyword_scanner
+
+        keywords = ["follow up", "follow", "up", "urgent", "urgently", "tb"]
+        text = "please follow up urgently, tb will follow up again"
+        expected = {k: text.find(k) for k in keywords if k in text}
+
+        scanner = keyword_scanner.KeywordScanner(keywords)
+        assert scanner.scan(text) == expected
+
+        monkeypatch.setattr(keyword_scanner, "ahocorasick", None)
+        assert keyword_scanner.KeywordScanner(keywords).scan(text) == expected
     
-    def test_load_from_path_directory(self, tmp_path):
-        """Test loading transcripts from a directory."""
-        import json
+    def test_archive_all_transcripts(self, patchable_processor, tmp_path, monkeypatch):
+        """Test archiving transcripts and skipping them on later runs."""
+        monkeypatch.setattr(patchable_processor, "archive_dir", str(tmp_path / "archive"))
         
-        # Create a directory with multiple transcript files
-        dir_path = tmp_path / "transcripts"
-        dir_path.mkdir()
+        archived = patchable_processor.archive_all_transcripts(MOCK_TRANSCRIPTS[:2])
+        assert set(archived) == {"test-id-1", "test-id-2"}
+        with open(archived["test-id-1"]) as f:
+            assert json.load(f)["content"] == MOCK_TRANSCRIPTS[0]["content"]
         
-        # Create first file with two transcripts
-        file1_path = dir_path / "transcript1.json"
-        with open(file1_path, 'w') as f:
-            json.dump(MOCK_TRANSCRIPTS[:2], f)
+        # Already archived transcripts keep their original path
+        rerun = patchable_processor.archive_all_transcripts(MOCK_TRANSCRIPTS[:3])
+        assert rerun["test-id-1"] == archived["test-id-1"]
+        assert set(rerun) == {"test-id-1", "test-id-2", "test-id-3"}
         
-        # Create second file with two transcripts
-        file2_path = dir_path / "transcript2.json"
-        with open(file2_path, 'w') as f:
-            json.dump(MOCK_TRANSCRIPTS[2:], f)
+        # The index is append-only: one record per archived transcript
+        index_lines = (tmp_path / "archive" / "transcript_index.jsonl").read_text().splitlines()
+        assert len(index_lines) == 3
+    
+    def test_load_transcript_index_migrates_legacy_json(self, patchable_processor, tmp_path, monkeypatch):
+        """Test that an index in the old JSON format is still honoured."""
+        archive_dir = tmp_path / "archive"
+        archive_dir.mkdir()
+        with open(archive_dir / "transcript_index.json", 'w') as f:
+            json.dump({"test-id-1": "old/path.json"}, f)
         
-        processor = TranscriptProcessor(llm_provider="none", llm_model="none")
-        loaded = processor.load_from_path(str(dir_path))
+        monkeypatch.setattr(patchable_processor, "archive_dir", str(archive_dir))
         
-        assert len(loaded) == 4
+        assert patchable_processor.load_transcript_index() == {"test-id-1": "old/path.json"}
+        assert (archive_dir / "transcript_index.jsonl").exists()
+    
+    @pytest.mark.parametrize("layout,expected", [("single", 4), ("dir", 4), ("invalid", 0)])
+    def test_load_from_path(self, processor, load_layout, layout, expected):
+        """Test loading transcripts from a file, a directory, and an invalid file."""
+        loaded = processor.load_from_path(str(load_layout[layout]))
         
-    def test_load_invalid_file(self, tmp_path):
-        """Test loading an invalid transcript file."""
-        # Create an invalid JSON file
-        file_path = tmp_path / "invalid.json"
-        with open(file_path, 'w') as f:
-            f.write("This is not valid JSON")
+        assert len(loaded) == expected
+        if layout == "single":
+            assert loaded[0]["id"] == "test-id-1"
         
-        processor = TranscriptProcessor(llm_provider="none", llm_model="none")
-        loaded = processor.load_from_path(str(file_path))
+    def test_load_wrapped_transcripts_stream(self, processor):
+        """Test parsing a stream with a top-level "transcripts" list."""
+        stream = io.BytesIO(orjson.dumps({"transcripts": MOCK_TRANSCRIPTS, "exported_at": "2023-05-07"}))
+        loaded = list(processor._iter_transcript_stream(stream, "export.json"))
         
-        # Should return empty list for invalid file
-        assert len(loaded) == 0
\ No newline at end of file
+        assert [t["id"] for t in loaded] == [t["id"] for t in MOCK_TRANSCRIPTS]
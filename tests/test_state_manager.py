@@ -0,0 +1,67 @@
+"""
+Tests for state manager module.
+"""
+
+import json
+from limitless_lifelog.utils.state_manager import StateManager
+
+
+class TestStateManager:
+    """Test suite for StateManager class."""
+
+    def test_processed_transcripts_persist(self, tmp_path):
+        """Test that processed transcripts are recorded once and survive a reload."""
+        state_file = tmp_path / "state.json"
+        manager = StateManager(str(state_file))
+
+        assert not manager.is_transcript_processed("test-id-1")
+        manager.add_processed_transcript("test-id-1")
+        manager.add_processed_transcript("test-id-1")
+        assert manager.is_transcript_processed("test-id-1")
+
+        state = json.loads(state_file.read_text())
+        assert state["processed_transcripts"] == ["test-id-1"]
+        assert state["statistics"]["total_transcripts_processed"] == 1
+
+        reloaded = StateManager(str(state_file))
+        assert reloaded.is_transcript_processed("test-id-1")
+        assert not reloaded.is_transcript_processed("test-id-2")
+
+    def test_batch_saves_once(self, tmp_path, monkeypatch):
+        """Test that changes inside a batch are written in a single save on exit."""
+        state_file = tmp_path / "state.json"
+        manager = StateManager(str(state_file))
+        saves = []
+        original = manager._save_state
+
+        def record():
+            saves.append(True)
+            original()
+
+        monkeypatch.setattr(manager, "_save_state", record)
+        with manager.batch():
+            for transcript_id in ("test-id-1", "test-id-2", "test-id-3"):
+                manager.add_processed_transcript(transcript_id)
+            manager.add_notion_mapping("tasks", "test-id-1", "notion-1")
+            assert saves == []
+
+        assert len(saves) == 1
+        state = json.loads(state_file.read_text())
+        assert state["processed_transcripts"] == ["test-id-1", "test-id-2", "test-id-3"]
+        assert state["notion_mappings"]["tasks"] == {"test-id-1": "notion-1"}
+        assert not (tmp_path / "state.json.tmp").exists()
+
+        manager.flush()
+        assert len(saves) == 1
+
+    def test_missing_or_corrupt_state_file_is_recreated(self, tmp_path):
+        """Test that a missing or unreadable state file is replaced with the default state."""
+        state_file = tmp_path / "state.json"
+        manager = StateManager(str(state_file))
+        assert manager.get_last_run_time() is None
+        assert json.loads(state_file.read_text())["processed_transcripts"] == []
+
+        state_file.write_text("{not json")
+        manager = StateManager(str(state_file))
+        assert manager.get_statistics()["total_transcripts_processed"] == 0
+        assert json.loads(state_file.read_text())["notion_mappings"]["todo"] == {}
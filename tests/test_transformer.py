@@ -0,0 +1,120 @@
+"""
+Tests for data transformer module.
+"""
+
+from limitless_lifelog.transcripts.transformer import DataTransformer
+
+# Mock extracted items, two of them from the same transcript
+MOCK_ITEMS = {
+    "tasks": [
+        {
+            "transcript_id": "test-id-1",
+            "title": "Finish the project report",
+            "created_date": "2023-05-06",
+            "transcript_details": {"content": "I need to finish the project report by Friday."}
+        }
+    ],
+    "meetings": [
+        {
+            "transcript_id": "test-id-1",
+            "title": "Report review",
+            "created_date": "2023-05-07"
+        }
+    ]
+}
+
+
+class TestDataTransformer:
+    """Test suite for DataTransformer class."""
+
+    def test_each_item_enriched_once(self, monkeypatch):
+        """Test that a task feeding both the tasks and todo databases is enriched once."""
+        transformer = DataTransformer()
+        enriched = []
+        original = transformer._enrich_transcript_details
+
+        def record(item):
+            enriched.append(item["title"])
+            return original(item)
+
+        monkeypatch.setattr(transformer, "_enrich_transcript_details", record)
+        notion_data = transformer.transform(MOCK_ITEMS)
+
+        assert enriched == ["Finish the project report", "Report review"]
+        assert len(notion_data["tasks"]) == 2
+        assert len(notion_data["todo"]) == 1
+
+    def test_items_from_same_transcript_keep_own_dates(self):
+        """Test that enrichment is per item even when items share a transcript."""
+        transformer = DataTransformer()
+        notion_data = transformer.transform(MOCK_ITEMS)
+
+        task, meeting = notion_data["tasks"]
+        assert task["properties"]["Created Date"]["date"]["start"] == "2023-05-06"
+        assert meeting["properties"]["Created Date"]["date"]["start"] == "2023-05-07"
+        assert task["properties"]["Source"]["rich_text"][0]["text"]["content"] == "Transcript ID: test-id-1"
+
+    def test_transform_meetings_batch_matches_transform(self):
+        """Test that the meeting batch path builds the same tasks as transform()."""
+        transformer = DataTransformer()
+        meetings = MOCK_ITEMS["meetings"] + [{"title": "Standup"}]
+
+        batch = transformer.transform_meetings_batch(meetings)
+
+        assert batch == transformer.transform({"meetings": meetings})["tasks"]
+        assert transformer.transform_meetings_batch([]) == []
+
+    def test_default_dates_refreshed_per_batch(self, monkeypatch):
+        """Test that a long-lived transformer picks up the new day on its next batch."""
+        from datetime import datetime
+        from limitless_lifelog.transcripts import transformer as transformer_module
+
+        class NextDay(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2030, 1, 31, 0, 5)
+
+        transformer = DataTransformer()
+        monkeypatch.setattr(transformer_module, "datetime", NextDay)
+        notion_data = transformer.transform({"meetings": [{"title": "Planning"}], "projects": [{"name": "Launch"}]})
+
+        meeting = notion_data["tasks"][0]["properties"]
+        project = notion_data["projects"][0]["properties"]
+        assert meeting["Created Date"]["date"]["start"] == "2030-01-31"
+        assert meeting["Due Date"]["date"]["start"] == "2030-02-07"
+        assert project["Timeline"]["date"] == {"start": "2030-01-31", "end": "2030-05-01"}
+
+    def test_empty_timeline_end_defaults_to_thirty_days(self):
+        """Test that an empty end date is filled from a valid start and dropped otherwise."""
+        transformer = DataTransformer()
+        item = {"timeline": {"start": "2024-01-31", "end": ""}, "date": {"start": "soon", "end": ""}}
+
+        transformer._ensure_valid_dates(item)
+
+        assert item["timeline"] == {"start": "2024-01-31", "end": "2024-03-01"}
+        assert item["date"] == {"start": "soon"}
+
+    def test_unpadded_timeline_start_still_parsed(self):
+        """Test that start dates strptime accepts without zero padding still get an end date."""
+        transformer = DataTransformer()
+        item = {"timeline": {"start": "2024-5-7", "end": ""}}
+
+        transformer._ensure_valid_dates(item)
+
+        assert item["timeline"] == {"start": "2024-5-7", "end": "2024-06-06"}
+
+    def test_shared_transcript_details_not_mutated(self):
+        """Test that items sharing a transcript's details each get their own enriched copy."""
+        transformer = DataTransformer()
+        shared = {"content": "Two tasks from one transcript."}
+        tasks = [
+            {"transcript_id": "test-id-2", "title": "First", "created_date": "2023-05-06", "transcript_details": shared},
+            {"transcript_id": "test-id-2", "title": "Second", "created_date": "2023-05-08", "transcript_details": shared},
+        ]
+
+        notion_data = transformer.transform({"tasks": tasks})
+
+        first, second = notion_data["tasks"]
+        assert first["transcript_details"]["created_at"] == "2023-05-06"
+        assert second["transcript_details"]["created_at"] == "2023-05-08"
+        assert shared == {"content": "Two tasks from one transcript."}